@@ -3,6 +3,7 @@ import os
 from config.database.session import Base, engine
 from app.pdf_down.router import pdf_down_router
 from samsam_danawa.adapter.danawa_router import router as danawa_router
+from samsam_danawa.application.danawa_service import start_danawa_drivers, stop_danawa_drivers
 from social_oauth.adapter.input.web.google_oauth2_router import authentication_router
 from config.env_loader import load_env
 from product_analysis.adapter.input.web.product_analysis_router import analysis_router
@@ -33,6 +34,20 @@ app.add_middleware(
     allow_headers=["*"],         # 모든 헤더 허용
 )
 
+
+@app.on_event("startup")
+async def startup_danawa_drivers():
+    # chromedriver 설치/확인은 여기서 한 번만 (요청마다 하지 않음), 실패해도 첫 리뷰 요청에서 다시 시도
+    try:
+        await start_danawa_drivers()
+    except Exception as e:
+        print(f"[WARNING] 다나와 WebDriver 풀 시작 실패: {e}")
+
+
+@app.on_event("shutdown")
+async def shutdown_danawa_drivers():
+    await stop_danawa_drivers()
+
 # Router 등록
 app.include_router(danawa_router, prefix="/market", tags=["Danawa"])
 app.include_router(authentication_router, prefix="/authentication")
@@ -4,14 +4,20 @@ from datetime import datetime, timedelta
 import product.infrastructure.orm.product_orm
 import review.infrastructure.orm.review_orm
 
+from celery.exceptions import Retry
+
 from celery_app import celery_app
 from config.database.session import get_db_session
+from config.scraper_config import AIMD_RETRY_COUNTDOWN_SECONDS, AIMD_MAX_THROTTLE_RETRIES, CRAWL_PREFLIGHT_ENABLED
 
 # Review 도메인 import
 from product.domain.entity.product import Product
 from review.application.usecase.fetch_review_usecase import FetchReviewsUseCase
 from review.infrastructure.repository.review_repository_impl import ReviewRepositoryImpl
+from review.infrastructure.repository.crawl_checkpoint_repository_impl import CrawlCheckpointRepositoryImpl
 from review.application.port.scraper_factory import get_scraper_adapter  # 팩토리 함수
+from review.infrastructure.external.crawl_controller import CrawlBlockedError, get_crawl_controller
+from review.infrastructure.external import memory_watchdog
 
 # Product Analysis 도메인 import
 from product_analysis.application.usecase.analyze_product_usecase import ProductAnalysisUsecase
@@ -23,12 +29,28 @@ from product.infrastructure.repository.product_repository_task_impl import Produ
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "YOUR_FALLBACK_KEY")
 
 
-@celery_app.task(bind=True, name="review.start_crawl")
-def start_review_crawl_task(self, platform: str, source_product_id: str):
-    """[순서 1] 리뷰를 크롤링하고 'Review' 테이블에 저장합니다."""
+# 크롤링 실패(오류/차단) 재시도 상한 - 슬롯 대기 재시도(AIMD_MAX_THROTTLE_RETRIES)와 따로 센다
+CRAWL_MAX_FAILURE_RETRIES = 3
+
+
+# 재시도 횟수는 kwargs 의 두 카운터로 직접 관리 (self.request.retries 는 두 경로가 공유하므로 상한 판단에 쓰지 않음)
+@celery_app.task(bind=True, name="review.start_crawl", max_retries=None)
+def start_review_crawl_task(self, platform: str, source_product_id: str,
+                            throttle_waits: int = 0, failure_retries: int = 0):
+    """
+    [순서 1] 리뷰를 크롤링하고 'Review' 테이블에 저장합니다.
+    throttle_waits: 동시 크롤링 슬롯을 기다리며 다시 예약된 횟수
+    failure_retries: 크롤링 실패로 재시도한 횟수
+    """
 
     session = get_db_session()
     product_repo = ProductRepositoryTaskImpl(session=session)
+    crawl_controller = get_crawl_controller()
+    controller_platform = str(platform).lower()
+    slot = None
+    # 크롤링 중 브라우저 최대 메모리 (스크래퍼의 메모리 감시가 기록 → 진행 상황/결과로 내보냄)
+    memory_report = memory_watchdog.MemoryReport()
+    memory_token = None
 
     try:
         # ===== 🔥 중복 실행 방지 🔥 =====
@@ -58,12 +80,57 @@ def start_review_crawl_task(self, platform: str, source_product_id: str):
                 "platform": platform
             }
 
-        print(f"[START] 크롤링 시작: {platform}/{source_product_id}")
+        known_review_count = product.review_count
         # ===== 중복 실행 방지 끝 =====
 
         _review_repo = ReviewRepositoryImpl(session=session)
         _scraper_adapter = get_scraper_adapter(platform)
 
+        review_uc = FetchReviewsUseCase(_scraper_adapter, _review_repo)
+        product = Product.create_for_crawl_request(platform=platform, product_id=source_product_id)
+
+        # 증분 크롤링 기준점 (저장된 최신 리뷰) → 이미 아는 페이지에 도달하면 순회 중단
+        watermark = _review_repo.get_crawl_watermark(platform, source_product_id)
+        if not watermark.is_empty:
+            print(f"[INFO] 증분 크롤링 기준: {watermark.newest_review_at} / 최근 {len(watermark.fingerprints)}건")
+
+        # 재시도라면 마지막으로 저장된 배치 이후부터 이어서 수집
+        checkpoint_repo = CrawlCheckpointRepositoryImpl()
+        resume_from = checkpoint_repo.load(platform, source_product_id)
+        if resume_from:
+            print(f"[INFO] 체크포인트에서 재개 (재시도 {failure_retries}회차): {resume_from}")
+
+        # 재개 중에는 증분 중단을 쓰지 않음 → 중단 전에 저장한 페이지 때문에 남은 페이지를 기존 리뷰로 오인하지 않고
+        # 목록 끝까지 수집한 뒤에만 완료(COLLECTED) 처리
+        stream_watermark = None if resume_from else watermark
+
+        # 사전 확인: HTTP 1회로 전체 리뷰 수/최신 리뷰 비교 → 변화가 없으면 브라우저 없이 다음 단계로
+        summary = None
+        if CRAWL_PREFLIGHT_ENABLED and not resume_from and not watermark.is_empty:
+            summary = review_uc.preflight(product)
+            if summary is not None and summary.is_unchanged(known_review_count, watermark):
+                product_repo.update_analysis_status(
+                    source=platform,
+                    source_product_id=source_product_id,
+                    status="COLLECTED"
+                )
+                session.commit()
+                print(f"[PREFLIGHT] 새 리뷰 없음 (전체 {summary.total_count}, 최신 {summary.newest_review_at}) → 크롤링 생략")
+                return {"source_product_id": source_product_id, "platform": platform}
+
+        # 플랫폼별 동시 크롤링 상한 (AIMD) → 슬롯이 없으면 상태를 바꾸지 않고 나중에 다시 시도
+        slot = crawl_controller.try_acquire_slot(controller_platform)
+        if slot is None:
+            if throttle_waits >= AIMD_MAX_THROTTLE_RETRIES:
+                print(f"[THROTTLE] {platform} 슬롯 대기 {throttle_waits}회 초과 → 크롤링 포기")
+                return {"error": "Crawl slot wait limit exceeded"}
+            print(f"[THROTTLE] {platform} 동시 크롤링 상한 도달 → {AIMD_RETRY_COUNTDOWN_SECONDS}초 후 재시도 "
+                  f"(대기 {throttle_waits + 1}/{AIMD_MAX_THROTTLE_RETRIES})")
+            raise self.retry(countdown=AIMD_RETRY_COUNTDOWN_SECONDS,
+                             kwargs=_retry_kwargs(self, throttle_waits=throttle_waits + 1))
+
+        print(f"[START] 크롤링 시작: {platform}/{source_product_id}")
+
         # 상태: CRAWLING (락 역할)
         product_repo.update_analysis_status(
             source=platform,
@@ -72,37 +139,73 @@ def start_review_crawl_task(self, platform: str, source_product_id: str):
         )
         session.commit()
 
-        review_uc = FetchReviewsUseCase(_scraper_adapter, _review_repo)
-        product = Product.create_for_crawl_request(platform=platform, product_id=source_product_id)
-
-        reviews = review_uc.execute(product)  # 크롤링 실행
-
-        if reviews:
-            print(f"[SAVE] {len(reviews)}개 리뷰 저장 시작")
+        # 페이지 단위 배치를 받는 즉시 저장/커밋 → 중간 실패 시에도 저장된 배치는 유지
+        saved_count = 0
+        memory_token = memory_watchdog.activate(memory_report)
+        for batch in review_uc.stream(product, watermark=stream_watermark, resume_from=resume_from):  # 크롤링 실행
+            if not batch.reviews:
+                continue
 
             # FetchReviewsUseCase 에서 진행되던거 옿김.
             _review_repo.save_all(
-                reviews,
+                batch.reviews,
                 source=platform,
                 source_product_id=source_product_id
             )
-
-            # 제품 상태 추가
+            # Task가 커밋 책임
+            session.commit()
+            # 커밋 이후에만 체크포인트 갱신 (저장되지 않은 배치를 건너뛰지 않도록)
+            if batch.cursor:
+                checkpoint_repo.save(platform, source_product_id, batch.cursor)
+            crawl_controller.touch_slot(controller_platform, slot)
+
+            saved_count += len(batch.reviews)
+            print(f"[SAVE] 배치 #{batch.page}: {len(batch.reviews)}개 저장 (누적 {saved_count}개)")
+
+            # 진행 상황 보고 (result backend 에서 조회 가능)
+            if self.request.id:
+                self.update_state(state="PROGRESS", meta={
+                    "platform": platform,
+                    "source_product_id": source_product_id,
+                    "page": batch.page,
+                    "saved": saved_count,
+                    "memory": memory_report.as_dict(),
+                })
+
+        # 끝까지 수집했으므로 체크포인트 삭제 (다음 크롤링은 처음부터)
+        # (재개한 크롤링은 증분 중단 없이 목록 끝까지 돌았을 때만 여기에 도달)
+        checkpoint_repo.clear(platform, source_product_id)
+        if memory_report.samples:
+            print(f"[MEMORY] {memory_report.summary()}")
+
+        if saved_count or not watermark.is_empty or resume_from:
+            # 제품 상태 추가 (증분 크롤링에서 새 리뷰가 없어도 기존 리뷰로 분석 가능)
             product_repo.update_analysis_status(
                 source=platform,
                 source_product_id=source_product_id,
                 status="COLLECTED"
             )
-            # Task가 커밋 책임
+            # 다음 사전 확인의 비교 기준 (플랫폼이 알려준 전체 리뷰 수)
+            # 사전 확인을 건너뛴 크롤링(첫 크롤링/재개)이나 전체 수를 못 받은 경우 수집을 마친 뒤 1회 확인
+            if CRAWL_PREFLIGHT_ENABLED and (summary is None or summary.total_count is None):
+                summary = _final_summary(review_uc, product)
+            if summary is not None and summary.total_count is not None:
+                product_repo.update_review_count(
+                    source=platform,
+                    source_product_id=source_product_id,
+                    review_count=summary.total_count
+                )
             session.commit()
 
-            print(f"[SUCCESS] 크롤링 완료: {len(reviews)}개 저장")
+            print(f"[SUCCESS] 크롤링 완료: {saved_count}개 저장")
         else:
             print(f"[WARNING] 수집된 리뷰 없음")
 
         # 다음 Task로 전달할 데이터 반환
-        return {"source_product_id": source_product_id, "platform": platform}
+        return {"source_product_id": source_product_id, "platform": platform, "memory": memory_report.as_dict()}
 
+    except Retry:
+        raise
     except Exception as e:
         print(f"[ERROR] 크롤링 실패: {e}")
         try:
@@ -116,12 +219,35 @@ def start_review_crawl_task(self, platform: str, source_product_id: str):
             pass
 
         session.rollback()
-        # 재시도 로직
-        raise self.retry(exc=e, countdown=30, max_retries=3)
+        # 재시도 로직 (차단 신호면 AIMD 감소가 반영되도록 더 늦게)
+        if failure_retries >= CRAWL_MAX_FAILURE_RETRIES:
+            raise
+        countdown = AIMD_RETRY_COUNTDOWN_SECONDS if isinstance(e, CrawlBlockedError) else 30
+        raise self.retry(exc=e, countdown=countdown,
+                         kwargs=_retry_kwargs(self, failure_retries=failure_retries + 1))
     finally:
+        if memory_token is not None:
+            memory_watchdog.deactivate(memory_token)
+        crawl_controller.release_slot(controller_platform, slot)
         session.close()
 
 
+def _final_summary(review_uc: FetchReviewsUseCase, product: Product):
+    """완료된 크롤링의 전체 리뷰 수 확인용 사전 확인 (실패해도 수집 결과에는 영향 없음)"""
+    try:
+        return review_uc.preflight(product)
+    except Exception as e:
+        print(f"[WARNING] 전체 리뷰 수 확인 실패: {e}")
+        return None
+
+
+def _retry_kwargs(task, **counters) -> dict:
+    """현재 호출의 kwargs 에 재시도 카운터만 바꿔 끼운 dict (위치 인자로 받은 값은 self.retry 가 그대로 넘김)"""
+    kwargs = dict(task.request.kwargs or {})
+    kwargs.update(counters)
+    return kwargs
+
+
 @celery_app.task(bind=True, name="analysis.start")
 def start_review_analysis_task(self, previous_result: dict):
     """[순서 2] 크롤링된 리뷰를 분석하고 'Review Analysis' 테이블에 저장합니다."""
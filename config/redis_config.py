@@ -23,3 +23,20 @@ def get_redis() -> redis.Redis:
             decode_responses=True
         )
     return _redis_instance
+
+
+# asyncio 용 Redis (FastAPI 이벤트 루프에서 사용, 앱 프로세스당 하나)
+_async_redis_instance = None
+
+def get_async_redis():
+    global _async_redis_instance
+    if _async_redis_instance is None:
+        import redis.asyncio as aioredis
+        _async_redis_instance = aioredis.Redis(
+            host=REDIS_HOST,
+            port=REDIS_PORT,
+            db=REDIS_DB,
+            password=REDIS_PASSWORD,
+            decode_responses=True
+        )
+    return _async_redis_instance
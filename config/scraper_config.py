@@ -0,0 +1,169 @@
+import os
+import tempfile
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_list(name: str, default: str) -> list:
+    return [v.strip().lower() for v in os.getenv(name, default).split(",") if v.strip()]
+
+
+# 브라우저 공통
+HEADLESS = _env_bool("SCRAPER_HEADLESS", True)
+
+# 크롤러가 디스크에 쓰는 데이터(세션 쿠키, 캐시 등)의 기본 위치 - 저장소 밖 (항목별 *_DIR 로 개별 지정 가능)
+SCRAPER_DATA_DIR = os.getenv("SCRAPER_DATA_DIR", os.path.join(tempfile.gettempdir(), "review_scraper"))
+
+# 브라우저 풀 (워커 프로세스 단위)
+BROWSER_POOL_MAX_CONTEXTS = _env_int("BROWSER_POOL_MAX_CONTEXTS", 50)   # N개 컨텍스트 발급 후 브라우저 재시작
+BROWSER_POOL_MAX_RSS_MB = _env_int("BROWSER_POOL_MAX_RSS_MB", 1500)     # 브라우저 프로세스 트리 RSS 상한 (0 = 비활성)
+
+# 비동기 스크래핑 엔진 (워커 프로세스 하나에서 여러 상품 동시 크롤링)
+# 사용 시 Celery 워커를 스레드 풀로 실행 (예: celery -A celery_app worker -P threads -c 4)
+SCRAPE_ENGINE_ENABLED = _env_bool("SCRAPE_ENGINE_ENABLED", False)
+SCRAPE_ENGINE_MAX_CONTEXTS = _env_int("SCRAPE_ENGINE_MAX_CONTEXTS", 4)  # 프로세스 전체 동시 BrowserContext 상한 (K)
+SCRAPE_ENGINE_PLATFORM_LIMITS = {                                       # 플랫폼별 동시 크롤링 상한
+    "elevenst": _env_int("SCRAPE_ENGINE_ELEVENST_CONCURRENCY", 3),
+    "lotteon": _env_int("SCRAPE_ENGINE_LOTTEON_CONCURRENCY", 2),
+}
+
+# 브라우저 웜 스타트 (플랫폼별 쿠키/localStorage 재사용 + 사이트 JS/CSS 번들 디스크 캐시, 워커 간 공유)
+BROWSER_CACHE_DIR = os.getenv("SCRAPER_BROWSER_CACHE_DIR", os.path.join(SCRAPER_DATA_DIR, "browser_cache"))
+STORAGE_STATE_ENABLED = _env_bool("SCRAPER_STORAGE_STATE_ENABLED", True)
+STORAGE_STATE_REFRESH_SECONDS = _env_int("SCRAPER_STORAGE_STATE_REFRESH_SECONDS", 60 * 60)      # 이보다 오래되면 다시 저장
+STORAGE_STATE_MAX_AGE_SECONDS = _env_int("SCRAPER_STORAGE_STATE_MAX_AGE_SECONDS", 24 * 60 * 60)  # 이보다 오래되면 빈 프로필
+ASSET_CACHE_ENABLED = _env_bool("SCRAPER_ASSET_CACHE_ENABLED", True)
+ASSET_CACHE_TYPES = _env_list("SCRAPER_ASSET_CACHE_TYPES", "script,stylesheet")
+ASSET_CACHE_TTL_SECONDS = _env_int("SCRAPER_ASSET_CACHE_TTL_SECONDS", 24 * 60 * 60)
+ASSET_CACHE_MAX_ENTRY_KB = _env_int("SCRAPER_ASSET_CACHE_MAX_ENTRY_KB", 5 * 1024)
+
+# 이벤트 기반 대기
+WAIT_TIMEOUT_MS = _env_int("SCRAPER_WAIT_TIMEOUT_MS", 10000)                    # 신호 대기 상한
+
+# 분산 요청 속도 제한 (Redis 토큰 버킷, 모든 워커의 페이지 로드/API 호출 합산)
+RATE_LIMIT_ENABLED = _env_bool("SCRAPER_RATE_LIMIT_ENABLED", True)
+RATE_LIMIT_MAX_WAIT_SECONDS = float(os.getenv("SCRAPER_RATE_LIMIT_MAX_WAIT_SECONDS", "30"))  # 초과 시 경고 (토큰 없이 진행하지 않음)
+RATE_LIMITS = {                                                                 # 플랫폼별 (초당 요청 수, 버스트)
+    "elevenst": (float(os.getenv("SCRAPER_RATE_ELEVENST", "2")), _env_int("SCRAPER_BURST_ELEVENST", 4)),
+    "lotteon": (float(os.getenv("SCRAPER_RATE_LOTTEON", "2")), _env_int("SCRAPER_BURST_LOTTEON", 4)),
+}
+
+# 적응형 크롤링 동시성 제어 (AIMD, 플랫폼별 - 정상 응답이면 조금씩 늘리고, 차단/타임아웃/지연이면 절반으로)
+AIMD_ENABLED = _env_bool("CRAWL_AIMD_ENABLED", True)
+AIMD_INITIAL_CONCURRENCY = _env_int("CRAWL_AIMD_INITIAL_CONCURRENCY", 4)     # 플랫폼별 동시 크롤링 수 초기값
+AIMD_MIN_CONCURRENCY = _env_int("CRAWL_AIMD_MIN_CONCURRENCY", 1)
+AIMD_MAX_CONCURRENCY = _env_int("CRAWL_AIMD_MAX_CONCURRENCY", 16)
+AIMD_CONCURRENCY_STEP = float(os.getenv("CRAWL_AIMD_CONCURRENCY_STEP", "0.1"))  # 정상 응답 1건당 증가량
+AIMD_MIN_RATE = float(os.getenv("CRAWL_AIMD_MIN_RATE", "0.2"))                  # req/s
+AIMD_MAX_RATE = float(os.getenv("CRAWL_AIMD_MAX_RATE", "10"))                   # req/s
+AIMD_RATE_STEP = float(os.getenv("CRAWL_AIMD_RATE_STEP", "0.02"))               # 정상 응답 1건당 req/s 증가량
+AIMD_DECREASE_FACTOR = float(os.getenv("CRAWL_AIMD_DECREASE_FACTOR", "0.5"))
+AIMD_COOLDOWN_SECONDS = _env_int("CRAWL_AIMD_COOLDOWN_SECONDS", 30)             # 감소 후 다음 감소까지 최소 간격
+AIMD_LATENCY_TARGET_SECONDS = float(os.getenv("CRAWL_AIMD_LATENCY_TARGET_SECONDS", "8"))  # 초과 시 혼잡으로 판단
+AIMD_SLOT_LEASE_SECONDS = _env_int("CRAWL_AIMD_SLOT_LEASE_SECONDS", 30 * 60)   # 워커가 죽어도 슬롯이 풀리도록
+AIMD_RETRY_COUNTDOWN_SECONDS = _env_int("CRAWL_AIMD_RETRY_COUNTDOWN_SECONDS", 60)  # 슬롯이 없거나 차단 시 재시도 간격
+AIMD_MAX_THROTTLE_RETRIES = _env_int("CRAWL_AIMD_MAX_THROTTLE_RETRIES", 20)
+
+# 사전 확인 (전체 크롤링 전에 HTTP 1회로 리뷰 수/최신 리뷰 비교 → 변화 없으면 크롤링 생략)
+CRAWL_PREFLIGHT_ENABLED = _env_bool("CRAWL_PREFLIGHT_ENABLED", True)
+
+# 메모리 감시 (크롤링 중 브라우저 RSS / JS 힙 측정 → 상한 초과 시 체크포인트에서 페이지/컨텍스트를 새로 열어 이어서 수집)
+MEMORY_WATCHDOG_ENABLED = _env_bool("CRAWL_MEMORY_WATCHDOG_ENABLED", True)
+MEMORY_WATCHDOG_MAX_RSS_MB = _env_int("CRAWL_MEMORY_MAX_RSS_MB", 1200)       # 브라우저 프로세스 트리 RSS 상한 (0 = 비활성)
+MEMORY_WATCHDOG_MAX_HEAP_MB = _env_int("CRAWL_MEMORY_MAX_HEAP_MB", 300)      # 페이지 JS 힙 상한 (0 = 비활성)
+MEMORY_WATCHDOG_INTERVAL_SECONDS = float(os.getenv("CRAWL_MEMORY_SAMPLE_INTERVAL_SECONDS", "2"))
+MEMORY_WATCHDOG_MAX_RECYCLES = _env_int("CRAWL_MEMORY_MAX_RECYCLES", 3)      # 크롤링 1회당 재시작 상한 (더보기 재실행으로 다시 커지는 경우)
+
+# 크롤링 체크포인트 (Celery 재시도 시 이어서 수집)
+CRAWL_CHECKPOINT_TTL_SECONDS = _env_int("CRAWL_CHECKPOINT_TTL_SECONDS", 6 * 60 * 60)
+
+# 셀렉터 캐시 (플랫폼/레이아웃별로 성공한 셀렉터를 먼저 시도)
+SELECTOR_CACHE_ENABLED = _env_bool("SELECTOR_CACHE_ENABLED", True)
+SELECTOR_CACHE_TTL_SECONDS = _env_int("SELECTOR_CACHE_TTL_SECONDS", 7 * 24 * 60 * 60)
+
+# 오프라인 fixture (record = 크롤링 중 HAR/HTML 저장, replay = 저장된 HAR로 네트워크 없이 재생, off)
+SCRAPER_FIXTURE_MODE = os.getenv("SCRAPER_FIXTURE_MODE", "off").strip().lower()
+# HAR 에는 요청 헤더/쿠키가 그대로 들어가므로 저장소 밖에 기록
+SCRAPER_FIXTURE_DIR = os.getenv("SCRAPER_FIXTURE_DIR", os.path.join(SCRAPER_DATA_DIR, "fixtures"))
+
+# 원본 스냅샷 보관 (리뷰 영역 HTML/응답 본문을 페이지 단위로 압축 저장 → review.maintenance.reparse_snapshots 로 재파싱)
+SNAPSHOT_ARCHIVE_ENABLED = _env_bool("SCRAPER_SNAPSHOT_ARCHIVE_ENABLED", False)
+# 재파싱에 계속 쓸 보관소 → 임시 디렉터리 기본값 없이 영구 볼륨 경로를 직접 지정해야 함
+SNAPSHOT_ARCHIVE_DIR = os.getenv("SCRAPER_SNAPSHOT_ARCHIVE_DIR", "").strip()
+if SNAPSHOT_ARCHIVE_ENABLED and not SNAPSHOT_ARCHIVE_DIR:
+    print("[WARNING] SCRAPER_SNAPSHOT_ARCHIVE_DIR 미지정 → 스냅샷 보관 비활성화 (영구 볼륨 경로를 지정하세요)")
+    SNAPSHOT_ARCHIVE_ENABLED = False
+SNAPSHOT_ARCHIVE_CODEC = os.getenv("SCRAPER_SNAPSHOT_ARCHIVE_CODEC", "zstd").strip().lower()  # zstd | gzip
+SNAPSHOT_ARCHIVE_LEVEL = _env_int("SCRAPER_SNAPSHOT_ARCHIVE_LEVEL", 3)
+
+# 파싱 파이프라인 (롯데온 DOM 수집: 워커가 페이지 N 의 HTML 을 파싱하는 동안 브라우저는 N+1 로 이동)
+PARSE_PIPELINE_ENABLED = _env_bool("SCRAPER_PARSE_PIPELINE_ENABLED", True)
+PARSE_PIPELINE_EXECUTOR = os.getenv("SCRAPER_PARSE_PIPELINE_EXECUTOR", "thread").strip().lower()  # thread | process
+PARSE_PIPELINE_WORKERS = _env_int("SCRAPER_PARSE_PIPELINE_WORKERS", 2)  # 프로세스 전체 파싱 워커 수
+PARSE_PIPELINE_DEPTH = _env_int("SCRAPER_PARSE_PIPELINE_DEPTH", 2)      # 상품당 파싱 대기 페이지 상한 (초과 시 브라우저 대기)
+
+# HTML 파서 백엔드 (auto = selectolax → lxml → bs4 중 설치된 것)
+HTML_PARSER_BACKEND = os.getenv("SCRAPER_HTML_PARSER", "auto").strip().lower()
+
+# 11번가
+# http 는 추정한 리뷰 목록 엔드포인트(ELEVENST_REVIEW_LIST_URL)를 직접 호출 → 엔드포인트 확인 전까지 기본은 브라우저
+ELEVENST_CRAWL_MODE = os.getenv("ELEVENST_CRAWL_MODE", "network")  # http | network | dom
+ELEVENST_REVIEW_RESPONSE_PATTERN = os.getenv("ELEVENST_REVIEW_RESPONSE_PATTERN", "getProductReview")  # 리뷰 목록 응답 URL 조각
+ELEVENST_REVIEW_LIST_URL = os.getenv(
+    "ELEVENST_REVIEW_LIST_URL",
+    "https://www.11st.co.kr/product/SellerProductDetail.tmall"
+    "?method=getProductReviewList&prdNo={product_code}&page={page}&pageTypCd=first"
+    "&reviewDispYn=Y&isPreview=false&reviewOptDispYn=Y&pageSize={page_size}",
+)
+ELEVENST_HTTP_PAGE_SIZE = _env_int("ELEVENST_HTTP_PAGE_SIZE", 20)
+ELEVENST_HTTP_MAX_PAGES = _env_int("ELEVENST_HTTP_MAX_PAGES", 500)
+
+# HTTP 클라이언트 (keep-alive 풀)
+HTTP_TIMEOUT_SECONDS = float(os.getenv("SCRAPER_HTTP_TIMEOUT_SECONDS", "10"))
+HTTP_MAX_CONNECTIONS = _env_int("SCRAPER_HTTP_MAX_CONNECTIONS", 20)
+HTTP_USER_AGENT = os.getenv(
+    "SCRAPER_HTTP_USER_AGENT",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+)
+
+# 롯데온
+LOTTEON_REVIEW_API_PATTERN = os.getenv("LOTTEON_REVIEW_API_PATTERN", "review")  # 리뷰 목록 API URL 조각
+LOTTEON_API_CONCURRENCY = _env_int("LOTTEON_API_CONCURRENCY", 4)                # 도메인별 동시 요청 상한
+LOTTEON_API_MAX_PAGES = _env_int("LOTTEON_API_MAX_PAGES", 200)
+LOTTEON_API_TEMPLATE_TTL_SECONDS = _env_int("LOTTEON_API_TEMPLATE_TTL_SECONDS", 7 * 24 * 60 * 60)  # 캡처한 API 요청 보관
+
+# 다나와 (Selenium WebDriver 풀 - API 프로세스 단위, chromedriver 는 앱 시작 시 한 번만 확인)
+DANAWA_CHROMEDRIVER_PATH = os.getenv("DANAWA_CHROMEDRIVER_PATH", "")       # 비우면 webdriver_manager 로 설치/확인
+DANAWA_DRIVER_POOL_SIZE = _env_int("DANAWA_DRIVER_POOL_SIZE", 2)           # 동시에 띄우는 브라우저 상한
+DANAWA_DRIVER_PREWARM = _env_int("DANAWA_DRIVER_PREWARM", 1)               # 앱 시작 시 미리 띄울 드라이버 수
+DANAWA_DRIVER_MAX_USES = _env_int("DANAWA_DRIVER_MAX_USES", 50)            # N회 사용 후 재시작 (0 = 무제한)
+DANAWA_DRIVER_ACQUIRE_TIMEOUT_SECONDS = float(os.getenv("DANAWA_DRIVER_ACQUIRE_TIMEOUT_SECONDS", "60"))
+# 다나와 상품 검색 (httpx.AsyncClient + Redis 캐시, stale-while-revalidate)
+DANAWA_SEARCH_URL = os.getenv("DANAWA_SEARCH_URL", "https://search.danawa.com/dsearch.php")
+DANAWA_SEARCH_PAGE_PARAM = os.getenv("DANAWA_SEARCH_PAGE_PARAM", "page")   # 2페이지부터 붙는 페이지 파라미터
+DANAWA_SEARCH_MAX_PAGES = _env_int("DANAWA_SEARCH_MAX_PAGES", 5)            # /market/search?pages= 상한
+DANAWA_SEARCH_CACHE_ENABLED = _env_bool("DANAWA_SEARCH_CACHE_ENABLED", True)
+DANAWA_SEARCH_CACHE_TTL_SECONDS = _env_int("DANAWA_SEARCH_CACHE_TTL_SECONDS", 10 * 60)           # 이 안이면 그대로 사용
+DANAWA_SEARCH_CACHE_STALE_SECONDS = _env_int("DANAWA_SEARCH_CACHE_STALE_SECONDS", 24 * 60 * 60)  # 이후 이 기간은 반환 + 백그라운드 갱신
+
+# 요청 필터 (리소스 차단)
+REQUEST_FILTER_ENABLED = _env_bool("SCRAPER_REQUEST_FILTER_ENABLED", True)
+BLOCKED_RESOURCE_TYPES = _env_list("SCRAPER_BLOCKED_RESOURCE_TYPES", "image,media,font")
+BLOCKED_DOMAINS = _env_list(
+    "SCRAPER_BLOCKED_DOMAINS",
+    "doubleclick.net,google-analytics.com,googletagmanager.com,googlesyndication.com,"
+    "googleadservices.com,facebook.net,criteo.net,criteo.com,adnxs.com,scorecardresearch.com",
+)
@@ -71,3 +71,22 @@ class ProductRepositoryTaskImpl:
         )
         self.db.execute(stmt)
         # 커밋은 태스크에서!
+
+    def update_review_count(
+        self,
+        source: Platform | str,
+        source_product_id: str,
+        review_count: int,
+    ) -> None:
+        """플랫폼이 알려준 전체 리뷰 수 기록 (다음 크롤링의 사전 확인 기준)"""
+        source_value = _to_enum_value(source, Platform)
+        stmt = (
+            sa_update(ProductORM)
+            .where(
+                ProductORM.source == source_value,
+                ProductORM.source_product_id == source_product_id,
+            )
+            .values(review_count=review_count)
+        )
+        self.db.execute(stmt)
+        # 커밋은 태스크에서!
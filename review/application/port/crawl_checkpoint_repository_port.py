@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from review.domain.entity.crawl_cursor import CrawlCursor
+
+
+class CrawlCheckpointRepositoryPort(ABC):
+    """상품별 크롤링 재개 지점 저장소"""
+
+    @abstractmethod
+    def load(self, source: str, source_product_id: str) -> Optional[CrawlCursor]: ...
+
+    @abstractmethod
+    def save(self, source: str, source_product_id: str, cursor: CrawlCursor) -> None: ...
+
+    @abstractmethod
+    def clear(self, source: str, source_product_id: str) -> None: ...
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List
 from review.domain.entity.review import Review
+from review.domain.entity.crawl_watermark import CrawlWatermark
 
 class ReviewRepositoryPort(ABC):
     @abstractmethod
@@ -8,6 +9,11 @@ class ReviewRepositoryPort(ABC):
     @abstractmethod
     def find_by_product_id(self, product_id: str, platform: str) -> List[Review]: ...
 
+    @abstractmethod
+    def get_crawl_watermark(self, source: str, source_product_id: str, recent_limit: int = 200) -> CrawlWatermark:
+        """증분 크롤링 기준점 (최신 review_at + 최근 리뷰 fingerprint 집합)"""
+        ...
+
     @abstractmethod
     def delete_by_product(self, source: str, product_id: str) -> int:
         """해당 상품의 리뷰 삭제, 삭제건수 반환"""
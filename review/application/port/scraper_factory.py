@@ -1,5 +1,7 @@
+from config.scraper_config import ELEVENST_CRAWL_MODE, SCRAPE_ENGINE_ENABLED
 from review.application.port.scraper_port import ScraperPort
 from review.infrastructure.external.elevenSt_scraper import ElevenStScraperAdapter
+from review.infrastructure.external.elevenSt_http_scraper import ElevenStHttpScraperAdapter
 from review.infrastructure.external.lotteon_scraper import LotteonScraper
 from review.domain.entity.review import ReviewPlatform
 
@@ -14,8 +16,20 @@ def get_scraper_adapter(platform: str) -> ScraperPort:
     platform_lower = platform_str.lower()
 
     if platform_lower == "elevenst":
-        return ElevenStScraperAdapter()
+        # http: 브라우저 없는 직접 호출 (실패 시 Playwright 폴백) / network, dom: Playwright
+        # SCRAPE_ENGINE_ENABLED: Playwright 경로(network)를 프로세스 공용 async 엔진에서 실행
+        if SCRAPE_ENGINE_ENABLED and ELEVENST_CRAWL_MODE != "dom":
+            from review.infrastructure.external.elevenSt_async_scraper import ElevenStAsyncScraperAdapter
+            if ELEVENST_CRAWL_MODE == "http":
+                return ElevenStHttpScraperAdapter(fallback=ElevenStAsyncScraperAdapter())
+            return ElevenStAsyncScraperAdapter()
+        if ELEVENST_CRAWL_MODE == "http":
+            return ElevenStHttpScraperAdapter()
+        return ElevenStScraperAdapter(mode=ELEVENST_CRAWL_MODE)
     elif platform_lower == "lotteon":
+        if SCRAPE_ENGINE_ENABLED:
+            from review.infrastructure.external.lotteon_async_scraper import LotteonAsyncScraper
+            return LotteonAsyncScraper()
         return LotteonScraper()
     else:
-        raise ValueError(f"지원하지 않는 플랫폼: {platform}")
\ No newline at end of file
+        raise ValueError(f"지원하지 않는 플랫폼: {platform}")
@@ -1,10 +1,44 @@
 from abc import ABC, abstractmethod
-from typing import List
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
 
 from product.domain.entity.product import Product
 from review.domain.entity.review import Review
+from review.domain.entity.crawl_watermark import CrawlWatermark
+from review.domain.entity.crawl_cursor import CrawlCursor
+from review.domain.entity.review_summary import ReviewSummary
+
+
+@dataclass
+class ReviewBatch:
+    """크롤링 한 단위(페이지 / 더보기 1회 / API 1페이지)로 수집된 리뷰 묶음"""
+    page: int
+    reviews: List[Review] = field(default_factory=list)
+    cursor: Optional[CrawlCursor] = None   # 이 배치까지 수집한 뒤의 재개 지점
 
 
 class ScraperPort(ABC):
     @abstractmethod
-    def fetch_reviews(self, product: Product) -> List[Review]: ...
\ No newline at end of file
+    def iter_review_batches(self, product: Product, watermark: Optional[CrawlWatermark] = None,
+                            resume_from: Optional[CrawlCursor] = None) -> Iterator[ReviewBatch]:
+        """
+        페이지 단위로 리뷰 배치를 수집되는 즉시 yield 한다.
+        watermark 가 주어지면 한 페이지 전체가 이미 알려진 리뷰일 때 순회를 멈춘다.
+        resume_from 이 주어지면 같은 수집 경로일 때 해당 지점 이후부터 수집한다.
+        소비자가 순회를 중단하면(generator close) 브라우저 컨텍스트 등 자원도 함께 정리된다.
+        """
+        ...
+
+    def preflight(self, product: Product) -> Optional[ReviewSummary]:
+        """
+        전체 크롤링 전에 리뷰 현황(전체 수 / 최신 리뷰)을 가볍게 조회한다.
+        지원하지 않거나 확인에 실패하면 None → 호출 측은 그대로 전체 크롤링을 진행한다.
+        """
+        return None
+
+    def fetch_reviews(self, product: Product, watermark: Optional[CrawlWatermark] = None) -> List[Review]:
+        """iter_review_batches 를 끝까지 소비해 한 리스트로 반환"""
+        reviews: List[Review] = []
+        for batch in self.iter_review_batches(product, watermark=watermark):
+            reviews.extend(batch.reviews)
+        return reviews
@@ -1,9 +1,12 @@
-from typing import List
+from typing import Iterator, List, Optional
 
 from product.domain.entity.product import Product, Platform
-from review.application.port.scraper_port import ScraperPort
+from review.application.port.scraper_port import ScraperPort, ReviewBatch
 from review.application.port.review_repository_port import ReviewRepositoryPort
 from review.domain.entity.review import Review
+from review.domain.entity.crawl_watermark import CrawlWatermark
+from review.domain.entity.crawl_cursor import CrawlCursor
+from review.domain.entity.review_summary import ReviewSummary
 
 
 class FetchReviewsUseCase:
@@ -12,9 +15,9 @@ class FetchReviewsUseCase:
         self.scraper = scraper
         self.repository = repository
 
-    def execute(self, product: Product) -> List[Review]:
+    def execute(self, product: Product, watermark: Optional[CrawlWatermark] = None) -> List[Review]:
 
-        reviews = self.scraper.fetch_reviews(product)
+        reviews = self.scraper.fetch_reviews(product, watermark=watermark)
 
         if isinstance(product.source, Platform):
             source_value = product.source.value
@@ -27,4 +30,13 @@ class FetchReviewsUseCase:
         #     source=source_value,
         #     source_product_id=product.source_product_id
         # )
-        return reviews
\ No newline at end of file
+        return reviews
+
+    def preflight(self, product: Product) -> Optional[ReviewSummary]:
+        """전체 크롤링 전 리뷰 현황 확인 (미지원/실패 시 None)"""
+        return self.scraper.preflight(product)
+
+    def stream(self, product: Product, watermark: Optional[CrawlWatermark] = None,
+               resume_from: Optional[CrawlCursor] = None) -> Iterator[ReviewBatch]:
+        """페이지 단위 배치를 그대로 흘려보낸다. (저장/커밋/체크포인트는 task 에서 배치마다 진행)"""
+        return self.scraper.iter_review_batches(product, watermark=watermark, resume_from=resume_from)
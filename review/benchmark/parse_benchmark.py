@@ -0,0 +1,130 @@
+"""
+Parse Benchmark
+저장된 리뷰 페이지(fixture)로 HTML 파서 백엔드별 추출 속도(items/sec)를 측정
+
+사용법:
+    python -m review.benchmark.parse_benchmark [fixture_dir] [--repeat N] [--backend selectolax,lxml,bs4]
+
+- fixture 파일명 접두사로 플랫폼 구분: 11st_*.html / elevenst_*.html / lotteon_*.html
+- fixture 가 없으면 실제 셀렉터 구조를 흉내 낸 합성 페이지로 측정
+"""
+import os
+import sys
+import time
+import argparse
+from typing import Callable, Dict, List, Tuple
+
+from config.scraper_config import SCRAPER_FIXTURE_DIR
+from review.infrastructure.external.html_backend import available_backends, get_html_backend
+from review.infrastructure.external.review_extractor import extract_11st_items, extract_lotteon_items
+
+DEFAULT_FIXTURE_DIR = SCRAPER_FIXTURE_DIR   # scraper_benchmark record 가 HTML 스냅샷을 저장하는 위치
+
+EXTRACTORS: Dict[str, Callable] = {
+    "11st": extract_11st_items,
+    "lotteon": extract_lotteon_items,
+}
+
+
+def _platform_of(filename: str) -> str:
+    name = filename.lower()
+    if name.startswith(("11st", "elevenst")):
+        return "11st"
+    if name.startswith("lotteon"):
+        return "lotteon"
+    return ""
+
+
+def _synthetic_11st_page(count: int) -> str:
+    items = "".join(
+        f'<li class="review_list_element"><dl class="c_product_reviewer"><dt class="name" data-nick="user{i}">user{i}</dt></dl>'
+        f'<p class="grade"><em>{i % 5 + 1}점</em></p><dl class="option_set"><dt>옵션</dt><dd>색상: 블랙</dd></dl>'
+        f'<p class="side"><span class="date">2024.01.{i % 28 + 1:02d}</span></p>'
+        f'<p class="cont_review_hide">배송이 빠르고 품질이 좋아요. 재구매 의사 있습니다. #{i}</p></li>'
+        for i in range(count)
+    )
+    return f'<html><body><div class="header">{"<a>메뉴</a>" * 200}</div>' \
+           f'<div id="review-list-page-area"><ul>{items}</ul></div></body></html>'
+
+
+def _synthetic_lotteon_page(count: int) -> str:
+    items = "".join(
+        f'<div class="reviewItem" data-review-number="{i}"><span class="userName">user{i}</span>'
+        f'<span class="rating">평점 {i % 5 + 1}</span><span class="date">2024.01.{i % 28 + 1:02d}</span>'
+        f'<div class="option">색상: 블랙</div><div class="reviewContent">생각보다 튼튼하고 마감이 깔끔합니다. #{i}</div></div>'
+        for i in range(count)
+    )
+    return f'<html><body><div class="gnb">{"<a>메뉴</a>" * 500}</div>' \
+           f'<div class="productReviewWrap">{items}</div></body></html>'
+
+
+def load_fixtures(fixture_dir: str) -> List[Tuple[str, str, str]]:
+    """(이름, 플랫폼, html) 목록"""
+    fixtures = []
+    if os.path.isdir(fixture_dir):
+        for filename in sorted(os.listdir(fixture_dir)):
+            platform = _platform_of(filename)
+            if not platform or not filename.endswith(".html"):
+                continue
+            with open(os.path.join(fixture_dir, filename), encoding="utf-8") as f:
+                fixtures.append((filename, platform, f.read()))
+
+    if not fixtures:
+        print(f"[BENCH] {fixture_dir} 에 fixture 가 없어 합성 페이지로 측정합니다.")
+        fixtures = [
+            ("synthetic_11st_200", "11st", _synthetic_11st_page(200)),
+            ("synthetic_lotteon_200", "lotteon", _synthetic_lotteon_page(200)),
+        ]
+    return fixtures
+
+
+def run(fixture_dir: str, repeat: int, backends: List[str]) -> List[Dict]:
+    results = []
+    for name, platform, html in load_fixtures(fixture_dir):
+        extract = EXTRACTORS[platform]
+        for backend_name in backends:
+            backend = get_html_backend(backend_name)
+            item_count = len(extract(html, backend))  # 워밍업 + 아이템 수 확인
+
+            started = time.perf_counter()
+            for _ in range(repeat):
+                extract(html, backend)
+            elapsed = time.perf_counter() - started
+
+            results.append({
+                "fixture": name,
+                "backend": backend_name,
+                "items": item_count,
+                "ms_per_page": elapsed / repeat * 1000,
+                "items_per_sec": item_count * repeat / elapsed if elapsed else 0.0,
+                "kb": len(html.encode("utf-8")) / 1024,
+            })
+    return results
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="리뷰 HTML 파서 백엔드 벤치마크")
+    parser.add_argument("fixture_dir", nargs="?", default=DEFAULT_FIXTURE_DIR)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--backend", default="", help="쉼표 구분 (기본: 설치된 전체)")
+    args = parser.parse_args(argv)
+
+    installed = available_backends()
+    backends = [b for b in args.backend.split(",") if b] or installed
+    missing = [b for b in backends if b not in installed]
+    if missing:
+        print(f"[BENCH] 미설치 백엔드 제외: {missing}")
+        backends = [b for b in backends if b in installed]
+    if not backends:
+        print("[BENCH] 사용 가능한 HTML 파서가 없습니다.")
+        return 1
+
+    print(f"{'fixture':<32} {'backend':<11} {'KB':>8} {'items':>6} {'ms/page':>9} {'items/sec':>11}")
+    for row in run(args.fixture_dir, args.repeat, backends):
+        print(f"{row['fixture'][:32]:<32} {row['backend']:<11} {row['kb']:>8.0f} {row['items']:>6} "
+              f"{row['ms_per_page']:>9.2f} {row['items_per_sec']:>11.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+Scraper Benchmark
+저장된 HAR fixture 로 네트워크 없이 스크래퍼 어댑터를 실행해 단계별 소요 시간을 측정
+
+사용법:
+    # 라이브 사이트에서 fixture 기록 (HAR + 리뷰 영역 HTML 스냅샷)
+    python -m review.benchmark.scraper_benchmark record elevenst 1234567890 [--fixtures DIR]
+
+    # fixture 재생 벤치마크
+    python -m review.benchmark.scraper_benchmark run [--fixtures DIR] [--repeat N] [--adapter elevenst-dom,lotteon]
+
+- 단계: navigation(페이지/HTTP 로드), waits(이벤트 대기), delay(요청 속도 제한 대기), extraction(필드 추출),
+        entities(Review 엔티티 변환), other(클릭/스크롤 등 나머지)
+- 측정은 동기 어댑터 기준 (async 엔진 경로는 같은 파싱/추출 코드를 사용)
+"""
+import os
+import re
+import sys
+import time
+import argparse
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+from config.scraper_config import SCRAPER_FIXTURE_DIR
+from product.domain.entity.product import Product
+from review.application.port.scraper_port import ScraperPort
+from review.infrastructure.external import fixture_replay
+from review.infrastructure.external.phase_timer import PhaseTimer, activate, deactivate
+from review.infrastructure.external import memory_watchdog
+from review.infrastructure.external.elevenSt_scraper import ElevenStScraperAdapter
+from review.infrastructure.external.elevenSt_http_scraper import ElevenStHttpScraperAdapter
+from review.infrastructure.external.lotteon_scraper import LotteonScraper
+
+PHASES = ("navigation", "waits", "delay", "extraction", "entities")
+
+ADAPTERS: Dict[str, Tuple[str, Callable[[], ScraperPort]]] = {
+    "elevenst-http": ("elevenst", lambda: ElevenStHttpScraperAdapter(fallback=ElevenStScraperAdapter(mode="network"))),
+    "elevenst-network": ("elevenst", lambda: ElevenStScraperAdapter(mode="network")),
+    "elevenst-dom": ("elevenst", lambda: ElevenStScraperAdapter(mode="dom")),
+    "lotteon": ("lotteon", LotteonScraper),
+}
+
+# 기록 시 실행할 어댑터 (브라우저 HAR 은 상품당 하나이므로 브라우저 어댑터는 하나만)
+RECORD_ADAPTERS = {
+    "elevenst": ["elevenst-http", "elevenst-network"],
+    "lotteon": ["lotteon"],
+}
+
+_FIXTURE_FILE = re.compile(r'^(elevenst|lotteon)_(.+)\.har$')
+
+
+def _product(platform: str, product_code: str) -> Product:
+    return Product(
+        source=platform,
+        source_product_id=product_code,
+        title="benchmark",
+        source_url="",
+        seller_id=0,
+        price=None,
+        status="ACTIVE",
+        registered_at=datetime.utcnow(),
+        category="ETC",
+        analysis_status="PENDING",
+    )
+
+
+def discover_fixtures(fixture_dir: str) -> List[Tuple[str, str]]:
+    """(platform, product_code) 목록 ({platform}_http.har 는 httpx 응답 모음이라 제외)"""
+    fixtures = []
+    for filename in sorted(os.listdir(fixture_dir)) if os.path.isdir(fixture_dir) else []:
+        match = _FIXTURE_FILE.match(filename)
+        if match and match.group(2) != "http":
+            fixtures.append((match.group(1), match.group(2)))
+    return fixtures
+
+
+def run_once(adapter_name: str, platform: str, product_code: str) -> Dict[str, float]:
+    timer = PhaseTimer()
+    memory = memory_watchdog.MemoryReport()
+    adapter = ADAPTERS[adapter_name][1]()
+    token = activate(timer)
+    memory_token = memory_watchdog.activate(memory)
+    started = time.perf_counter()
+    try:
+        reviews = sum(len(batch.reviews) for batch in adapter.iter_review_batches(_product(platform, product_code)))
+    finally:
+        elapsed = time.perf_counter() - started
+        memory_watchdog.deactivate(memory_token)
+        deactivate(token)
+
+    result = {name: timer.seconds.get(name, 0.0) for name in PHASES}
+    result["other"] = max(elapsed - sum(result.values()), 0.0)
+    result["total"] = elapsed
+    result["reviews"] = reviews
+    result["peak_rss_mb"] = memory.peak_rss_mb  # 메모리 감시가 있는 어댑터(롯데온)만 측정
+    return result
+
+
+def record(platform: str, product_code: str, fixture_dir: str) -> int:
+    fixture_replay.configure("record", fixture_dir)
+    for adapter_name in RECORD_ADAPTERS[platform]:
+        print(f"[BENCH] 기록 중: {adapter_name} / {product_code}")
+        result = run_once(adapter_name, platform, product_code)
+        print(f"[BENCH] {adapter_name}: 리뷰 {result['reviews']}개, {result['total']:.1f}s")
+    print(f"[BENCH] fixture 저장 위치: {fixture_dir}")
+    return 0
+
+
+def run(fixture_dir: str, repeat: int, adapter_names: List[str]) -> int:
+    fixture_replay.configure("replay", fixture_dir)
+    fixtures = discover_fixtures(fixture_dir)
+    if not fixtures:
+        print(f"[BENCH] {fixture_dir} 에 HAR fixture 가 없습니다. 먼저 record 명령으로 기록하세요.")
+        return 1
+
+    columns = PHASES + ("other", "total")
+    print(f"{'adapter':<18} {'product':<14} {'reviews':>7} " + " ".join(f"{c:>10}" for c in columns)
+          + f" {'peak_rss':>10}")
+    for platform, product_code in fixtures:
+        for adapter_name in adapter_names:
+            if ADAPTERS[adapter_name][0] != platform:
+                continue
+            runs = []
+            for _ in range(repeat):
+                try:
+                    runs.append(run_once(adapter_name, platform, product_code))
+                except Exception as e:
+                    print(f"[BENCH] {adapter_name} / {product_code} 실행 실패: {e}")
+                    break
+            if not runs:
+                continue
+            avg = {c: sum(r[c] for r in runs) / len(runs) for c in columns}
+            print(f"{adapter_name:<18} {product_code[:14]:<14} {runs[-1]['reviews']:>7} "
+                  + " ".join(f"{avg[c]:>9.2f}s" for c in columns)
+                  + f" {max(r['peak_rss_mb'] for r in runs):>8.0f}MB")
+    return 0
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="스크래퍼 fixture 기록/재생 벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = sub.add_parser("record", help="라이브 사이트에서 fixture 기록")
+    record_parser.add_argument("platform", choices=sorted(RECORD_ADAPTERS))
+    record_parser.add_argument("product_code")
+    record_parser.add_argument("--fixtures", default=SCRAPER_FIXTURE_DIR)
+
+    run_parser = sub.add_parser("run", help="fixture 재생 벤치마크")
+    run_parser.add_argument("--fixtures", default=SCRAPER_FIXTURE_DIR)
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--adapter", default="", help="쉼표 구분 (기본: 전체)")
+
+    args = parser.parse_args(argv)
+    if args.command == "record":
+        return record(args.platform, args.product_code, args.fixtures)
+
+    adapter_names = [a for a in args.adapter.split(",") if a] or list(ADAPTERS)
+    unknown = [a for a in adapter_names if a not in ADAPTERS]
+    if unknown:
+        parser.error(f"알 수 없는 어댑터: {unknown} (가능: {list(ADAPTERS)})")
+    return run(args.fixtures, args.repeat, adapter_names)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
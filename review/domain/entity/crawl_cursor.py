@@ -0,0 +1,33 @@
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class CrawlCursor:
+    """
+    크롤링 재개 지점 (Celery 재시도 시 처음부터 다시 돌지 않고 이어서 수집)
+    - strategy: 커서를 만든 수집 경로 (예: "http", "network", "dom", "api", "paging", "more")
+      → 재시도에서 같은 경로로 수집할 때만 적용
+    - page: 마지막으로 저장된 페이지 번호 (HTTP/API/페이지 번호 방식)
+    - more_clicks: 지금까지 누른 '리뷰 더보기' 횟수 (더보기 방식)
+    - last_review_number: 마지막 배치의 마지막 리뷰 번호 (있으면)
+    """
+    strategy: str
+    page: int = 0
+    more_clicks: int = 0
+    last_review_number: Optional[str] = None
+
+    def applies_to(self, strategy: str) -> bool:
+        return self.strategy == strategy
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CrawlCursor":
+        return cls(
+            strategy=str(data.get("strategy", "")),
+            page=int(data.get("page") or 0),
+            more_clicks=int(data.get("more_clicks") or 0),
+            last_review_number=data.get("last_review_number"),
+        )
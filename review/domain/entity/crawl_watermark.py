@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, Optional, Set, Tuple
+
+from review.domain.entity.review import Review
+
+# 리뷰 동일성 키 (ReviewRepositoryImpl.save_all 중복 체크와 동일)
+Fingerprint = Tuple[Optional[str], str, datetime]
+
+
+@dataclass
+class CrawlWatermark:
+    """
+    증분 크롤링 기준점 (상품별 High-Water Mark)
+    - newest_review_at: 저장된 리뷰 중 가장 최근 작성 시각 (로그/사전 확인용)
+    - fingerprints: 최근 리뷰들의 동일성 키 집합
+    순회 중단은 fingerprint 일치로만 판단 (작성 시각 비교는 날짜순이 아닌 목록이나
+    체크포인트 재개 직후의 오래된 페이지를 기존 리뷰로 오인해 수집을 멈춤)
+    """
+    newest_review_at: Optional[datetime] = None
+    fingerprints: Set[Fingerprint] = field(default_factory=set)
+
+    @staticmethod
+    def fingerprint(review: Review) -> Fingerprint:
+        return review.reviewer, review.content, review.review_at
+
+    @property
+    def is_empty(self) -> bool:
+        return self.newest_review_at is None and not self.fingerprints
+
+    def is_known(self, review: Review) -> bool:
+        """이미 저장된 리뷰인지 (fingerprint 일치)"""
+        return self.fingerprint(review) in self.fingerprints
+
+    def is_page_known(self, reviews: Iterable[Review]) -> bool:
+        """한 페이지의 리뷰가 모두 알려진 리뷰면 True → 페이지 순회 중단"""
+        if self.is_empty:
+            return False
+        reviews = list(reviews)
+        return bool(reviews) and all(self.is_known(r) for r in reviews)
@@ -0,0 +1,36 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from review.domain.entity.review import Review
+from review.domain.entity.crawl_watermark import CrawlWatermark
+
+
+@dataclass
+class ReviewSummary:
+    """
+    전체 크롤링 전에 가볍게(HTTP 1회) 확인한 플랫폼의 리뷰 현황
+    - total_count: 플랫폼이 알려준 전체 리뷰 수 (모르면 None)
+    - newest_review_at: 최신 리뷰 작성 시각 (모르면 None)
+    - first_page: 최신순 첫 페이지 리뷰 (저장된 fingerprint 와 비교)
+    """
+    total_count: Optional[int] = None
+    newest_review_at: Optional[datetime] = None
+    first_page: List[Review] = field(default_factory=list)
+
+    def is_unchanged(self, known_count: Optional[int], watermark: CrawlWatermark) -> bool:
+        """
+        저장된 상태와 비교해 새 리뷰가 없다고 확신할 수 있으면 True
+        - 저장된 리뷰가 없거나, 전체 리뷰 수가 기록된 값과 다르면 변경
+        - 첫 페이지가 있으면 전부 이미 저장된 리뷰인지로 판단
+        - 첫 페이지가 없으면 전체 리뷰 수와 최신 작성 시각이 모두 확인되어야 미변경
+        """
+        if watermark.is_empty:
+            return False
+        if self.total_count is not None and self.total_count != known_count:
+            return False
+        if self.first_page:
+            return watermark.is_page_known(self.first_page)
+        if self.total_count is None or self.newest_review_at is None:
+            return False
+        return self.newest_review_at <= watermark.newest_review_at
@@ -0,0 +1,242 @@
+"""
+Async Scrape Engine
+워커 프로세스 하나에서 여러 상품을 동시에 크롤링하는 asyncio 기반 Playwright 엔진
+- 전용 스레드에서 이벤트 루프 + async_playwright Chromium 하나를 유지
+- 크롤링마다 새 BrowserContext (프로세스 전체 상한 + 플랫폼별 세마포어)
+- Celery 태스크(동기 스레드)는 run / stream 브리지로 엔진 루프에 코루틴을 제출
+"""
+import os
+import time
+import asyncio
+import atexit
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterator, Optional, TypeVar
+
+from playwright.async_api import async_playwright, Playwright, Browser, BrowserContext
+
+from config.scraper_config import (
+    HEADLESS, BROWSER_POOL_MAX_CONTEXTS, SCRAPE_ENGINE_MAX_CONTEXTS, SCRAPE_ENGINE_PLATFORM_LIMITS,
+)
+
+T = TypeVar("T")
+
+
+async def _anext(agen: AsyncIterator[T]) -> T:
+    return await agen.__anext__()
+
+
+async def _aclose(agen) -> None:
+    await agen.aclose()
+
+
+class AsyncScrapeEngine:
+    """
+    asyncio 스크래핑 엔진
+    - 동시에 최대 max_contexts 개의 크롤링이 각자의 BrowserContext 에서 진행
+    - platform_limits: 플랫폼별 동시 크롤링 상한 (사이트 부하 분산)
+    - recycle_after 개 컨텍스트 발급 후, 진행 중인 크롤링이 없을 때 브라우저 재시작
+    """
+
+    def __init__(
+        self,
+        headless: bool = HEADLESS,
+        max_contexts: int = SCRAPE_ENGINE_MAX_CONTEXTS,
+        platform_limits: Optional[Dict[str, int]] = None,
+        recycle_after: int = BROWSER_POOL_MAX_CONTEXTS,
+    ):
+        self.headless = headless
+        self.max_contexts = max_contexts
+        self.platform_limits = dict(SCRAPE_ENGINE_PLATFORM_LIMITS if platform_limits is None else platform_limits)
+        self.recycle_after = recycle_after
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._browser_lock: Optional[asyncio.Lock] = None
+        self._context_slots: Optional[asyncio.Semaphore] = None
+        self._platform_slots: Dict[str, asyncio.Semaphore] = {}
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._active = 0
+        self._contexts_served = 0  # 현재 브라우저가 발급한 컨텍스트 수
+
+        self.stats: Dict[str, Any] = {
+            "launches": 0,
+            "recycles": 0,
+            "contexts_total": 0,
+            "active_peak": 0,
+            "launch_seconds_total": 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # 이벤트 루프 스레드
+    # ------------------------------------------------------------------
+    def start(self) -> "AsyncScrapeEngine":
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run_loop, name="async-scrape-engine", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def _run_loop(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        self._browser_lock = asyncio.Lock()
+        self._context_slots = asyncio.Semaphore(self.max_contexts)
+        self._platform_slots = {}
+        self._host_slots = {}
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    # ------------------------------------------------------------------
+    # 브라우저 / 컨텍스트 (엔진 루프 안에서만 호출)
+    # ------------------------------------------------------------------
+    async def _acquire_browser(self) -> Browser:
+        async with self._browser_lock:
+            reason = None
+            if self._browser is not None and not self._browser.is_connected():
+                reason = "disconnected"
+            elif self._browser is not None and self._active == 0 and self.recycle_after \
+                    and self._contexts_served >= self.recycle_after:
+                reason = f"contexts>={self.recycle_after}"
+            if reason:
+                print(f"[ENGINE] 브라우저 재시작 ({reason})")
+                self.stats["recycles"] += 1
+                await self._close_browser()
+
+            if self._browser is None:
+                started = time.perf_counter()
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=self.headless)
+                self._contexts_served = 0
+                elapsed = time.perf_counter() - started
+                self.stats["launches"] += 1
+                self.stats["launch_seconds_total"] += elapsed
+                print(f"[ENGINE] Chromium 기동 완료 ({elapsed:.2f}s, pid={os.getpid()})")
+            return self._browser
+
+    async def _close_browser(self) -> None:
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+        self._browser = None
+        self._contexts_served = 0
+
+    def _platform_slot(self, platform: str) -> asyncio.Semaphore:
+        slot = self._platform_slots.get(platform)
+        if slot is None:
+            slot = asyncio.Semaphore(self.platform_limits.get(platform, self.max_contexts))
+            self._platform_slots[platform] = slot
+        return slot
+
+    def host_slot(self, host: str, limit: int) -> asyncio.Semaphore:
+        """
+        도메인별 동시 요청 세마포어 (엔진 루프 안에서만 호출)
+        같은 호스트를 호출하는 크롤링 전체가 공유 → 동시 크롤링이 늘어도 호스트당 요청 수는 limit 이하
+        (limit 은 처음 만들 때의 값을 유지)
+        """
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(max(limit, 1))
+            self._host_slots[host] = slot
+        return slot
+
+    @asynccontextmanager
+    async def new_context(self, platform: str, **context_kwargs) -> AsyncIterator[BrowserContext]:
+        """플랫폼 세마포어 + 전체 상한 아래에서 새 BrowserContext 를 발급하고, 종료 시 닫는다."""
+        async with self._platform_slot(platform), self._context_slots:
+            browser = await self._acquire_browser()
+            context = await browser.new_context(**context_kwargs)
+            self._active += 1
+            self._contexts_served += 1
+            self.stats["contexts_total"] += 1
+            self.stats["active_peak"] = max(self.stats["active_peak"], self._active)
+            try:
+                yield context
+            finally:
+                self._active -= 1
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+
+    # ------------------------------------------------------------------
+    # 동기 브리지 (Celery 태스크 스레드에서 호출)
+    # ------------------------------------------------------------------
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """코루틴을 엔진 루프에 제출하고 결과를 기다린다."""
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    def stream(self, agen: AsyncIterator[T]) -> Iterator[T]:
+        """
+        async generator 를 동기 iterator 로 변환
+        - 소비자가 한 항목을 요청할 때만 다음 항목을 진행 (배압 유지)
+        - 소비자가 중단하면 aclose 로 엔진 루프에서 컨텍스트 등 자원 정리
+        """
+        try:
+            while True:
+                try:
+                    item = self.run(_anext(agen))
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            try:
+                self.run(_aclose(agen))
+            except Exception:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats["active"] = self._active
+        stats["browser_alive"] = self._browser is not None and self._browser.is_connected()
+        return stats
+
+    def shutdown(self) -> None:
+        if self._loop is None or self._thread is None or not self._thread.is_alive():
+            return
+
+        async def _stop():
+            await self._close_browser()
+            if self._playwright is not None:
+                try:
+                    await self._playwright.stop()
+                except Exception:
+                    pass
+            self._playwright = None
+
+        try:
+            asyncio.run_coroutine_threadsafe(_stop(), self._loop).result(30)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+
+# 프로세스 단위 싱글턴 (Celery prefork 시 부모 프로세스의 엔진을 물려받지 않도록 pid 확인)
+_engine: Optional[AsyncScrapeEngine] = None
+_engine_pid: Optional[int] = None
+_engine_lock = threading.Lock()
+
+
+def get_scrape_engine() -> AsyncScrapeEngine:
+    global _engine, _engine_pid
+    with _engine_lock:
+        if _engine is None or _engine_pid != os.getpid():
+            _engine = AsyncScrapeEngine().start()
+            _engine_pid = os.getpid()
+            atexit.register(_engine.shutdown)
+        return _engine
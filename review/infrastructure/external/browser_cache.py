@@ -0,0 +1,259 @@
+"""
+Browser Cache
+크롤링마다 빈 프로필로 시작하지 않도록 브라우저 상태와 정적 리소스를 플랫폼별로 재사용 (웜 스타트)
+- storage_state: 쿠키/localStorage (동의 배너, 세션 쿠키) 를 {cache_dir}/storage_state/{platform}.json 에 보관
+  새 컨텍스트는 이 파일로 시작하고, 리뷰 목록이 뜬 뒤 저장 주기가 지났으면 다시 저장 (차단 시 삭제)
+- 정적 리소스: BrowserContext 는 디스크 캐시를 쓰지 않으므로 route 로 JS/CSS 번들을 직접 캐시
+  {cache_dir}/assets/{sha[:2]}/{sha}(.json) - 워커/프로세스 간 공유, TTL 이 지나면 다시 받아 갱신
+- sync / async API 모두 지원 (async 는 디스크 읽기/쓰기를 스레드로)
+- RequestFilter 보다 먼저 install (route 는 나중에 등록한 핸들러가 먼저 실행 → 차단 판단 후 fallback 으로 캐시)
+- fixture 기록/재생 중에는 사용하지 않음 (HAR 재현성 유지)
+"""
+import os
+import json
+import time
+import asyncio
+import hashlib
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from config.scraper_config import (
+    BROWSER_CACHE_DIR, STORAGE_STATE_ENABLED, STORAGE_STATE_REFRESH_SECONDS, STORAGE_STATE_MAX_AGE_SECONDS,
+    ASSET_CACHE_ENABLED, ASSET_CACHE_TYPES, ASSET_CACHE_TTL_SECONDS, ASSET_CACHE_MAX_ENTRY_KB
+)
+from review.infrastructure.external import fixture_replay
+
+# 캐시 응답에 그대로 쓰면 안 되는 헤더 (본문은 디코딩된 상태로 저장)
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "set-cookie", "connection"}
+
+_prune_lock = threading.Lock()
+_last_prune = 0.0
+
+
+def _file_age(path: str) -> Optional[float]:
+    try:
+        return time.time() - os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+# ----------------------------------------------------------------------
+# storage_state
+# ----------------------------------------------------------------------
+def storage_state_path(platform: str) -> str:
+    return os.path.join(BROWSER_CACHE_DIR, "storage_state", f"{platform}.json")
+
+
+def _storage_state_active() -> bool:
+    return STORAGE_STATE_ENABLED and fixture_replay.fixture_mode() == "off"
+
+
+def storage_state_options(platform: str) -> Dict[str, Any]:
+    """new_context 에 넘길 옵션 (보관된 상태가 없거나 너무 오래됐으면 빈 dict → 빈 프로필)"""
+    if not _storage_state_active():
+        return {}
+    path = storage_state_path(platform)
+    age = _file_age(path)
+    if age is None or age > STORAGE_STATE_MAX_AGE_SECONDS:
+        return {}
+    return {"storage_state": path}
+
+
+def save_storage_state(context, platform: str) -> None:
+    """저장 주기가 지났을 때만 현재 컨텍스트 상태를 보관 (실패해도 크롤링은 계속)"""
+    if not _storage_state_active():
+        return
+    path = storage_state_path(platform)
+    age = _file_age(path)
+    if age is not None and age < STORAGE_STATE_REFRESH_SECONDS:
+        return
+    try:
+        _atomic_write(path, json.dumps(context.storage_state(), ensure_ascii=False).encode("utf-8"))
+        print(f"[CACHE] {platform} storage_state 저장")
+    except Exception as e:
+        print(f"[WARNING] storage_state 저장 실패: {e}")
+
+
+async def asave_storage_state(context, platform: str) -> None:
+    """save_storage_state 의 async API 판"""
+    if not _storage_state_active():
+        return
+    path = storage_state_path(platform)
+    age = _file_age(path)
+    if age is not None and age < STORAGE_STATE_REFRESH_SECONDS:
+        return
+    try:
+        state = await context.storage_state()
+        await asyncio.to_thread(_atomic_write, path, json.dumps(state, ensure_ascii=False).encode("utf-8"))
+        print(f"[CACHE] {platform} storage_state 저장")
+    except Exception as e:
+        print(f"[WARNING] storage_state 저장 실패: {e}")
+
+
+def invalidate_storage_state(platform: str) -> None:
+    """차단된 세션의 쿠키를 다음 크롤링이 물려받지 않도록 삭제"""
+    try:
+        os.remove(storage_state_path(platform))
+        print(f"[CACHE] {platform} storage_state 삭제 (차단 감지)")
+    except OSError:
+        pass
+
+
+# ----------------------------------------------------------------------
+# 정적 리소스 디스크 캐시
+# ----------------------------------------------------------------------
+class AssetCache:
+    """GET 정적 리소스(script/stylesheet) 응답을 디스크에 보관해 다음 크롤링에서 네트워크 없이 응답"""
+
+    def __init__(
+        self,
+        root: str = BROWSER_CACHE_DIR,
+        resource_types: Iterable[str] = ASSET_CACHE_TYPES,
+        ttl_seconds: int = ASSET_CACHE_TTL_SECONDS,
+        max_entry_kb: int = ASSET_CACHE_MAX_ENTRY_KB,
+        enabled: bool = ASSET_CACHE_ENABLED,
+    ):
+        self.root = os.path.join(root, "assets")
+        self.resource_types = set(resource_types)
+        self.ttl_seconds = ttl_seconds
+        self.max_entry_bytes = max_entry_kb * 1024
+        self.enabled = enabled and fixture_replay.fixture_mode() == "off"
+        self.stats: Dict[str, Any] = {"hits": 0, "misses": 0, "stored": 0, "bytes_served": 0}
+
+    def _path(self, url: str) -> str:
+        sha = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, sha[:2], sha)
+
+    def lookup(self, url: str) -> Optional[Tuple[int, Dict[str, str], bytes]]:
+        """TTL 안의 (status, headers, body), 없거나 만료면 None"""
+        path = self._path(url)
+        age = _file_age(f"{path}.json")
+        if age is None or age > self.ttl_seconds:
+            return None
+        try:
+            with open(f"{path}.json", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return meta["status"], meta["headers"], body
+
+    def store(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> bool:
+        cache_control = headers.get("cache-control", "").lower()
+        if status != 200 or "no-store" in cache_control or len(body) > self.max_entry_bytes:
+            return False
+        path = self._path(url)
+        kept = {k: v for k, v in headers.items() if k.lower() not in _DROP_HEADERS}
+        try:
+            _atomic_write(path, body)  # 본문 먼저, 메타 파일이 있어야 조회되므로 반쯤 쓴 항목은 보이지 않음
+            _atomic_write(f"{path}.json", json.dumps({"url": url, "status": status, "headers": kept}).encode("utf-8"))
+        except OSError as e:
+            print(f"  [WARNING] 리소스 캐시 저장 실패: {e}")
+            return False
+        self.stats["stored"] += 1
+        return True
+
+    def _cacheable(self, request) -> bool:
+        return request.method == "GET" and request.resource_type in self.resource_types
+
+    def _handle(self, route) -> None:
+        request = route.request
+        if not self._cacheable(request):
+            route.fallback()
+            return
+
+        cached = self.lookup(request.url)
+        if cached is not None:
+            status, headers, body = cached
+            self.stats["hits"] += 1
+            self.stats["bytes_served"] += len(body)
+            route.fulfill(status=status, headers=headers, body=body)
+            return
+
+        self.stats["misses"] += 1
+        try:
+            response = route.fetch()
+        except Exception:
+            route.fallback()  # 직접 받기 실패 → 브라우저 기본 처리에 맡김
+            return
+        try:
+            self.store(request.url, response.status, response.headers, response.body())
+        except Exception:
+            pass
+        route.fulfill(response=response)
+
+    async def _handle_async(self, route) -> None:
+        request = route.request
+        if not self._cacheable(request):
+            await route.fallback()
+            return
+
+        cached = await asyncio.to_thread(self.lookup, request.url)
+        if cached is not None:
+            status, headers, body = cached
+            self.stats["hits"] += 1
+            self.stats["bytes_served"] += len(body)
+            await route.fulfill(status=status, headers=headers, body=body)
+            return
+
+        self.stats["misses"] += 1
+        try:
+            response = await route.fetch()
+        except Exception:
+            await route.fallback()
+            return
+        try:
+            body = await response.body()
+            await asyncio.to_thread(self.store, request.url, response.status, response.headers, body)
+        except Exception:
+            pass
+        await route.fulfill(response=response)
+
+    def install(self, context) -> "AssetCache":
+        """BrowserContext 에 route 핸들러 설치 (RequestFilter.install 보다 먼저 호출)"""
+        if self.enabled:
+            self.prune()
+            context.route("**/*", self._handle)
+        return self
+
+    async def install_async(self, context) -> "AssetCache":
+        """async API 용 install (AsyncScrapeEngine 컨텍스트)"""
+        if self.enabled:
+            await asyncio.to_thread(self.prune)
+            await context.route("**/*", self._handle_async)
+        return self
+
+    def prune(self) -> int:
+        """TTL 이 지난 항목 삭제 (배포마다 파일명이 바뀌는 번들이 쌓이지 않도록, 프로세스당 TTL 주기로 1회)"""
+        global _last_prune
+        with _prune_lock:
+            if time.monotonic() - _last_prune < self.ttl_seconds and _last_prune:
+                return 0
+            _last_prune = time.monotonic()
+
+        removed = 0
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                age = _file_age(path)
+                if age is not None and age > self.ttl_seconds:
+                    try:
+                        os.remove(path)
+                        removed += 1
+                    except OSError:
+                        pass
+        return removed
+
+    def summary(self) -> str:
+        served_kb = self.stats["bytes_served"] / 1024
+        return (f"적중 {self.stats['hits']}건 / 미적중 {self.stats['misses']}건 / "
+                f"저장 {self.stats['stored']}건 / 캐시 응답 {served_kb:.0f}KB")
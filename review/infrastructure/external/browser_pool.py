@@ -0,0 +1,193 @@
+"""
+Browser Pool
+워커 프로세스 단위로 Chromium을 유지하고, 크롤링마다 새 BrowserContext를 발급
+"""
+import os
+import time
+import atexit
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Set
+
+from playwright.sync_api import sync_playwright, Playwright, Browser, BrowserContext
+
+from config.scraper_config import HEADLESS, BROWSER_POOL_MAX_CONTEXTS, BROWSER_POOL_MAX_RSS_MB
+
+try:
+    import psutil
+except ImportError:  # psutil이 없으면 RSS 기반 재시작은 비활성화
+    psutil = None
+
+
+class BrowserPool:
+    """
+    Chromium 브라우저를 재사용하는 풀
+    - 크롤링마다 새 BrowserContext를 발급 (쿠키/스토리지는 격리)
+    - N개 컨텍스트 발급 후 또는 RSS 상한 초과 시 브라우저 재시작
+    - sync API 특성상 생성한 스레드에서만 사용 (get_browser_pool 참고)
+    """
+
+    def __init__(
+        self,
+        headless: bool = HEADLESS,
+        max_contexts: int = BROWSER_POOL_MAX_CONTEXTS,
+        max_rss_mb: int = BROWSER_POOL_MAX_RSS_MB,
+    ):
+        self.headless = headless
+        self.max_contexts = max_contexts
+        self.max_rss_mb = max_rss_mb
+
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._browser_pids: List[int] = []  # 이 풀이 띄운 Chromium 최상위 프로세스 (RSS 측정 범위)
+        self._contexts_served = 0  # 현재 브라우저가 발급한 컨텍스트 수
+
+        self.stats: Dict[str, Any] = {
+            "hits": 0,                  # 기존 브라우저 재사용
+            "misses": 0,                # 브라우저 새로 기동
+            "recycles": 0,              # 재시작 횟수
+            "launch_seconds_total": 0.0,
+            "last_launch_seconds": 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # 브라우저 수명 관리
+    # ------------------------------------------------------------------
+    def _launch(self) -> Browser:
+        started = time.perf_counter()
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+        # 기동 전후 하위 프로세스를 비교해 이 브라우저의 프로세스만 기록
+        # (같은 워커의 다른 스레드 풀/엔진 브라우저와 섞이지 않도록 기동은 한 번에 하나씩)
+        with _launch_lock:
+            before = _child_pids()
+            self._browser = self._playwright.chromium.launch(headless=self.headless)
+            self._browser_pids = _root_pids(_child_pids() - before)
+        self._contexts_served = 0
+
+        elapsed = time.perf_counter() - started
+        self.stats["misses"] += 1
+        self.stats["launch_seconds_total"] += elapsed
+        self.stats["last_launch_seconds"] = elapsed
+        print(f"[POOL] Chromium 기동 완료 ({elapsed:.2f}s, pid={os.getpid()})")
+        return self._browser
+
+    def _close_browser(self) -> None:
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception:
+                pass
+        self._browser = None
+        self._browser_pids = []
+        self._contexts_served = 0
+
+    def browser_rss_mb(self) -> Optional[float]:
+        """이 풀이 띄운 Chromium 프로세스와 그 하위 프로세스(렌더러/GPU 등) RSS 합계 (MB)"""
+        if psutil is None or not self._browser_pids:
+            return None
+        try:
+            processes = {}
+            for pid in self._browser_pids:
+                root = psutil.Process(pid)
+                for process in [root] + root.children(recursive=True):
+                    processes[process.pid] = process
+            return sum(process.memory_info().rss for process in processes.values()) / (1024 * 1024)
+        except Exception:
+            return None
+
+    def _recycle_reason(self) -> Optional[str]:
+        if self._browser is None:
+            return None
+        if not self._browser.is_connected():
+            return "disconnected"
+        if self.max_contexts and self._contexts_served >= self.max_contexts:
+            return f"contexts>={self.max_contexts}"
+        if self.max_rss_mb:
+            rss = self.browser_rss_mb()
+            if rss is not None and rss >= self.max_rss_mb:
+                return f"rss={rss:.0f}MB"
+        return None
+
+    def _acquire_browser(self) -> Browser:
+        reason = self._recycle_reason()
+        if reason:
+            print(f"[POOL] 브라우저 재시작 ({reason})")
+            self.stats["recycles"] += 1
+            self._close_browser()
+
+        if self._browser is None:
+            return self._launch()
+
+        self.stats["hits"] += 1
+        return self._browser
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+    @contextmanager
+    def new_context(self, **context_kwargs) -> Iterator[BrowserContext]:
+        """풀의 브라우저에서 새 BrowserContext를 발급하고, 종료 시 닫는다."""
+        browser = self._acquire_browser()
+        context = browser.new_context(**context_kwargs)
+        self._contexts_served += 1
+        try:
+            yield context
+        finally:
+            try:
+                context.close()
+            except Exception:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats["contexts_served"] = self._contexts_served
+        stats["browser_alive"] = self._browser is not None and self._browser.is_connected()
+        return stats
+
+    def shutdown(self) -> None:
+        self._close_browser()
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception:
+                pass
+        self._playwright = None
+
+
+_launch_lock = threading.Lock()
+
+
+def _child_pids() -> Set[int]:
+    if psutil is None:
+        return set()
+    try:
+        return {child.pid for child in psutil.Process(os.getpid()).children(recursive=True)}
+    except Exception:
+        return set()
+
+
+def _root_pids(pids: Set[int]) -> List[int]:
+    """새로 생긴 프로세스 중 부모가 그 집합 밖에 있는 것 (= 브라우저 최상위 프로세스)"""
+    roots = []
+    for pid in pids:
+        try:
+            if psutil.Process(pid).ppid() not in pids:
+                roots.append(pid)
+        except Exception:
+            continue
+    return roots
+
+
+# 스레드 로컬 + pid 확인 (Celery prefork 시 부모 프로세스의 풀을 물려받지 않도록)
+_local = threading.local()
+
+
+def get_browser_pool() -> BrowserPool:
+    pool: Optional[BrowserPool] = getattr(_local, "pool", None)
+    if pool is None or getattr(_local, "pid", None) != os.getpid():
+        pool = BrowserPool()
+        _local.pool = pool
+        _local.pid = os.getpid()
+        atexit.register(pool.shutdown)
+    return pool
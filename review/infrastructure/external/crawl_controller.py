@@ -0,0 +1,300 @@
+"""
+Crawl Controller
+플랫폼별 동시 크롤링 수와 요청 속도를 AIMD(가산 증가 / 곱셈 감소)로 조절
+- 스크래퍼가 페이지 로드/API 호출 결과(지연 시간, HTTP 상태, 타임아웃, 차단 페이지)를 보고
+- 정상 응답: 동시 크롤링 수와 요청 속도를 조금씩 증가 (AIMD_CONCURRENCY_STEP / AIMD_RATE_STEP)
+- 429/403/캡차, 타임아웃, 목표 지연 초과: 둘 다 AIMD_DECREASE_FACTOR 배로 감소 (쿨다운 동안 한 번만)
+- 워커는 크롤링 시작 전에 슬롯을 얻고(try_acquire_slot), 끝나면 반납(release_slot)
+- 요청 속도는 RateLimiter 토큰 버킷이 같은 Redis 해시에서 읽어 사용
+- Redis 장애 시에는 제한 없이 진행 (크롤링 중단보다 우선)
+- AIMD_ENABLED=false 면 조절(Redis 갱신)만 끄고, 차단 감지(CrawlBlockedError)는 그대로
+- key: crawl:aimd:{platform} (limit, rate, last_decrease) / crawl:aimd:{platform}:slots (토큰 → 임대 만료 시각)
+"""
+import os
+import time
+import uuid
+import asyncio
+from typing import Dict, Optional, Tuple
+
+from playwright.sync_api import TimeoutError as PWTimeout
+
+from config.scraper_config import (
+    AIMD_ENABLED,
+    AIMD_INITIAL_CONCURRENCY,
+    AIMD_MIN_CONCURRENCY,
+    AIMD_MAX_CONCURRENCY,
+    AIMD_CONCURRENCY_STEP,
+    AIMD_MIN_RATE,
+    AIMD_MAX_RATE,
+    AIMD_RATE_STEP,
+    AIMD_DECREASE_FACTOR,
+    AIMD_COOLDOWN_SECONDS,
+    AIMD_LATENCY_TARGET_SECONDS,
+    AIMD_SLOT_LEASE_SECONDS,
+    RATE_LIMITS,
+)
+
+BLOCK_STATUSES = (403, 429)
+BLOCK_URL_MARKERS = ("captcha", "challenge", "blocked", "denied")
+
+STATE_TTL_MS = 7 * 24 * 60 * 60 * 1000  # 한동안 크롤링이 없으면 학습한 값을 버리고 초기값부터
+
+# 반환값: 1 = 슬롯 획득, 0 = 상한 도달
+ACQUIRE_SLOT_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now)
+local limit = tonumber(redis.call('HGET', KEYS[1], 'limit')) or tonumber(ARGV[3])
+if redis.call('ZCARD', KEYS[2]) < math.max(1, math.floor(limit)) then
+    redis.call('ZADD', KEYS[2], now + tonumber(ARGV[2]), ARGV[1])
+    redis.call('PEXPIRE', KEYS[2], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+# 임대 연장 (이미 만료되어 제거된 슬롯은 되살리지 않음)
+TOUCH_SLOT_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+if redis.call('ZSCORE', KEYS[1], ARGV[1]) then
+    redis.call('ZADD', KEYS[1], now + tonumber(ARGV[2]), ARGV[1])
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+# ARGV: direction(up|down), 초기 limit/rate, limit 범위, rate 범위, 증가량, 감소 배수, 쿨다운 ms, 상태 TTL ms
+# 반환값: {limit, rate, 변경 여부}
+ADJUST_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local state = redis.call('HMGET', KEYS[1], 'limit', 'rate', 'last_decrease')
+local limit = tonumber(state[1]) or tonumber(ARGV[2])
+local rate = tonumber(state[2]) or tonumber(ARGV[3])
+local changed = 1
+
+if ARGV[1] == 'down' then
+    if now - (tonumber(state[3]) or 0) < tonumber(ARGV[11]) then
+        changed = 0
+    else
+        limit = math.max(tonumber(ARGV[4]), limit * tonumber(ARGV[10]))
+        rate = math.max(tonumber(ARGV[6]), rate * tonumber(ARGV[10]))
+        redis.call('HSET', KEYS[1], 'last_decrease', now)
+    end
+else
+    limit = math.min(tonumber(ARGV[5]), limit + tonumber(ARGV[8]))
+    rate = math.min(tonumber(ARGV[7]), rate + tonumber(ARGV[9]))
+end
+
+redis.call('HSET', KEYS[1], 'limit', tostring(limit), 'rate', tostring(rate))
+redis.call('PEXPIRE', KEYS[1], ARGV[12])
+return {tostring(limit), tostring(rate), changed}
+"""
+
+
+class CrawlBlockedError(Exception):
+    """차단 신호(429/403/캡차 페이지)를 받아 현재 크롤링을 중단할 때"""
+
+
+def state_key(platform: str) -> str:
+    return f"crawl:aimd:{platform}"
+
+
+def _slots_key(platform: str) -> str:
+    return f"crawl:aimd:{platform}:slots"
+
+
+class CrawlController:
+    """플랫폼별 AIMD 동시성/속도 제어 (상태는 Redis 에만 있음)"""
+
+    def __init__(self, redis_client=None, enabled: bool = AIMD_ENABLED):
+        self.enabled = enabled
+        self._redis = redis_client
+        self._scripts = None
+        self.stats: Dict[str, int] = {"ok": 0, "slow": 0, "timeouts": 0, "blocked": 0,
+                                      "increases": 0, "decreases": 0, "errors": 0}
+
+    def _client(self):
+        if self._redis is None:
+            from config.redis_config import get_redis
+            self._redis = get_redis()
+        return self._redis
+
+    def _script(self, name: str):
+        if self._scripts is None:
+            client = self._client()
+            self._scripts = {
+                "acquire": client.register_script(ACQUIRE_SLOT_LUA),
+                "touch": client.register_script(TOUCH_SLOT_LUA),
+                "adjust": client.register_script(ADJUST_LUA),
+            }
+        return self._scripts[name]
+
+    @staticmethod
+    def _initial(platform: str) -> Tuple[float, float]:
+        rate, _ = RATE_LIMITS.get(platform, (0.0, 1))
+        return float(AIMD_INITIAL_CONCURRENCY), float(rate)
+
+    # ------------------------------------------------------------------
+    # 슬롯 (동시 크롤링 수)
+    # ------------------------------------------------------------------
+    def try_acquire_slot(self, platform: str) -> Optional[str]:
+        """
+        동시 크롤링 슬롯 획득 시도
+        Returns:
+            슬롯 토큰 (release_slot 에 전달), 상한에 도달했으면 None
+            비활성 또는 Redis 장애 시에는 빈 문자열 (제한 없이 진행)
+        """
+        if not self.enabled:
+            return ""
+        token = uuid.uuid4().hex
+        initial_limit, _ = self._initial(platform)
+        try:
+            acquired = self._script("acquire")(
+                keys=[state_key(platform), _slots_key(platform)],
+                args=[token, AIMD_SLOT_LEASE_SECONDS * 1000, initial_limit],
+            )
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"[WARNING] 크롤링 슬롯 확인 실패 ({platform}): {e}")
+            return ""
+        return token if int(acquired) else None
+
+    def touch_slot(self, platform: str, token: Optional[str]) -> None:
+        """긴 크롤링 중 슬롯 임대 연장 (배치 저장마다 호출)"""
+        if not token:
+            return
+        try:
+            self._script("touch")(keys=[_slots_key(platform)], args=[token, AIMD_SLOT_LEASE_SECONDS * 1000])
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"[WARNING] 크롤링 슬롯 연장 실패 ({platform}): {e}")
+
+    def release_slot(self, platform: str, token: Optional[str]) -> None:
+        if not token:
+            return
+        try:
+            self._client().zrem(_slots_key(platform), token)
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"[WARNING] 크롤링 슬롯 반납 실패 ({platform}): {e}")
+
+    # ------------------------------------------------------------------
+    # 신호 보고
+    # ------------------------------------------------------------------
+    def _adjust(self, platform: str, direction: str, reason: str = "") -> None:
+        if not self.enabled:
+            return
+        initial_limit, initial_rate = self._initial(platform)
+        try:
+            limit, rate, changed = self._script("adjust")(
+                keys=[state_key(platform)],
+                args=[direction, initial_limit, initial_rate,
+                      AIMD_MIN_CONCURRENCY, AIMD_MAX_CONCURRENCY, AIMD_MIN_RATE, AIMD_MAX_RATE,
+                      AIMD_CONCURRENCY_STEP, AIMD_RATE_STEP, AIMD_DECREASE_FACTOR,
+                      AIMD_COOLDOWN_SECONDS * 1000, STATE_TTL_MS],
+            )
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"[WARNING] AIMD 상태 갱신 실패 ({platform}): {e}")
+            return
+
+        if direction == "up":
+            self.stats["increases"] += 1
+        elif int(changed):
+            self.stats["decreases"] += 1
+            print(f"[AIMD] {platform} 감소 ({reason}) → 동시 크롤링 {float(limit):.1f}, {float(rate):.2f} req/s")
+
+    def report_response(self, platform: str, status: Optional[int], latency: float, url: str = "") -> None:
+        """
+        페이지 로드/API 응답 보고
+        - 429/403 또는 캡차/차단 페이지로 이동했으면 감소 후 CrawlBlockedError
+        - 목표 지연 초과면 감소, 정상 응답이면 증가
+        AIMD 가 꺼져 있어도 차단 감지는 항상 수행 (조절만 생략)
+        """
+        marker = next((m for m in BLOCK_URL_MARKERS if m in (url or "").lower()), None)
+        if status in BLOCK_STATUSES or marker:
+            self.stats["blocked"] += 1
+            reason = f"HTTP {status}" if status in BLOCK_STATUSES else f"차단 페이지: {marker}"
+            self._adjust(platform, "down", reason)
+            raise CrawlBlockedError(f"{platform} 요청 차단 ({reason})")
+
+        if latency > AIMD_LATENCY_TARGET_SECONDS:
+            self.stats["slow"] += 1
+            self._adjust(platform, "down", f"지연 {latency:.1f}s")
+        elif status is None or status < 400:
+            self.stats["ok"] += 1
+            self._adjust(platform, "up")
+
+    def report_timeout(self, platform: str) -> None:
+        self.stats["timeouts"] += 1
+        self._adjust(platform, "down", "타임아웃")
+
+    async def areport_response(self, platform: str, status: Optional[int], latency: float, url: str = "") -> None:
+        """report_response 의 asyncio 버전 (Redis 호출은 스레드에서)"""
+        await asyncio.to_thread(self.report_response, platform, status, latency, url)
+
+    async def areport_timeout(self, platform: str) -> None:
+        await asyncio.to_thread(self.report_timeout, platform)
+
+    def get_state(self, platform: str) -> Dict[str, float]:
+        """현재 동시 크롤링 상한 / 요청 속도 / 사용 중 슬롯 수"""
+        initial_limit, initial_rate = self._initial(platform)
+        try:
+            client = self._client()
+            limit, rate = client.hmget(state_key(platform), "limit", "rate")
+            active = client.zcount(_slots_key(platform), time.time() * 1000, "+inf")
+        except Exception as e:
+            print(f"[WARNING] AIMD 상태 조회 실패 ({platform}): {e}")
+            return {"limit": initial_limit, "rate": initial_rate, "active": 0}
+        return {
+            "limit": float(limit) if limit else initial_limit,
+            "rate": float(rate) if rate else initial_rate,
+            "active": int(active),
+        }
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self.stats)
+
+
+def goto_and_report(page, url: str, platform: str, **kwargs):
+    """page.goto 후 상태 코드/지연/최종 URL 보고 (타임아웃은 보고 후 그대로 전파)"""
+    controller = get_crawl_controller()
+    started = time.perf_counter()
+    try:
+        response = page.goto(url, **kwargs)
+    except PWTimeout:
+        controller.report_timeout(platform)
+        raise
+    controller.report_response(platform, response.status if response else None,
+                               time.perf_counter() - started, page.url)
+    return response
+
+
+async def agoto_and_report(page, url: str, platform: str, **kwargs):
+    """goto_and_report 의 async Playwright 버전 (sync/async TimeoutError 는 같은 클래스)"""
+    controller = get_crawl_controller()
+    started = time.perf_counter()
+    try:
+        response = await page.goto(url, **kwargs)
+    except PWTimeout:
+        await controller.areport_timeout(platform)
+        raise
+    await controller.areport_response(platform, response.status if response else None,
+                                      time.perf_counter() - started, page.url)
+    return response
+
+
+# 프로세스 단위 인스턴스 (스레드/엔진 루프에서 공유, 상태는 Redis 에만 있음)
+_controller: Optional[CrawlController] = None
+_controller_pid: Optional[int] = None
+
+
+def get_crawl_controller() -> CrawlController:
+    global _controller, _controller_pid
+    if _controller is None or _controller_pid != os.getpid():
+        _controller = CrawlController()
+        _controller_pid = os.getpid()
+    return _controller
@@ -0,0 +1,230 @@
+"""
+11st Async Scraper Adapter
+AsyncScrapeEngine 위에서 network 모드로 11번가 리뷰를 수집 (한 프로세스에서 여러 상품 동시 크롤링)
+- 응답 수집 경로가 아무것도 넘기지 못하면 동기 어댑터의 DOM 모드로 폴백
+"""
+import time
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from playwright.async_api import TimeoutError as PWTimeout
+
+from config.scraper_config import ELEVENST_REVIEW_RESPONSE_PATTERN, WAIT_TIMEOUT_MS
+from product.domain.entity.product import Product
+from review.application.port.scraper_port import ReviewBatch
+from review.domain.entity.review import ReviewPlatform
+from review.domain.entity.crawl_watermark import CrawlWatermark
+from review.domain.entity.crawl_cursor import CrawlCursor
+from review.infrastructure.external.async_scrape_engine import AsyncScrapeEngine, get_scrape_engine
+from review.infrastructure.external.request_filter import RequestFilter
+from review.infrastructure.external.browser_cache import (
+    AssetCache, storage_state_options, asave_storage_state, invalidate_storage_state
+)
+from review.infrastructure.external.rate_limiter import get_rate_limiter
+from review.infrastructure.external.crawl_controller import CrawlBlockedError, get_crawl_controller, agoto_and_report
+from review.infrastructure.external.selector_probe import aprobe_selectors
+from review.infrastructure.external import fixture_replay
+from review.infrastructure.external.snapshot_archive import get_snapshot_recorder
+from review.infrastructure.external.elevenSt_scraper import (
+    ElevenStScraperAdapter, REVIEW_ITEM_CSS, parse_11st_review_body, to_11st_review_entities
+)
+
+IFRAME_SELECTOR = '#ifrmReview'
+REVIEW_ITEM_SELECTOR = f'#review-list-page-area {REVIEW_ITEM_CSS}'
+LOAD_MORE_BUTTON_SELECTOR = 'button.c_product_btn_more8'
+STORE_NAME_SELECTOR = 'a[data-log-actionid-label="store_go"]'
+TITLE_SELECTOR = 'h1.title'
+REVIEW_TAB_SELECTOR = 'button[aria-controls="tabpanelDetail2"]:has-text("리뷰")'
+
+
+class ElevenStAsyncScraperAdapter(ElevenStScraperAdapter):
+    """
+    11번가 리뷰 async 스크래퍼
+    - 리뷰 iframe 의 목록 응답을 이벤트로 모아 '리뷰 더보기'마다 파싱 (파싱은 스레드로 넘겨 루프를 막지 않음)
+    - 폴백은 부모(동기) 어댑터의 dom 모드
+    """
+
+    def __init__(self, engine: Optional[AsyncScrapeEngine] = None):
+        super().__init__(mode="dom")
+        self.engine = engine
+
+    def iter_review_batches(self, product: Product, watermark: Optional[CrawlWatermark] = None,
+                            resume_from: Optional[CrawlCursor] = None) -> Iterator[ReviewBatch]:
+        if product.source.value != ReviewPlatform.ELEVENST.value:
+            raise ValueError(f"지원하지 않는 플랫폼: {product.source}")
+
+        try:
+            product_code = int(product.source_product_id)
+        except ValueError:
+            raise ValueError("product_id는 11번가 상품 코드(정수)여야 합니다.")
+
+        engine = self.engine or get_scrape_engine()
+        skip_clicks = resume_from.more_clicks if resume_from and resume_from.applies_to("network") else 0
+
+        page = 0
+        collected = False
+        for items, cursor in engine.stream(self._aiter_review_pages(engine, product_code, skip_clicks)):
+            collected = True
+            reviews = to_11st_review_entities(items, product_code, product.source)
+            if not reviews:
+                continue
+            page += 1
+
+            if watermark is not None and watermark.is_page_known(reviews):
+                print(f"[INFO] {page}번째 묶음이 모두 기존 리뷰입니다. (증분 크롤링 종료)")
+                return
+
+            yield ReviewBatch(page=page, reviews=reviews, cursor=cursor)
+
+        if not collected and not skip_clicks:
+            print("[WARNING] 엔진 network 모드 수집 실패 → 동기 DOM 파싱으로 전환")
+            yield from super().iter_review_batches(product, watermark=watermark, resume_from=resume_from)
+
+    async def _aiter_review_pages(self, engine: AsyncScrapeEngine, product_code: int, skip_clicks: int = 0
+                                  ) -> AsyncIterator[Tuple[List[Dict[str, str]], CrawlCursor]]:
+        """(리뷰 dict 리스트, 재개 지점) 을 더보기 단위로 yield (엔진 루프에서 실행)"""
+        url = f"https://www.11st.co.kr/products/{product_code}"
+        product_title: Optional[str] = None
+        store_name: Optional[str] = None
+
+        print(f"--- 11번가 리뷰 크롤링 시작 (async engine) ---")
+        print(f"--- 대상 URL: {url} ---")
+
+        request_filter = RequestFilter()
+        asset_cache = AssetCache()
+        archive = get_snapshot_recorder("elevenst", product_code)
+        captured_responses: List[Any] = []
+
+        def on_response(response):
+            if ELEVENST_REVIEW_RESPONSE_PATTERN in response.url and \
+                    response.request.resource_type in ("document", "xhr", "fetch"):
+                captured_responses.append(response)
+
+        try:
+            fixture_options = fixture_replay.context_options("elevenst", product_code)
+            async with engine.new_context("elevenst", **fixture_options,
+                                          **storage_state_options("elevenst")) as context:
+                await asset_cache.install_async(context)  # 필터보다 먼저 (필터 통과분만 캐시)
+                await request_filter.install_async(context)
+                await fixture_replay.ainstall_replay(context, "elevenst", product_code)
+                page = await context.new_page()
+                page.on("response", on_response)
+                page.set_default_navigation_timeout(30000)
+                page.set_default_timeout(20000)
+
+                await get_rate_limiter().aacquire("elevenst")
+                await agoto_and_report(page, url, "elevenst")  # 차단(429/403/캡차)이면 CrawlBlockedError
+                await page.wait_for_load_state("networkidle")
+
+                try:
+                    product_title = (await page.locator(TITLE_SELECTOR).text_content(timeout=10000)).strip()
+                    store_name = (await page.locator(STORE_NAME_SELECTOR).text_content(timeout=10000)).strip()
+                    print(f"[INFO] 상품명/상호명 추출 성공: {product_title[:15]}... / {store_name}")
+                except PWTimeout:
+                    print("[WARNING] 상품명 또는 상호명을 찾지 못했습니다.")
+
+                try:
+                    review_tab = page.locator(REVIEW_TAB_SELECTOR)
+                    await review_tab.scroll_into_view_if_needed()
+                    await review_tab.click()
+                except PWTimeout:
+                    print("[ERROR] 리뷰 탭을 찾지 못했습니다. (리뷰 탭 로드 실패)")
+                    return
+
+                try:
+                    iframe_element = await page.wait_for_selector(IFRAME_SELECTOR, state="attached")
+                    review_frame = await iframe_element.content_frame()
+                    if review_frame is None:
+                        raise RuntimeError("content_frame 없음")
+                except Exception:
+                    print(f"[FATAL ERROR] iframe ({IFRAME_SELECTOR})을 찾지 못했습니다. (iframe 전환 실패)")
+                    return
+
+                try:
+                    await review_frame.wait_for_selector(REVIEW_ITEM_SELECTOR, state="attached", timeout=WAIT_TIMEOUT_MS)
+                    await asave_storage_state(context, "elevenst")
+                except PWTimeout:
+                    print("[WARNING] 리뷰 목록이 제한 시간 내 나타나지 않았습니다.")
+
+                seen = set()
+                processed = 0
+                clicks = 0
+
+                async def drain() -> List[Dict[str, str]]:
+                    nonlocal processed
+                    added: List[Dict[str, str]] = []
+                    while processed < len(captured_responses):
+                        response = captured_responses[processed]
+                        processed += 1
+                        try:
+                            body = await response.text()
+                        except Exception as e:
+                            print(f"  [WARNING] 응답 본문 읽기 실패: {e}")
+                            continue
+                        content_type = (response.headers or {}).get("content-type", "")
+                        if archive:
+                            # 압축/디스크 쓰기는 스레드에서 (다른 크롤링이 멈추지 않도록)
+                            await asyncio.to_thread(archive.add, body, "11st_body", content_type=content_type)
+                        # BeautifulSoup 파싱은 CPU 작업 → 다른 크롤링이 멈추지 않도록 스레드에서 실행
+                        items = await asyncio.to_thread(
+                            parse_11st_review_body, body, content_type, product_title, store_name
+                        )
+                        for item in items:
+                            key = (item["user_id"], item["date"], item["content"])
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                            added.append(item)
+                    return added
+
+                if skip_clicks:
+                    processed = len(captured_responses)
+                    print(f"[INFO] 체크포인트에서 재개: '리뷰 더보기' {skip_clicks}회 재실행")
+                else:
+                    first_items = await drain()
+                    if first_items:
+                        yield first_items, CrawlCursor(strategy="network", more_clicks=0)
+
+                while True:
+                    try:
+                        more_match = await aprobe_selectors(review_frame, [LOAD_MORE_BUTTON_SELECTOR], enabled=True)
+                        if not more_match:
+                            print("[INFO] '리뷰 더보기' 버튼이 비활성화되었습니다. (모든 리뷰 로드 완료)")
+                            break
+                        more_button = more_match.locator(review_frame)
+
+                        await get_rate_limiter().aacquire("elevenst")
+                        started = time.perf_counter()
+                        async with page.expect_response(
+                            lambda r: ELEVENST_REVIEW_RESPONSE_PATTERN in r.url, timeout=WAIT_TIMEOUT_MS
+                        ) as response_info:
+                            await more_button.click(timeout=10000)
+                        response = await response_info.value
+                        await response.finished()
+                    except PWTimeout:
+                        print("[INFO] 더보기 응답이 오지 않았습니다. (모든 리뷰 로드 완료)")
+                        break
+                    except Exception as e:
+                        print(f"[WARNING] '리뷰 더보기' 응답 처리 중 오류 발생: {e}. 루프 종료.")
+                        break
+
+                    await get_crawl_controller().areport_response(
+                        "elevenst", response.status, time.perf_counter() - started
+                    )
+                    clicks += 1
+                    if clicks <= skip_clicks:
+                        processed = len(captured_responses)
+                        continue
+
+                    added = await drain()
+                    print(f"[INFO] '리뷰 더보기' 응답 수신: 신규 {len(added)}개")
+                    if not added:
+                        break
+                    yield added, CrawlCursor(strategy="network", more_clicks=clicks)
+        except CrawlBlockedError:
+            invalidate_storage_state("elevenst")
+            raise
+        finally:
+            print(f"[ENGINE] {engine.get_stats()}")
+            print(f"[FILTER] {request_filter.summary()}")
+            print(f"[CACHE] {asset_cache.summary()}")
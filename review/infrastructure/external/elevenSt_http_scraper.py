@@ -0,0 +1,187 @@
+"""
+11st HTTP Scraper Adapter
+브라우저 없이 리뷰 iframe 엔드포인트를 직접 페이지 단위로 호출하는 11번가 리뷰 크롤러
+- 실패 시에만 Playwright 어댑터(ElevenStScraperAdapter)로 폴백
+"""
+import os
+import re
+import time
+from typing import Dict, Iterator, List, Optional
+
+import httpx
+
+from config.scraper_config import (
+    ELEVENST_REVIEW_LIST_URL, ELEVENST_HTTP_PAGE_SIZE, ELEVENST_HTTP_MAX_PAGES,
+    HTTP_TIMEOUT_SECONDS, HTTP_MAX_CONNECTIONS, HTTP_USER_AGENT,
+)
+from review.application.port.scraper_port import ScraperPort, ReviewBatch
+from product.domain.entity.product import Product
+from review.domain.entity.review import Review, ReviewPlatform
+from review.domain.entity.crawl_watermark import CrawlWatermark
+from review.domain.entity.crawl_cursor import CrawlCursor
+from review.domain.entity.review_summary import ReviewSummary
+from review.infrastructure.external.elevenSt_scraper import (
+    ElevenStScraperAdapter, parse_11st_review_html, to_11st_review_entities
+)
+from review.infrastructure.external.phase_timer import timed_phase
+from review.infrastructure.external.rate_limiter import get_rate_limiter
+from review.infrastructure.external.crawl_controller import CrawlBlockedError, get_crawl_controller
+from review.infrastructure.external import fixture_replay
+from review.infrastructure.external.snapshot_archive import get_snapshot_recorder
+
+# 리뷰 목록 페이지임을 판별하는 마커 (리뷰 0건 페이지와 차단/오류 페이지 구분)
+REVIEW_PAGE_MARKERS = ('review-list-page-area', 'review_list_element')
+# 첫 페이지가 이 상태면 엔드포인트 추정이 틀렸거나 직접 호출만 막힌 것으로 보고 브라우저로 폴백 (차단 보고 안 함)
+FAST_PATH_REJECT_STATUSES = (403, 404)
+# 리뷰 목록 응답에 포함된 전체 리뷰 수 (없으면 첫 페이지 비교만으로 판단)
+REVIEW_TOTAL_PATTERN = re.compile(r'(?:reviewTotCnt|totalCount|totCnt|reviewCount)["\']?\s*[:=]\s*["\']?([\d,]+)')
+
+# 프로세스 단위 keep-alive 클라이언트
+_client: Optional[httpx.Client] = None
+_client_pid: Optional[int] = None
+_client_fixture_mode: Optional[str] = None
+
+
+def get_http_client() -> httpx.Client:
+    global _client, _client_pid, _client_fixture_mode
+    if _client is None or _client_pid != os.getpid() or _client_fixture_mode != fixture_replay.fixture_mode():
+        _client = httpx.Client(
+            timeout=HTTP_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+            ),
+            headers={
+                "User-Agent": HTTP_USER_AGENT,
+                "Referer": "https://www.11st.co.kr/",
+                "Accept-Language": "ko-KR,ko;q=0.9",
+            },
+            follow_redirects=True,
+            **fixture_replay.http_client_options("elevenst"),
+        )
+        _client_pid = os.getpid()
+        _client_fixture_mode = fixture_replay.fixture_mode()
+    return _client
+
+
+class ElevenStHttpFastPathError(Exception):
+    """HTTP 직접 호출 경로 실패 (브라우저 폴백 트리거)"""
+
+
+class ElevenStHttpScraperAdapter(ScraperPort):
+    """
+    11번가 리뷰 HTTP 스크래퍼
+    - iframe 콘텐츠를 내려주는 엔드포인트를 page 파라미터로 순회
+    - 파싱/엔티티 변환은 Playwright 어댑터와 동일한 매핑 사용
+    """
+
+    def __init__(self, fallback: Optional[ScraperPort] = None):
+        self.fallback = fallback or ElevenStScraperAdapter(mode="network")
+
+    def iter_review_batches(self, product: Product, watermark: Optional[CrawlWatermark] = None,
+                            resume_from: Optional[CrawlCursor] = None) -> Iterator[ReviewBatch]:
+        if product.source.value != ReviewPlatform.ELEVENST.value:
+            raise ValueError(f"지원하지 않는 플랫폼: {product.source}")
+
+        try:
+            product_code = int(product.source_product_id)
+        except ValueError:
+            raise ValueError("product_id는 11번가 상품 코드(정수)여야 합니다.")
+
+        start_page = 1
+        if resume_from is not None and resume_from.applies_to("http"):
+            start_page = resume_from.page + 1
+            print(f"[INFO] 11번가 HTTP 체크포인트에서 재개: {start_page}페이지부터")
+
+        total = 0
+        try:
+            for batch in self._iter_pages(product_code, product.source, watermark, start_page):
+                total += len(batch.reviews)
+                yield batch
+        except (httpx.HTTPError, ElevenStHttpFastPathError) as e:
+            if total:
+                # 이미 배치를 넘겼으면 폴백하지 않음 → 브라우저가 처음부터 다시 돌지 않고 체크포인트에서 재시도
+                raise
+            print(f"[WARNING] 11번가 HTTP 경로 실패 → 브라우저로 폴백: {e}")
+            yield from self.fallback.iter_review_batches(product, watermark=watermark, resume_from=resume_from)
+            return
+
+        print(f"[INFO] 11번가 HTTP 경로로 {total}개 리뷰 수집")
+
+    def preflight(self, product: Product) -> Optional[ReviewSummary]:
+        """리뷰 목록 1페이지만 HTTP 로 받아 최신 리뷰(와 응답에 있으면 전체 리뷰 수) 확인"""
+        try:
+            product_code = int(product.source_product_id)
+            get_rate_limiter().acquire("elevenst")
+            html = self._fetch_page(product_code, 1, first=True)
+        except (ValueError, httpx.HTTPError, ElevenStHttpFastPathError, CrawlBlockedError) as e:
+            # 차단도 사전 확인 실패일 뿐 → 전체 크롤링(이후 차단되면 그쪽에서 재시도)에 맡김
+            print(f"[WARNING] 11번가 사전 확인 실패: {e}")
+            return None
+        if not any(marker in html for marker in REVIEW_PAGE_MARKERS):
+            return None
+
+        reviews = to_11st_review_entities(parse_11st_review_html(html), product_code, product.source)
+        total_match = REVIEW_TOTAL_PATTERN.search(html)
+        return ReviewSummary(
+            total_count=int(total_match.group(1).replace(",", "")) if total_match else None,
+            newest_review_at=max((r.review_at for r in reviews), default=None),
+            first_page=reviews,
+        )
+
+    @timed_phase("navigation")
+    def _fetch_page(self, product_code: int, page: int, first: bool = False) -> str:
+        """first: 이 경로의 첫 요청 (403/404 면 ElevenStHttpFastPathError → 브라우저 폴백)"""
+        url = ELEVENST_REVIEW_LIST_URL.format(
+            product_code=product_code, page=page, page_size=ELEVENST_HTTP_PAGE_SIZE
+        )
+        controller = get_crawl_controller()
+        started = time.perf_counter()
+        try:
+            response = get_http_client().get(url)
+        except httpx.TimeoutException:
+            controller.report_timeout("elevenst")
+            raise
+        if first and response.status_code in FAST_PATH_REJECT_STATUSES:
+            raise ElevenStHttpFastPathError(f"첫 페이지 HTTP {response.status_code}")
+        # 이후 429/403 은 브라우저 폴백 대신 CrawlBlockedError 로 중단 (같은 차단을 브라우저로 반복하지 않음)
+        controller.report_response("elevenst", response.status_code, time.perf_counter() - started, str(response.url))
+        response.raise_for_status()
+        return response.text
+
+    def _iter_pages(self, product_code: int, platform, watermark: Optional[CrawlWatermark] = None,
+                    start_page: int = 1) -> Iterator[ReviewBatch]:
+        seen = set()
+        archive = get_snapshot_recorder("elevenst", product_code)
+
+        for page in range(start_page, ELEVENST_HTTP_MAX_PAGES + 1):
+            get_rate_limiter().acquire("elevenst")
+            html = self._fetch_page(product_code, page, first=page == start_page)
+            if archive:
+                archive.add(html, "11st_html", page=page)
+            items = parse_11st_review_html(html)
+
+            if page == start_page and not items and not any(marker in html for marker in REVIEW_PAGE_MARKERS):
+                raise ElevenStHttpFastPathError("리뷰 목록 마커가 없는 응답")
+
+            new_items: List[Dict[str, str]] = []
+            for item in items:
+                key = (item["user_id"], item["date"], item["content"])
+                if key in seen:
+                    continue
+                seen.add(key)
+                new_items.append(item)
+
+            print(f"  [INFO] 11번가 HTTP 페이지 {page}: {len(new_items)}개")
+            # 빈 페이지 또는 이전 페이지 반복(마지막 페이지 이후) → 종료
+            if not new_items:
+                break
+
+            page_reviews = to_11st_review_entities(new_items, product_code, platform)
+
+            # 증분 크롤링: 페이지 전체가 이미 저장된 리뷰면 종료
+            if watermark is not None and watermark.is_page_known(page_reviews):
+                print(f"  [INFO] 페이지 {page}는 모두 기존 리뷰 (증분 크롤링 종료)")
+                break
+
+            yield ReviewBatch(page=page, reviews=page_reviews, cursor=CrawlCursor(strategy="http", page=page))
@@ -1,22 +1,170 @@
+import json
 import time
-import random
-from typing import Dict, Any, List, Optional
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright, TimeoutError as PWTimeout
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from playwright.sync_api import TimeoutError as PWTimeout
 from datetime import datetime
 
-from review.application.port.scraper_port import ScraperPort
+from review.application.port.scraper_port import ScraperPort, ReviewBatch
 from product.domain.entity.product import Product
 from review.domain.entity.review import Review, ReviewPlatform
+from review.domain.entity.crawl_watermark import CrawlWatermark
+from review.domain.entity.crawl_cursor import CrawlCursor
+from config.scraper_config import ELEVENST_CRAWL_MODE, ELEVENST_REVIEW_RESPONSE_PATTERN
+from review.infrastructure.external.browser_pool import get_browser_pool
+from review.infrastructure.external.request_filter import RequestFilter
+from review.infrastructure.external.browser_cache import (
+    AssetCache, storage_state_options, save_storage_state, invalidate_storage_state
+)
+from review.infrastructure.external.review_extractor import ELEVENST_ITEM_CSS, extract_11st_items
+from review.infrastructure.external.selector_probe import probe_selectors
+from review.infrastructure.external.phase_timer import phase, timed_phase
+from review.infrastructure.external import fixture_replay
+from review.infrastructure.external.snapshot_archive import SnapshotRecorder, get_snapshot_recorder
+from review.infrastructure.external.page_waiter import (
+    wait_for_selector, count_elements, wait_for_count_increase, wait_for_response
+)
+from review.infrastructure.external.rate_limiter import get_rate_limiter
+from review.infrastructure.external.crawl_controller import (
+    CrawlBlockedError, get_crawl_controller, goto_and_report
+)
+
+
+# 11번가 리뷰 아이템 셀렉터 (iframe 전체 / 응답 조각 공통)
+REVIEW_ITEM_CSS = ELEVENST_ITEM_CSS
+# 긴 리뷰 펼치기 버튼 (리뷰 아이템 내부)
+MORE_TEXT_BUTTON_CSS = 'button.review-expand-open-text'
+# 긴 리뷰 전체 본문 (펼치기 전에는 숨김 상태, 펼치면 text-expanded 클래스 추가)
+LONG_REVIEW_TEXT_CSS = 'p.cont_review_hide'
+
+# start~end 번째 아이템 중 전체 본문이 아직 없는 긴 리뷰의 '더보기' 버튼을 한 번에 클릭
+EXPAND_LONG_REVIEWS_JS = """
+([itemSel, start, end, buttonSel, textSel]) => {
+    let clicked = 0, ready = 0;
+    for (const item of Array.from(document.querySelectorAll(itemSel)).slice(start, end)) {
+        const button = item.querySelector(buttonSel);
+        if (!button) continue;
+        const full = item.querySelector(textSel);
+        if (full && (full.textContent || '').trim()) { ready++; continue; }
+        if (button.disabled) continue;
+        button.click();
+        clicked++;
+    }
+    return {clicked, ready};
+}
+"""
+
+# 펼치기 버튼이 있는데 전체 본문이 아직 비어 있는 아이템 수 (0이면 펼치기 완료)
+COUNT_PENDING_LONG_REVIEWS_JS = """
+([itemSel, start, end, buttonSel, textSel]) => Array.from(document.querySelectorAll(itemSel))
+    .slice(start, end)
+    .filter(item => item.querySelector(buttonSel))
+    .filter(item => {
+        const full = item.querySelector(textSel);
+        return !full || !(full.classList.contains('text-expanded') || (full.textContent || '').trim());
+    }).length
+"""
+
+
+@timed_phase("extraction")
+def parse_11st_review_html(html: str, product_title: Optional[str] = None,
+                           store_name: Optional[str] = None) -> List[Dict[str, str]]:
+    """
+    11번가 리뷰 목록 HTML(iframe body 또는 XHR 조각)을 리뷰 dict 리스트로 변환
+    (파싱은 html_backend 의 설치된 가장 빠른 파서 사용)
+    """
+    return [
+        dict(item, product_title=product_title, store_name=store_name)
+        for item in extract_11st_items(html)
+    ]
+
+
+def _find_review_html_fragments(payload: Any) -> List[str]:
+    """JSON 응답 안에서 리뷰 목록 HTML 조각(문자열)을 재귀적으로 찾는다."""
+    if isinstance(payload, str):
+        return [payload] if 'review_list_element' in payload else []
+    if isinstance(payload, dict):
+        payload = list(payload.values())
+    if isinstance(payload, list):
+        fragments: List[str] = []
+        for value in payload:
+            fragments.extend(_find_review_html_fragments(value))
+        return fragments
+    return []
+
+
+@timed_phase("extraction")
+def parse_11st_review_body(body: str, content_type: str, product_title: Optional[str] = None,
+                           store_name: Optional[str] = None) -> List[Dict[str, str]]:
+    """리뷰 목록 응답 본문(JSON 또는 HTML 조각)을 리뷰 dict 리스트로 변환"""
+    if "json" in content_type:
+        try:
+            fragments = _find_review_html_fragments(json.loads(body))
+        except ValueError:
+            fragments = []
+        items: List[Dict[str, str]] = []
+        for fragment in fragments:
+            items.extend(parse_11st_review_html(fragment, product_title, store_name))
+        return items
+
+    return parse_11st_review_html(body, product_title, store_name)
 
-HEADLESS = True
+
+def _items_html_since(review_frame, item_selector: str, start: int) -> str:
+    """start 번째 이후 리뷰 아이템의 outerHTML (더보기로 새로 붙은 아이템만)"""
+    return review_frame.evaluate(
+        "([sel, n]) => Array.from(document.querySelectorAll(sel)).slice(n).map(e => e.outerHTML).join('')",
+        [item_selector, start],
+    )
+
+
+@timed_phase("entities")
+def to_11st_review_entities(reviews_data: List[Dict[str, str]], product_code: int, platform) -> List[Review]:
+    """parse_11st_review_html 결과를 Review 도메인 엔티티로 변환"""
+    reviews = []
+    for item in reviews_data:  # ⭐️ limit 없이 모든 리뷰 처리
+        try:
+            # rating 문자열 ('X점') 처리
+            rating_str = item.get("rating", "0점").replace('점', '').strip()
+            rating = float(rating_str)
+
+            # date 문자열 처리 (11번가는 'YYYY.MM.DD' 형식으로 가정)
+            date_text = item.get("date", datetime.utcnow().strftime('%Y.%m.%d'))
+            if date_text == "날짜 정보 없음":
+                review_at = datetime.utcnow()
+            else:
+                review_at = datetime.strptime(date_text, '%Y.%m.%d')
+
+            review_entity = Review.create_from_crawler(
+                product_id=str(product_code),  # ⭐️ ORM과 통일하기 위해 str로 저장
+                platform=platform,
+                content=item["content"],
+                reviewer=item["user_id"],
+                rating=rating,
+                review_at=review_at
+            )
+            reviews.append(review_entity)
+        except Exception as e:
+            print(f"[WARNING] 리뷰 엔티티 변환 실패: {e} / Data: {item}")
+            continue
+
+    return reviews
 
 
 # ⭐️ ScraperPort 상속 추가
 class ElevenStScraperAdapter(ScraperPort):
 
-    # ⭐️ ScraperPort의 fetch_reviews 구현 (limit 제거)
-    def fetch_reviews(self, product: Product) -> List[Review]:
+    def __init__(self, mode: str = ELEVENST_CRAWL_MODE):
+        # "network": 리뷰 iframe의 XHR/fetch 응답을 도착 즉시 파싱
+        # "dom": '리뷰 더보기' 클릭마다 새로 붙은 리뷰 아이템만 파싱
+        # ("http" 는 ElevenStHttpScraperAdapter 담당 → 브라우저 경로에서는 network 로 동작)
+        self.mode = mode if mode in ("network", "dom") else "network"
+
+    # 사전 확인(preflight)은 HTTP 모드(ElevenStHttpScraperAdapter)에서만
+    # → 추정 엔드포인트가 막혀 있을 수 있는 브라우저 모드에서는 ScraperPort 기본값(None)으로 전체 크롤링
+
+    # ⭐️ ScraperPort의 iter_review_batches 구현 (더보기 1회 = 배치 1개)
+    def iter_review_batches(self, product: Product, watermark: Optional[CrawlWatermark] = None,
+                            resume_from: Optional[CrawlCursor] = None) -> Iterator[ReviewBatch]:
 
         # 11번가 전용 로직
         if product.source.value != ReviewPlatform.ELEVENST.value:
@@ -28,77 +176,71 @@ class ElevenStScraperAdapter(ScraperPort):
         except ValueError:
             raise ValueError("product_id는 11번가 상품 코드(정수)여야 합니다.")
 
-        result = self._crawl_11st_reviews(product_code)  # ⭐️ 내부 메서드 호출
-
-        if 'error' in result:
-            print(f"[ERROR] 크롤링 오류: {result['error']}")
-            return []
-
-        reviews_data = result.get("reviews", [])
-
-        # 도메인 엔티티로 변환하여 반환
-        reviews = []
-        for item in reviews_data:  # ⭐️ limit 없이 모든 리뷰 처리
-            try:
-                # rating 문자열 ('X점') 처리
-                rating_str = item.get("rating", "0점").replace('점', '').strip()
-                rating = float(rating_str)
-
-                # date 문자열 처리 (11번가는 'YYYY.MM.DD' 형식으로 가정)
-                date_text = item.get("date", datetime.utcnow().strftime('%Y.%m.%d'))
-                if date_text == "날짜 정보 없음":
-                    review_at = datetime.utcnow()
-                else:
-                    review_at = datetime.strptime(date_text, '%Y.%m.%d')
-
-                review_entity = Review.create_from_crawler(
-                    product_id=str(product_code),  # ⭐️ ORM과 통일하기 위해 str로 저장
-                    platform=product.source,
-                    content=item["content"],
-                    reviewer=item["user_id"],
-                    rating=rating,
-                    review_at=review_at
-                )
-                reviews.append(review_entity)
-            except Exception as e:
-                print(f"[WARNING] 리뷰 엔티티 변환 실패: {e} / Data: {item}")
+        page = 0
+        for items, cursor in self._iter_11st_review_pages(product_code, resume_from):  # ⭐️ 내부 제너레이터 호출
+            # 도메인 엔티티로 변환하여 배치 단위로 반환
+            reviews = to_11st_review_entities(items, product_code, product.source)
+            if not reviews:
                 continue
+            page += 1
+
+            # 증분 크롤링: 한 페이지(더보기 단위) 전체가 이미 저장된 리뷰면 순회 중단
+            if watermark is not None and watermark.is_page_known(reviews):
+                print(f"[INFO] {page}번째 묶음이 모두 기존 리뷰입니다. (증분 크롤링 종료)")
+                return
 
-        return reviews
+            yield ReviewBatch(page=page, reviews=reviews, cursor=cursor)
 
-    # ⭐️ 기존 crawl_11st_reviews 함수를 내부 인스턴스 메서드로 변경
-    def _crawl_11st_reviews(self, product_code: int) -> Dict[str, Any]:
+    # ⭐️ 기존 crawl_11st_reviews 함수를 페이지 단위 제너레이터로 변경
+    def _iter_11st_review_pages(self, product_code: int, resume_from: Optional[CrawlCursor] = None
+                                ) -> Iterator[Tuple[List[Dict[str, str]], CrawlCursor]]:
+        """(리뷰 dict 리스트, 재개 지점) 을 더보기 단위로 yield"""
         url = f"https://www.11st.co.kr/products/{product_code}"
-        all_reviews: List[Dict[str, str]] = []
         store_name: Optional[str] = None
         product_title: Optional[str] = None
+        total = 0
 
         IFRAME_SELECTOR = '#ifrmReview'
         REVIEWS_CONTAINER = '#review-list-page-area'
         LOAD_MORE_BUTTON_SELECTOR = 'button.c_product_btn_more8'
         STORE_NAME_SELECTOR = 'a[data-log-actionid-label="store_go"]'
         TITLE_SELECTOR = 'h1.title'
-        REVIEW_ITEM_SELECTOR = f'{REVIEWS_CONTAINER} li.review_list_element'
-        MORE_TEXT_BUTTON_SELECTOR = f'{REVIEWS_CONTAINER} button.review-expand-open-text'
+        REVIEW_ITEM_SELECTOR = f'{REVIEWS_CONTAINER} {REVIEW_ITEM_CSS}'
 
         print(f"--- 11번가 리뷰 크롤링 시작 (Playwright) ---")
         print(f"--- 대상 URL: {url} ---")
 
-        browser = None
+        pool = get_browser_pool()
+        request_filter = RequestFilter()
+        asset_cache = AssetCache()
+        # network 모드: 리뷰 목록 응답을 이벤트로 수집 (핸들러 안에서는 참조만 보관)
+        captured_responses: List[Any] = []
+
+        def on_response(response):
+            if ELEVENST_REVIEW_RESPONSE_PATTERN in response.url and \
+                    response.request.resource_type in ("document", "xhr", "fetch"):
+                captured_responses.append(response)
 
         try:
-            with sync_playwright() as p:
-                # 1. 브라우저 시작 (Chromium 사용)
-                browser = p.chromium.launch(headless=HEADLESS)
-                page = browser.new_page()
+            # 1. 풀에서 브라우저 컨텍스트 발급 (Chromium 재사용)
+            with pool.new_context(**fixture_replay.context_options("elevenst", product_code),
+                                  **storage_state_options("elevenst")) as context:
+                asset_cache.install(context)  # JS/CSS 번들은 디스크 캐시에서 (필터 통과분만)
+                request_filter.install(context)  # 이미지/폰트/광고 등 불필요한 리소스 차단
+                fixture_replay.install_replay(context, "elevenst", product_code)  # replay 모드: HAR 로 응답
+                page = context.new_page()
+                if self.mode == "network":
+                    page.on("response", on_response)
 
                 # 2. 타임아웃 설정
                 page.set_default_navigation_timeout(30000)
                 page.set_default_timeout(20000)
 
                 # 3. URL 접속
-                page.goto(url)
-                page.wait_for_load_state("networkidle")
+                get_rate_limiter().acquire("elevenst")
+                with phase("navigation"):
+                    goto_and_report(page, url, "elevenst")  # 차단(429/403/캡차)이면 CrawlBlockedError
+                    page.wait_for_load_state("networkidle")
 
                 # 상품명/상호명 추출
                 try:
@@ -115,104 +257,256 @@ class ElevenStScraperAdapter(ScraperPort):
                     review_tab.scroll_into_view_if_needed()
                     review_tab.click()
                     print("[INFO] 리뷰 탭 클릭 성공. iframe 로드 대기.")
-                    time.sleep(random.uniform(4, 6))
                 except PWTimeout:
-                    print("[ERROR] 리뷰 탭을 찾지 못했습니다.")
-                    return {"error": "리뷰 탭 로드 실패"}
+                    print("[ERROR] 리뷰 탭을 찾지 못했습니다. (리뷰 탭 로드 실패)")
+                    return
 
-                # 5. iframe 전환 (FrameLocator 확보)
+                # 5. iframe 전환 (Frame 확보 → evaluate 기반 대기 사용)
                 try:
-                    review_frame_locator = page.frame_locator(IFRAME_SELECTOR)
+                    iframe_element = page.wait_for_selector(IFRAME_SELECTOR, state="attached")
+                    review_frame = iframe_element.content_frame()
+                    if review_frame is None:
+                        raise RuntimeError("content_frame 없음")
                     print("[INFO] iframe 전환 성공. 리뷰 목록 로드 대기.")
                 except Exception:
-                    print(f"[FATAL ERROR] iframe ({IFRAME_SELECTOR})을 찾지 못했습니다.")
-                    return {"error": "iframe 전환 실패"}
-
-                while True:
-                    try:
-                        more_button = review_frame_locator.locator(LOAD_MORE_BUTTON_SELECTOR)
-
-                        if more_button.is_visible(timeout=10000) and more_button.is_enabled():
-                            more_button.click(timeout=10000)
-                            print("[INFO] '리뷰 더보기' 버튼 클릭 성공. 추가 리뷰 로드 대기.")
-                            time.sleep(random.uniform(5, 8))
-                        else:
-                            print("[INFO] '리뷰 더보기' 버튼이 비활성화되었습니다. (모든 리뷰 로드 완료)")
-                            break
-                    except PWTimeout:
-                        print("[INFO] '리뷰 더보기' 버튼을 찾지 못했습니다. (모든 리뷰 로드 완료)")
-                        break
-                    except Exception as e:
-                        print(f"[WARNING] '리뷰 더보기' 클릭 중 오류 발생: {e}. 루프 종료.")
-                        break
-
-                # 7. 개별 리뷰 '더보기' 버튼 클릭 (긴 리뷰 전체 내용 확보)
-                print(">>> 전체 리뷰 데이터 추출 시작...")
-                try:
-                    more_text_buttons = review_frame_locator.locator(MORE_TEXT_BUTTON_SELECTOR).all()
-                    if more_text_buttons:
-                        print(f"  [INFO] 긴 리뷰 '더보기' 버튼 {len(more_text_buttons)}개 발견. 클릭 시도...")
-                        for button in more_text_buttons:
-                            try:
-                                if button.is_visible(timeout=1000) and button.is_enabled():
-                                    button.click(timeout=1000)
-                            except Exception:
-                                pass
-                        print("  [INFO] 모든 긴 리뷰 '더보기' 버튼 클릭 완료.")
-                        time.sleep(1)
+                    print(f"[FATAL ERROR] iframe ({IFRAME_SELECTOR})을 찾지 못했습니다. (iframe 전환 실패)")
+                    return
+
+                if not wait_for_selector(review_frame, REVIEW_ITEM_SELECTOR, state="attached"):
+                    print("[WARNING] 리뷰 목록이 제한 시간 내 나타나지 않았습니다.")
+                else:
+                    save_storage_state(context, "elevenst")  # 리뷰까지 정상 로드된 세션 (주기마다 갱신)
+
+                # 원본 스냅샷 보관 (켜져 있을 때만, 재파싱용)
+                archive = get_snapshot_recorder("elevenst", product_code)
+
+                # 6-A. network 모드: 응답 조각을 도착하는 대로 파싱 (DOM 재직렬화 없음)
+                if self.mode == "network":
+                    skip_clicks = resume_from.more_clicks if resume_from and resume_from.applies_to("network") else 0
+                    for items, cursor in self._iter_via_network(
+                        page, review_frame, captured_responses, LOAD_MORE_BUTTON_SELECTOR,
+                        product_title, store_name, skip_clicks, archive
+                    ):
+                        total += len(items)
+                        yield items, cursor
+                    if total:
+                        print(f"[INFO] network 모드로 {total}개 리뷰 수집")
+                    elif skip_clicks:
+                        # 체크포인트 이후 새 리뷰가 없음 → 이미 끝까지 저장된 것 (DOM 으로 처음부터 다시 돌지 않음)
+                        print(f"[INFO] 체크포인트('리뷰 더보기' {skip_clicks}회) 이후 새 리뷰 없음 - 수집 완료")
                     else:
-                        print("  [INFO] 긴 리뷰 '더보기' 버튼을 찾지 못했습니다.")
-                except Exception as e:
-                    print(f"  [WARNING] 개별 리뷰 '더보기' 클릭 로직 오류 발생: {e}")
-
-                # 8. BeautifulSoup으로 전체 리뷰 데이터 파싱
-                iframe_html = review_frame_locator.locator('body').inner_html()
-                soup = BeautifulSoup(iframe_html, 'html.parser')
-                # ⭐️ 기존 리뷰 목록 전체를 다시 파싱합니다. (이전 수집된 all_reviews는 무시)
-                reviews = soup.select(REVIEW_ITEM_SELECTOR)
-
-                for review in reviews:
-                    try:
-                        content_tag = review.select_one('p.cont_review_hide.text-expanded')
-                        content = content_tag.get_text('\n', strip=True) if content_tag else "리뷰 내용 없음"
-
-                        if content.strip() == "리뷰 내용 없음":
-                            continue
-
-                        user_id_tag = review.select_one('dl.c_product_reviewer dt.name')
-                        # data-nick 속성이나, 텍스트를 사용
-                        user_id = user_id_tag.get('data-nick', user_id_tag.text).strip() if user_id_tag else "ID_ERROR"
-
-                        # 평점 'X점'에서 숫자만 추출
-                        rating_text = review.select_one('p.grade em').text.strip().replace('점', '')
-
-                        option_tag = review.select_one('dl.option_set dd')
-                        option = option_tag.text.strip() if option_tag else "옵션 정보 없음"
-                        date_tag = review.select_one('p.side span.date')
-                        date_text = date_tag.text.strip() if date_tag else "날짜 정보 없음"
-
-                        all_reviews.append({
-                            "product_title": product_title,
-                            "store_name": store_name,
-                            "user_id": user_id,
-                            "rating": rating_text,  # 숫자만 남긴 문자열
-                            "option": option,
-                            "content": content,
-                            "date": date_text
-                        })
-                    except Exception as e:
-                        print(f"  [WARNING] 개별 리뷰 추출 실패: {e}")
-                        continue
+                        print("[WARNING] network 모드 수집 실패 → DOM 파싱으로 전환")
 
-                browser.close()
+                # 6-B. dom 모드 (또는 network 모드 실패 시): 더보기마다 새 아이템만 파싱
+                if not total and not (self.mode == "network" and skip_clicks):
+                    skip_clicks = resume_from.more_clicks if resume_from and resume_from.applies_to("dom") else 0
+                    for items, cursor in self._iter_via_dom(
+                        review_frame, REVIEW_ITEM_SELECTOR, LOAD_MORE_BUTTON_SELECTOR,
+                        product_title, store_name, skip_clicks, archive
+                    ):
+                        total += len(items)
+                        yield items, cursor
+
+                fixture_replay.save_html_snapshot(review_frame, "elevenst", product_code)
 
         except Exception as e:
+            # 이미 넘긴 배치는 호출 측에서 저장됨 → 오류는 그대로 올려 재시도에 맡긴다
             print(f"[FATAL ERROR] 크롤링 중 치명적인 오류 발생: {e}")
-            if browser:
-                try:
-                    browser.close()
-                except Exception:
-                    pass
+            if isinstance(e, CrawlBlockedError):
+                invalidate_storage_state("elevenst")
+            raise
+        finally:
+            print(f"[POOL] {pool.get_stats()}")
+            print(f"[FILTER] {request_filter.summary()}")
+            print(f"[CACHE] {asset_cache.summary()}")
+            print(f"[RATE] {get_rate_limiter().get_stats()}")
+            print(f"[AIMD] {get_crawl_controller().get_stats()}")
+
+    def _iter_via_network(self, page, review_frame, captured_responses: List[Any], more_button_selector: str,
+                          product_title: Optional[str], store_name: Optional[str], skip_clicks: int = 0,
+                          archive: Optional[SnapshotRecorder] = None
+                          ) -> Iterator[Tuple[List[Dict[str, str]], CrawlCursor]]:
+        """
+        '리뷰 더보기' 클릭마다 새로 도착한 응답만 파싱해 yield (페이지당 O(신규 아이템))
+        skip_clicks: 체크포인트 재개 시 파싱 없이 다시 누를 더보기 횟수 (이미 저장된 구간)
+        archive: 응답 본문 보관 (재파싱용)
+        """
+        seen = set()
+        processed = 0
+        collected = 0
+        clicks = 0
+
+        def drain() -> List[Dict[str, str]]:
+            nonlocal processed
+            added: List[Dict[str, str]] = []
+            while processed < len(captured_responses):
+                response = captured_responses[processed]
+                processed += 1
+                for item in self._parse_review_response(response, product_title, store_name, archive):
+                    key = (item["user_id"], item["date"], item["content"])
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    added.append(item)
+            return added
+
+        # 최초 iframe 문서 응답
+        if skip_clicks:
+            processed = len(captured_responses)  # 이미 저장된 구간 → 파싱 생략
+            print(f"[INFO] 체크포인트에서 재개: '리뷰 더보기' {skip_clicks}회 재실행")
+        else:
+            first_items = drain()
+            if first_items:
+                collected += len(first_items)
+                yield first_items, CrawlCursor(strategy="network", more_clicks=0)
+
+        while True:
+            try:
+                # 보이는지/활성인지 한 번의 evaluate 로 확인
+                more_match = probe_selectors(review_frame, [more_button_selector], enabled=True)
+                if not more_match:
+                    print("[INFO] '리뷰 더보기' 버튼이 비활성화되었습니다. (모든 리뷰 로드 완료)")
+                    break
+                more_button = more_match.locator(review_frame)
+
+                get_rate_limiter().acquire("elevenst")
+                started = time.perf_counter()
+                response = wait_for_response(
+                    page,
+                    lambda response_url: ELEVENST_REVIEW_RESPONSE_PATTERN in response_url,
+                    lambda: more_button.click(timeout=10000),
+                )
+                if response is None:
+                    print("[INFO] 더보기 응답이 오지 않았습니다. (모든 리뷰 로드 완료)")
+                    break
+                get_crawl_controller().report_response("elevenst", response.status, time.perf_counter() - started)
+                clicks += 1
+
+                if clicks <= skip_clicks:
+                    processed = len(captured_responses)
+                    continue
+
+                added = drain()
+                collected += len(added)
+                print(f"[INFO] '리뷰 더보기' 응답 수신: 신규 {len(added)}개 (누적 {collected}개)")
+                if not added:
+                    break
+            except PWTimeout:
+                print("[INFO] '리뷰 더보기' 버튼을 찾지 못했습니다. (모든 리뷰 로드 완료)")
+                break
+            except CrawlBlockedError:
+                raise
+            except Exception as e:
+                print(f"[WARNING] '리뷰 더보기' 응답 처리 중 오류 발생: {e}. 루프 종료.")
+                break
+
+            yield added, CrawlCursor(strategy="network", more_clicks=clicks)
 
-        return {"count": len(all_reviews), "reviews": all_reviews, "store_name": store_name,
-                "product_title": product_title}
\ No newline at end of file
+    def _parse_review_response(self, response, product_title: Optional[str], store_name: Optional[str],
+                               archive: Optional[SnapshotRecorder] = None) -> List[Dict[str, str]]:
+        """리뷰 목록 응답(JSON 또는 HTML 조각)을 리뷰 dict 리스트로 변환"""
+        try:
+            body = response.text()
+        except Exception as e:
+            print(f"  [WARNING] 응답 본문 읽기 실패: {e}")
+            return []
+
+        content_type = (response.headers or {}).get("content-type", "")
+        if archive:
+            archive.add(body, "11st_body", content_type=content_type)
+        return parse_11st_review_body(body, content_type, product_title, store_name)
+
+    def _iter_via_dom(self, review_frame, review_item_selector: str, more_button_selector: str,
+                      product_title: Optional[str], store_name: Optional[str], skip_clicks: int = 0,
+                      archive: Optional[SnapshotRecorder] = None
+                      ) -> Iterator[Tuple[List[Dict[str, str]], CrawlCursor]]:
+        """
+        '리뷰 더보기' 클릭마다 새로 붙은 아이템만 긴 리뷰를 펼친 뒤 파싱해 yield
+        skip_clicks: 체크포인트 재개 시 파싱 없이 다시 누를 더보기 횟수 (이미 저장된 구간)
+        archive: 새 아이템 HTML 보관 (재파싱용)
+        """
+        start = 0
+        clicks = 0
+
+        if skip_clicks:
+            print(f"[INFO] 체크포인트에서 재개: '리뷰 더보기' {skip_clicks}회 재실행")
+        while clicks < skip_clicks and self._click_more(review_frame, review_item_selector, more_button_selector):
+            clicks += 1
+        if skip_clicks:
+            if clicks < skip_clicks:
+                return  # 재개 지점 이전에 목록이 끝남 → 새로 수집할 리뷰 없음
+            start = count_elements(review_frame, review_item_selector)
+            if not self._click_more(review_frame, review_item_selector, more_button_selector):
+                return
+            clicks += 1
+
+        while True:
+            end = count_elements(review_frame, review_item_selector)
+            if end <= start:
+                break
+
+            # 7. 새 아이템의 긴 리뷰를 한 번에 펼침 (긴 리뷰 전체 내용 확보)
+            self._expand_long_reviews(review_frame, review_item_selector, start, end)
+
+            # 8. 새 아이템의 outerHTML만 파싱
+            items_html = _items_html_since(review_frame, review_item_selector, start)
+            if archive:
+                archive.add(items_html, "11st_html", more_clicks=clicks)
+            yield parse_11st_review_html(items_html, product_title, store_name), \
+                CrawlCursor(strategy="dom", more_clicks=clicks)
+            start = end
+
+            if not self._click_more(review_frame, review_item_selector, more_button_selector):
+                break
+            clicks += 1
+
+    def _click_more(self, review_frame, review_item_selector: str, more_button_selector: str) -> bool:
+        """'리뷰 더보기' 1회 클릭 후 아이템 수 증가까지 대기 (더 이상 로드할 리뷰가 없으면 False)"""
+        try:
+            # 보이는지/활성인지 한 번의 evaluate 로 확인
+            more_match = probe_selectors(review_frame, [more_button_selector], enabled=True)
+            if more_match:
+                more_button = more_match.locator(review_frame)
+                before_count = count_elements(review_frame, review_item_selector)
+                get_rate_limiter().acquire("elevenst")
+                more_button.click(timeout=10000)
+                print("[INFO] '리뷰 더보기' 버튼 클릭 성공. 추가 리뷰 로드 대기.")
+                if wait_for_count_increase(review_frame, review_item_selector, before_count) <= before_count:
+                    print("[INFO] 더보기 후 리뷰 수가 늘지 않았습니다. (모든 리뷰 로드 완료)")
+                    return False
+                return True
+
+            print("[INFO] '리뷰 더보기' 버튼이 비활성화되었습니다. (모든 리뷰 로드 완료)")
+            return False
+        except PWTimeout:
+            print("[INFO] '리뷰 더보기' 버튼을 찾지 못했습니다. (모든 리뷰 로드 완료)")
+            return False
+        except Exception as e:
+            print(f"[WARNING] '리뷰 더보기' 클릭 중 오류 발생: {e}. 루프 종료.")
+            return False
+
+    def _expand_long_reviews(self, review_frame, review_item_selector: str, start: int, end: int) -> None:
+        """
+        start~end 번째 리뷰 아이템의 긴 리뷰를 한 번의 스크립트로 모두 펼침
+        숨김 본문(p.cont_review_hide)에 전체 텍스트가 이미 있으면 클릭하지 않고, 클릭한 아이템은 남은 수가 0이 될 때까지 대기
+        """
+        args = [review_item_selector, start, end, MORE_TEXT_BUTTON_CSS, LONG_REVIEW_TEXT_CSS]
+        try:
+            result = review_frame.evaluate(EXPAND_LONG_REVIEWS_JS, args)
+        except Exception as e:
+            print(f"  [WARNING] 긴 리뷰 펼치기 스크립트 오류 발생: {e}")
+            return
+
+        if not result["clicked"]:
+            return
+        print(f"  [INFO] 긴 리뷰 '더보기' {result['clicked']}개 일괄 클릭 (숨김 본문 사용 {result['ready']}개).")
+        try:
+            review_frame.wait_for_function(f"(args) => ({COUNT_PENDING_LONG_REVIEWS_JS})(args) === 0",
+                                           arg=args, timeout=2000)
+        except PWTimeout:
+            pending = None
+            try:
+                pending = review_frame.evaluate(COUNT_PENDING_LONG_REVIEWS_JS, args)
+            except Exception:
+                pass
+            print(f"  [WARNING] 제한 시간 내 펼쳐지지 않은 긴 리뷰: {pending}개")
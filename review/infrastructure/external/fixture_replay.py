@@ -0,0 +1,195 @@
+"""
+Fixture Replay
+라이브 사이트 없이 스크래퍼를 실행하기 위한 HAR 기록/재생
+- record: BrowserContext 를 record_har_path 로 열어 브라우저 트래픽을 HAR 로 저장하고,
+          httpx 직접 호출(11번가 HTTP 경로, 롯데온 리뷰 API)은 응답 훅으로 별도 HAR 에 추가,
+          수집이 끝난 리뷰 영역 HTML 은 파서 벤치마크용 스냅샷으로 저장
+- replay: 브라우저는 route_from_har 로, httpx 는 HAR 에서 만든 MockTransport 로 응답 (네트워크 없음)
+- 파일: {fixture_dir}/{platform}_{product_code}.har / {platform}_{product_code}.html / {platform}_http.har
+"""
+import os
+import json
+import base64
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from config.scraper_config import SCRAPER_FIXTURE_MODE, SCRAPER_FIXTURE_DIR
+
+FIXTURE_MODES = ("off", "record", "replay")
+
+_mode = SCRAPER_FIXTURE_MODE if SCRAPER_FIXTURE_MODE in FIXTURE_MODES else "off"
+_fixture_dir = SCRAPER_FIXTURE_DIR
+_http_lock = threading.Lock()
+_transport: Optional[httpx.MockTransport] = None
+
+
+def configure(mode: str, fixture_dir: Optional[str] = None) -> None:
+    """실행 중 모드 변경 (벤치마크/기록 명령용)"""
+    global _mode, _fixture_dir, _transport
+    if mode not in FIXTURE_MODES:
+        raise ValueError(f"지원하지 않는 fixture 모드: {mode}")
+    _mode = mode
+    _fixture_dir = fixture_dir or _fixture_dir
+    _transport = None
+
+
+def fixture_mode() -> str:
+    return _mode
+
+
+def har_path(platform: str, product_code: Any) -> str:
+    return os.path.join(_fixture_dir, f"{platform}_{product_code}.har")
+
+
+def http_har_path(platform: str) -> str:
+    return os.path.join(_fixture_dir, f"{platform}_http.har")
+
+
+# ----------------------------------------------------------------------
+# 브라우저 (Playwright)
+# ----------------------------------------------------------------------
+def context_options(platform: str, product_code: Any) -> Dict[str, Any]:
+    """record 모드에서 new_context 에 넘길 HAR 기록 옵션 (HAR 는 컨텍스트가 닫힐 때 기록됨)"""
+    if _mode != "record":
+        return {}
+    os.makedirs(_fixture_dir, exist_ok=True)
+    return {"record_har_path": har_path(platform, product_code), "record_har_mode": "full"}
+
+
+def install_replay(context, platform: str, product_code: Any) -> bool:
+    """replay 모드: HAR 에 없는 요청은 중단 (라이브 사이트로 나가지 않음)"""
+    if _mode != "replay":
+        return False
+    context.route_from_har(har_path(platform, product_code), not_found="abort")
+    return True
+
+
+async def ainstall_replay(context, platform: str, product_code: Any) -> bool:
+    """install_replay 의 async Playwright 버전"""
+    if _mode != "replay":
+        return False
+    await context.route_from_har(har_path(platform, product_code), not_found="abort")
+    return True
+
+
+def save_html_snapshot(target, platform: str, product_code: Any) -> None:
+    """record 모드: 현재 문서(Page 또는 리뷰 iframe Frame) HTML 을 파서 벤치마크 fixture 로 저장"""
+    if _mode != "record":
+        return
+    try:
+        with open(os.path.join(_fixture_dir, f"{platform}_{product_code}.html"), "w", encoding="utf-8") as f:
+            f.write(target.content())
+    except Exception as e:
+        print(f"[WARNING] HTML 스냅샷 저장 실패: {e}")
+
+
+# ----------------------------------------------------------------------
+# httpx
+# ----------------------------------------------------------------------
+def _har_entry(response: httpx.Response) -> Dict[str, Any]:
+    request = response.request
+    entry = {
+        "request": {
+            "method": request.method,
+            "url": str(request.url),
+            "headers": [{"name": k, "value": v} for k, v in request.headers.items()],
+        },
+        "response": {
+            "status": response.status_code,
+            "headers": [{"name": k, "value": v} for k, v in response.headers.items()
+                        if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")],
+            "content": {
+                "mimeType": response.headers.get("content-type", ""),
+                "text": base64.b64encode(response.content).decode("ascii"),
+                "encoding": "base64",
+            },
+        },
+    }
+    if request.content:
+        entry["request"]["postData"] = {"text": request.content.decode("utf-8", "replace")}
+    return entry
+
+
+def _append_http_entry(platform: str, response: httpx.Response) -> None:
+    path = http_har_path(platform)
+    with _http_lock:
+        os.makedirs(_fixture_dir, exist_ok=True)
+        har = {"log": {"version": "1.2", "creator": {"name": "review-scraper"}, "entries": []}}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                har = json.load(f)
+        har["log"]["entries"].append(_har_entry(response))
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(har, f, ensure_ascii=False)
+
+
+def _load_entries() -> Dict[Tuple[str, str, str], Dict[str, Any]]:
+    """fixture 디렉터리의 모든 HAR 응답을 (method, url, body) 로 색인"""
+    index: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+    if not os.path.isdir(_fixture_dir):
+        return index
+    for filename in sorted(os.listdir(_fixture_dir)):
+        if not filename.endswith(".har"):
+            continue
+        try:
+            with open(os.path.join(_fixture_dir, filename), encoding="utf-8") as f:
+                entries: List[Dict[str, Any]] = json.load(f)["log"]["entries"]
+        except Exception as e:
+            print(f"[WARNING] HAR 읽기 실패 ({filename}): {e}")
+            continue
+        for entry in entries:
+            request = entry["request"]
+            body = (request.get("postData") or {}).get("text") or ""
+            index[(request["method"], request["url"], body)] = entry["response"]
+            index.setdefault((request["method"], request["url"], None), entry["response"])
+    return index
+
+
+def _mock_transport() -> httpx.MockTransport:
+    index = _load_entries()
+    print(f"[FIXTURE] httpx replay: HAR 응답 {len(index)}개 로드 ({_fixture_dir})")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = request.content.decode("utf-8", "replace") if request.content else ""
+        response = index.get((request.method, str(request.url), body)) or \
+            index.get((request.method, str(request.url), None))
+        if response is None:
+            return httpx.Response(404, text="fixture not found", request=request)
+
+        content = response.get("content") or {}
+        raw = content.get("text") or ""
+        data = base64.b64decode(raw) if content.get("encoding") == "base64" else raw.encode("utf-8")
+        headers = [(h["name"], h["value"]) for h in response.get("headers", [])
+                   if h["name"].lower() not in ("content-encoding", "content-length", "transfer-encoding")]
+        return httpx.Response(response.get("status", 200), headers=headers, content=data, request=request)
+
+    return httpx.MockTransport(handler)
+
+
+def http_client_options(platform: str, is_async: bool = False) -> Dict[str, Any]:
+    """
+    httpx.Client / AsyncClient 생성 옵션
+    - record: 응답 본문을 읽어 {platform}_http.har 에 추가하는 훅
+    - replay: HAR 기반 MockTransport (HAR 에 없는 요청은 404)
+    """
+    global _transport
+    if _mode == "replay":
+        if _transport is None:
+            _transport = _mock_transport()
+        return {"transport": _transport}
+
+    if _mode == "record":
+        if is_async:
+            async def record_async(response: httpx.Response) -> None:
+                await response.aread()
+                _append_http_entry(platform, response)
+            return {"event_hooks": {"response": [record_async]}}
+
+        def record(response: httpx.Response) -> None:
+            response.read()
+            _append_http_entry(platform, response)
+        return {"event_hooks": {"response": [record]}}
+
+    return {}
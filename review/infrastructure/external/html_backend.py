@@ -0,0 +1,158 @@
+"""
+HTML Parser Backend
+리뷰 추출용 HTML 파서 백엔드 (selectolax → lxml → BeautifulSoup 순으로 설치된 것 사용)
+- 세 백엔드를 같은 최소 인터페이스(parse / select / select_one / text / attr)로 감싼다
+- 플랫폼별 추출 로직(review_extractor)은 이 인터페이스만 사용
+"""
+from typing import Any, Dict, List, Optional
+
+from config.scraper_config import HTML_PARSER_BACKEND
+
+
+class HtmlBackend:
+    """파서 백엔드 공통 인터페이스"""
+    name = "base"
+
+    def parse(self, html: str) -> Any:
+        raise NotImplementedError
+
+    def select(self, node: Any, css: str) -> List[Any]:
+        raise NotImplementedError
+
+    def select_one(self, node: Any, css: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def text(self, node: Any, separator: str = "") -> str:
+        """하위 텍스트 노드를 각각 strip 한 뒤 빈 조각을 빼고 separator 로 연결"""
+        raise NotImplementedError
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        raise NotImplementedError
+
+
+class SelectolaxBackend(HtmlBackend):
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.parser import HTMLParser
+        self._parser = HTMLParser
+
+    def parse(self, html: str) -> Any:
+        tree = self._parser(html or "")
+        return tree.root if tree.root is not None else tree.body
+
+    def select(self, node: Any, css: str) -> List[Any]:
+        return node.css(css)
+
+    def select_one(self, node: Any, css: str) -> Optional[Any]:
+        return node.css_first(css)
+
+    def text(self, node: Any, separator: str = "") -> str:
+        pieces = node.text(deep=True, separator="\x00", strip=True).split("\x00")
+        return separator.join(p for p in pieces if p)
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        return node.attributes.get(name)
+
+
+class LxmlBackend(HtmlBackend):
+    name = "lxml"
+
+    def __init__(self):
+        from lxml import html as lxml_html
+        from lxml.cssselect import CSSSelector  # cssselect 패키지 필요
+        self._html = lxml_html
+        self._css_selector = CSSSelector
+        self._compiled: Dict[str, Any] = {}
+
+    def _compile(self, css: str):
+        selector = self._compiled.get(css)
+        if selector is None:
+            selector = self._css_selector(css)
+            self._compiled[css] = selector
+        return selector
+
+    def parse(self, html: str) -> Any:
+        return self._html.document_fromstring(html if html and html.strip() else "<html></html>")
+
+    def select(self, node: Any, css: str) -> List[Any]:
+        return self._compile(css)(node)
+
+    def select_one(self, node: Any, css: str) -> Optional[Any]:
+        found = self._compile(css)(node)
+        return found[0] if found else None
+
+    def text(self, node: Any, separator: str = "") -> str:
+        return separator.join(t.strip() for t in node.itertext() if t.strip())
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        return node.get(name)
+
+
+class BeautifulSoupBackend(HtmlBackend):
+    name = "bs4"
+
+    def __init__(self):
+        from bs4 import BeautifulSoup
+        self._soup = BeautifulSoup
+        try:
+            import lxml  # noqa: F401
+            self._features = "lxml"
+        except ImportError:
+            self._features = "html.parser"
+
+    def parse(self, html: str) -> Any:
+        return self._soup(html or "", self._features)
+
+    def select(self, node: Any, css: str) -> List[Any]:
+        return node.select(css)
+
+    def select_one(self, node: Any, css: str) -> Optional[Any]:
+        return node.select_one(css)
+
+    def text(self, node: Any, separator: str = "") -> str:
+        return node.get_text(separator, strip=True)
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        value = node.get(name)
+        return " ".join(value) if isinstance(value, list) else value
+
+
+BACKENDS = {
+    "selectolax": SelectolaxBackend,
+    "lxml": LxmlBackend,
+    "bs4": BeautifulSoupBackend,
+}
+
+_instances: Dict[str, HtmlBackend] = {}
+
+
+def available_backends() -> List[str]:
+    """현재 환경에서 import 가능한 백엔드 이름 (우선순위 순)"""
+    names = []
+    for name, backend_cls in BACKENDS.items():
+        try:
+            _instances.setdefault(name, backend_cls())
+            names.append(name)
+        except ImportError:
+            continue
+    return names
+
+
+def get_html_backend(name: str = HTML_PARSER_BACKEND) -> HtmlBackend:
+    """
+    이름으로 백엔드 반환 (auto 또는 미설치면 설치된 것 중 가장 빠른 백엔드)
+    """
+    if name in _instances:
+        return _instances[name]
+
+    if name in BACKENDS:
+        try:
+            _instances[name] = BACKENDS[name]()
+            return _instances[name]
+        except ImportError:
+            print(f"[WARNING] HTML 파서 '{name}' 미설치 → 자동 선택")
+
+    for candidate in available_backends():
+        return _instances[candidate]
+    raise ImportError("사용 가능한 HTML 파서가 없습니다. (selectolax / lxml / beautifulsoup4)")
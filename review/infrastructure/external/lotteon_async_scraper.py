@@ -0,0 +1,229 @@
+"""
+Lotteon Async Scraper Adapter
+AsyncScrapeEngine 위에서 롯데온 리뷰 목록 API를 캡처해 페이지 단위로 직접 호출
+- 한 프로세스에서 여러 상품을 각자의 BrowserContext 로 동시에 크롤링
+- API를 캡처하지 못하면 동기 스크래퍼(DOM 페이지네이션)로 폴백
+"""
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from playwright.async_api import TimeoutError as PWTimeout
+
+from config.scraper_config import LOTTEON_REVIEW_API_PATTERN, WAIT_TIMEOUT_MS
+from product.domain.entity.product import Product
+from review.application.port.scraper_port import ReviewBatch
+from review.domain.entity.review import ReviewPlatform
+from review.domain.entity.crawl_watermark import CrawlWatermark
+from review.domain.entity.crawl_cursor import CrawlCursor
+from review.infrastructure.external.async_scrape_engine import AsyncScrapeEngine, get_scrape_engine
+from review.infrastructure.external.request_filter import RequestFilter
+from review.infrastructure.external.browser_cache import (
+    AssetCache, storage_state_options, asave_storage_state, invalidate_storage_state
+)
+from review.infrastructure.external.lotteon_review_api import (
+    CapturedReviewRequest, aiter_review_pages, save_captured_request
+)
+from review.infrastructure.external.selector_cache import SelectorCache, LAYOUT_SIGNATURE_JS
+from review.infrastructure.external.selector_probe import aprobe_selectors
+from review.infrastructure.external import fixture_replay
+from review.infrastructure.external.rate_limiter import get_rate_limiter
+from review.infrastructure.external.crawl_controller import CrawlBlockedError, agoto_and_report
+from review.infrastructure.external.lotteon_scraper import (
+    LotteonScraper, REVIEW_ITEM_SELECTOR, TITLE_SELECTORS, BRAND_SELECTORS, REVIEW_TAB_SELECTORS, LAYOUT_MARKERS
+)
+
+
+class LotteonAsyncScraper(LotteonScraper):
+    """
+    롯데온 리뷰 async 스크래퍼
+    엔티티 변환/본문 정리는 LotteonScraper 와 공유하고, 폴백은 부모(동기) 구현을 그대로 사용
+    """
+
+    def __init__(self, engine: Optional[AsyncScrapeEngine] = None):
+        self.engine = engine
+
+    def iter_review_batches(self, product: Product, watermark: Optional[CrawlWatermark] = None,
+                            resume_from: Optional[CrawlCursor] = None) -> Iterator[ReviewBatch]:
+        if product.source.value != ReviewPlatform.LOTTEON.value:
+            raise ValueError(f"지원하지 않는 플랫폼: {product.source}")
+
+        product_code = product.source_product_id.strip()
+        if not product_code:
+            raise ValueError("product_id가 비어있습니다.")
+
+        engine = self.engine or get_scrape_engine()
+        api_resume = resume_from if resume_from and resume_from.applies_to("api") else None
+
+        page = 0
+        collected = False
+        api_state: Dict[str, bool] = {}
+        for items, cursor in engine.stream(self._aiter_review_pages(engine, product_code, api_resume, api_state)):
+            collected = True
+            reviews = self._to_review_entities(items, product_code, product.source)
+            if not reviews:
+                continue
+            page += 1
+
+            if watermark is not None and watermark.is_page_known(reviews):
+                print(f"[INFO] {page}번째 페이지가 모두 기존 리뷰 (증분 크롤링 종료)")
+                return
+
+            yield ReviewBatch(page=page, reviews=reviews, cursor=cursor)
+
+        if not collected and api_resume is not None and api_state.get("captured"):
+            # API 체크포인트가 이미 마지막 페이지 → 완료 (DOM 으로 처음부터 다시 돌지 않음)
+            print(f"[INFO] 리뷰 API 체크포인트({api_resume.page}페이지) 이후 새 페이지 없음 - 수집 완료")
+            return
+        if not collected:
+            print("[INFO] 엔진에서 리뷰 API를 캡처하지 못함 → 동기 스크래퍼(DOM 페이지네이션)로 폴백")
+            yield from super().iter_review_batches(product, watermark=watermark, resume_from=resume_from)
+
+    async def _aclick_review_tab(self, page) -> bool:
+        """
+        리뷰 탭 클릭 ('정책' 탭 제외, 텍스트 또는 속성값에 리뷰 표시가 있는 요소만)
+        레이아웃별로 성공한 셀렉터를 먼저 시도 (Redis 호출은 엔진 루프를 막지 않도록 스레드에서)
+        """
+        try:
+            layout = await page.evaluate(LAYOUT_SIGNATURE_JS, LAYOUT_MARKERS) or "default"
+        except Exception:
+            layout = "default"
+        selector_cache = SelectorCache("lotteon", layout)
+        tab_selectors = await asyncio.to_thread(selector_cache.ordered, "tab", REVIEW_TAB_SELECTORS)
+
+        await get_rate_limiter().aacquire("lotteon")  # 탭 클릭이 리뷰 목록 요청을 발생시킴
+        match = await aprobe_selectors(page, tab_selectors, require_any=["리뷰", "review"], exclude_any=["정책"])
+        if match:
+            try:
+                tab = match.locator(page)
+                await tab.scroll_into_view_if_needed(timeout=2000)
+                await tab.click(timeout=5000)
+                print(f"[SUCCESS] 리뷰 탭 클릭 완료 (셀렉터: {match.selector})")
+                await asyncio.to_thread(selector_cache.record, "tab", match.selector)
+                return True
+            except Exception:
+                pass
+        await asyncio.to_thread(selector_cache.invalidate, "tab")
+        return False
+
+    async def _first_text(self, page, selectors: List[str]) -> Optional[str]:
+        match = await aprobe_selectors(page, selectors)
+        return match.text if match else None
+
+    async def _aiter_review_pages(self, engine: AsyncScrapeEngine, product_code: str,
+                                  resume_from: Optional[CrawlCursor] = None,
+                                  state: Optional[Dict[str, bool]] = None
+                                  ) -> AsyncIterator[Tuple[List[Dict], CrawlCursor]]:
+        """
+        (리뷰 dict 리스트, 재개 지점) 을 API 페이지 단위로 yield (엔진 루프에서 실행)
+        state: 리뷰 API 응답을 캡처했는지 기록 ("captured") - 재개 시 새 페이지가 없을 때 완료/폴백 판단용
+        """
+        state = state if state is not None else {}
+        url = f"https://www.lotteon.com/p/product/{product_code}"
+        start_page = resume_from.page + 1 if resume_from else 1
+
+        print(f"--- 롯데온 리뷰 크롤링 시작 (async engine) ---")
+        print(f"--- 대상 URL: {url} ---")
+
+        request_filter = RequestFilter()
+        asset_cache = AssetCache()
+        captured_responses: List[Any] = []
+
+        def on_response(response):
+            if LOTTEON_REVIEW_API_PATTERN in response.url and \
+                    response.request.resource_type in ("xhr", "fetch") and \
+                    "json" in (response.headers or {}).get("content-type", ""):
+                captured_responses.append(response)
+
+        try:
+            async with engine.new_context(
+                "lotteon",
+                viewport={'width': 1920, 'height': 1080},
+                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                **fixture_replay.context_options("lotteon", product_code),
+                **storage_state_options("lotteon")
+            ) as context:
+                await asset_cache.install_async(context)  # 필터보다 먼저 (필터 통과분만 캐시)
+                await request_filter.install_async(context)
+                await fixture_replay.ainstall_replay(context, "lotteon", product_code)
+                page = await context.new_page()
+                page.on("response", on_response)
+                page.set_default_navigation_timeout(60000)
+                page.set_default_timeout(30000)
+
+                await get_rate_limiter().aacquire("lotteon")
+                await agoto_and_report(page, url, "lotteon", wait_until="domcontentloaded")
+
+                try:
+                    await page.wait_for_selector(', '.join(TITLE_SELECTORS), timeout=WAIT_TIMEOUT_MS)
+                except PWTimeout:
+                    pass
+                product_title = await self._first_text(page, TITLE_SELECTORS)
+                brand_name = await self._first_text(page, BRAND_SELECTORS)
+
+                # 지연 로딩 유도 스크롤
+                for i in range(5):
+                    await page.evaluate(f"window.scrollTo(0, {(i + 1) * 600})")
+                    try:
+                        await page.wait_for_load_state("networkidle", timeout=1500)
+                    except PWTimeout:
+                        pass
+
+                if not await self._aclick_review_tab(page):
+                    print("[WARNING] 리뷰 탭을 찾지 못함 - 스크롤로 대체")
+                    await page.evaluate("window.scrollTo(0, document.body.scrollHeight * 0.6)")
+
+                try:
+                    await page.wait_for_selector(REVIEW_ITEM_SELECTOR, state="attached", timeout=WAIT_TIMEOUT_MS)
+                    await page.wait_for_load_state("networkidle", timeout=WAIT_TIMEOUT_MS)
+                    await asave_storage_state(context, "lotteon")
+                except PWTimeout:
+                    print("[WARNING] 리뷰 아이템이 제한 시간 내 나타나지 않음")
+
+                if resume_from:
+                    print(f"[INFO] 체크포인트에서 재개: 리뷰 API {start_page}페이지부터")
+
+                cookies = {c["name"]: c["value"] for c in await context.cookies()}
+                state["captured"] = bool(captured_responses)
+                for response in captured_responses:
+                    yielded = 0
+                    try:
+                        request = response.request
+                        captured = CapturedReviewRequest.from_playwright_request(
+                            request, raw_headers=await request.all_headers()
+                        )
+                        if captured is None:
+                            continue
+
+                        seen_numbers = set()
+                        async for page_no, items in aiter_review_pages(
+                            captured, await response.json(), cookies, start_page, engine
+                        ):
+                            if not yielded:
+                                await asyncio.to_thread(save_captured_request, product_code, captured)
+                            page_reviews = []
+                            for item in self._normalize_api_items(items, product_title, brand_name):
+                                if item["review_number"] and item["review_number"] in seen_numbers:
+                                    continue
+                                seen_numbers.add(item["review_number"])
+                                page_reviews.append(item)
+                            yielded += len(page_reviews)
+                            yield page_reviews, CrawlCursor(strategy="api", page=page_no,
+                                                            last_review_number=self._last_review_number(page_reviews))
+
+                        if yielded:
+                            print(f"  ✓ API로 {yielded}개 리뷰 수집")
+                            return
+                    except CrawlBlockedError:
+                        raise  # 차단된 상태로 DOM 폴백을 돌지 않는다
+                    except Exception as e:
+                        if yielded:
+                            raise
+                        print(f"  ✗ 리뷰 API 호출 실패: {str(e)[:80]}")
+                        continue
+        except CrawlBlockedError:
+            invalidate_storage_state("lotteon")
+            raise
+        finally:
+            print(f"[ENGINE] {engine.get_stats()}")
+            print(f"[FILTER] {request_filter.summary()}")
+            print(f"[CACHE] {asset_cache.summary()}")
@@ -0,0 +1,312 @@
+"""
+Lotteon Review API
+롯데온 상품 페이지가 호출하는 리뷰 목록 API 요청을 캡처해 page/size 파라미터로 직접 호출
+- 캡처한 요청(URL, 메서드, 헤더, 바디)을 템플릿으로 사용
+- 2페이지 이후는 도메인별 동시성 상한 아래에서 병렬 호출하고 페이지 단위로 yield
+  상한은 AsyncScrapeEngine 루프의 호스트별 세마포어 → 동시에 도는 크롤링 전체가 공유 (sync 경로도 엔진 루프에서 구동)
+- 캡처한 템플릿은 상품별로 Redis 에 보관 → 사전 확인(preflight)이 브라우저 없이 1페이지만 호출
+  key: crawl:lotteon:api:{product_code}
+"""
+import re
+import json
+import math
+import time
+import asyncio
+from dataclasses import dataclass, field, asdict
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import httpx
+
+from config.scraper_config import (
+    HTTP_TIMEOUT_SECONDS, LOTTEON_API_CONCURRENCY, LOTTEON_API_MAX_PAGES, LOTTEON_API_TEMPLATE_TTL_SECONDS
+)
+from review.infrastructure.external import fixture_replay
+from review.infrastructure.external.rate_limiter import get_rate_limiter
+from review.infrastructure.external.crawl_controller import get_crawl_controller
+from review.infrastructure.external.async_scrape_engine import AsyncScrapeEngine, get_scrape_engine
+
+PAGE_PARAM_KEYS = ("pageNo", "page", "pageNum", "pageIndex", "currentPage")
+SIZE_PARAM_KEYS = ("rowsPerPage", "pageSize", "size", "rowCount", "perPage")
+TOTAL_COUNT_KEYS = ("totalCount", "totCnt", "totalCnt", "total", "totalElements", "rvwCnt")
+
+# 리뷰 아이템 필드 후보 (응답 스키마 변경에 대비해 여러 키를 순서대로 시도)
+ITEM_FIELD_KEYS = {
+    "review_number": ("rvwNo", "reviewNo", "reviewNumber", "rvwId", "reviewId"),
+    "user_id": ("mbrNckNm", "nickName", "mbrId", "loginId", "userId", "wrtrNm", "mbrNm"),
+    "rating": ("rvwScr", "starScr", "evlScr", "score", "rating", "reviewScore"),
+    "date": ("rvwRegDttm", "regDttm", "wrtDttm", "regDate", "createdAt", "reviewDate"),
+    "content": ("rvwCnts", "rvwCont", "reviewContent", "content", "cnts", "contents"),
+    "option": ("itmOptNm", "optNm", "optionName", "option", "itmNm"),
+}
+
+# 템플릿에서 제외할 헤더 (httpx가 직접 계산하거나, 쿠키는 컨텍스트 쿠키로 별도 전달)
+_SKIP_HEADERS = {"host", "content-length", "connection", "accept-encoding", "cookie"}
+
+
+@dataclass
+class CapturedReviewRequest:
+    """페이지가 보낸 리뷰 목록 API 요청 템플릿"""
+    url: str
+    method: str = "GET"
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Optional[Dict[str, Any]] = None   # JSON POST 바디
+    page_key: Optional[str] = None
+    size_key: Optional[str] = None
+    page_in_body: bool = False
+
+    @classmethod
+    def from_playwright_request(cls, request,
+                                raw_headers: Optional[Dict[str, str]] = None) -> Optional["CapturedReviewRequest"]:
+        """raw_headers: async API 에서는 호출 측이 await request.all_headers() 결과를 넘긴다."""
+        if raw_headers is None:
+            try:
+                raw_headers = request.all_headers()
+            except Exception:
+                raw_headers = request.headers
+        headers = {
+            k: v for k, v in (raw_headers or {}).items()
+            if not k.startswith(":") and k.lower() not in _SKIP_HEADERS
+        }
+
+        body = None
+        if request.post_data:
+            try:
+                body = json.loads(request.post_data)
+            except ValueError:
+                return None  # form 바디 등은 지원하지 않음 → DOM 폴백
+
+        captured = cls(url=request.url, method=request.method, headers=headers,
+                       body=body if isinstance(body, dict) else None)
+        return captured if captured._detect_page_params() else None
+
+    def _detect_page_params(self) -> bool:
+        query = dict(parse_qsl(urlsplit(self.url).query))
+        for source, in_body in ((self.body or {}, True), (query, False)):
+            page_key = next((k for k in PAGE_PARAM_KEYS if k in source), None)
+            if page_key:
+                self.page_key = page_key
+                self.size_key = next((k for k in SIZE_PARAM_KEYS if k in source), None)
+                self.page_in_body = in_body
+                return True
+        return False
+
+    @property
+    def page_size(self) -> Optional[int]:
+        if not self.size_key:
+            return None
+        source = self.body if self.page_in_body else dict(parse_qsl(urlsplit(self.url).query))
+        try:
+            return int(source[self.size_key])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def build(self, page: int) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """page 번호를 채운 (url, body) 반환"""
+        if self.page_in_body:
+            body = dict(self.body or {})
+            body[self.page_key] = page
+            return self.url, body
+
+        parts = urlsplit(self.url)
+        query = dict(parse_qsl(parts.query))
+        query[self.page_key] = str(page)
+        return urlunsplit(parts._replace(query=urlencode(query))), self.body
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CapturedReviewRequest":
+        return cls(**{k: data.get(k) for k in ("url", "method", "headers", "body",
+                                                "page_key", "size_key", "page_in_body")})
+
+
+def _template_key(product_code: str) -> str:
+    return f"crawl:lotteon:api:{product_code}"
+
+
+def save_captured_request(product_code: str, captured: CapturedReviewRequest) -> None:
+    """API 수집에 성공한 요청 템플릿 보관 (실패는 크롤링을 막지 않음)"""
+    try:
+        from config.redis_config import get_redis
+        get_redis().set(_template_key(product_code), json.dumps(captured.to_dict()),
+                        ex=LOTTEON_API_TEMPLATE_TTL_SECONDS)
+    except Exception as e:
+        print(f"[WARNING] 리뷰 API 템플릿 저장 실패: {e}")
+
+
+def load_captured_request(product_code: str) -> Optional[CapturedReviewRequest]:
+    try:
+        from config.redis_config import get_redis
+        data = get_redis().get(_template_key(product_code))
+        return CapturedReviewRequest.from_dict(json.loads(data)) if data else None
+    except Exception as e:
+        print(f"[WARNING] 리뷰 API 템플릿 조회 실패: {e}")
+        return None
+
+
+def _first(item: Dict[str, Any], keys) -> Any:
+    for key in keys:
+        value = item.get(key)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _looks_like_review(item: Any) -> bool:
+    return isinstance(item, dict) and _first(item, ITEM_FIELD_KEYS["content"]) is not None
+
+
+def extract_review_list(payload: Any) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """
+    JSON 응답에서 리뷰 아이템 리스트와 전체 건수를 찾는다. (너비 우선 탐색)
+    """
+    items: List[Dict[str, Any]] = []
+    total: Optional[int] = None
+    queue = [payload]
+
+    while queue:
+        node = queue.pop(0)
+        if isinstance(node, dict):
+            if total is None:
+                value = _first(node, TOTAL_COUNT_KEYS)
+                if isinstance(value, (int, str)) and str(value).isdigit():
+                    total = int(value)
+            queue.extend(node.values())
+        elif isinstance(node, list):
+            if not items and node and all(_looks_like_review(x) for x in node):
+                items = node
+            else:
+                queue.extend(node)
+
+    return items, total
+
+
+def _normalize_date(value: Any) -> str:
+    """'20240115...', '2024-01-15T..', '2024.01.15' → '2024.01.15'"""
+    match = re.search(r'(\d{4})\D?(\d{2})\D?(\d{2})', str(value or ""))
+    return f"{match.group(1)}.{match.group(2)}.{match.group(3)}" if match else ""
+
+
+def map_review_item(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """API 리뷰 아이템 → DOM 수집 결과와 같은 dict 형식"""
+    content = _first(item, ITEM_FIELD_KEYS["content"])
+    if not content:
+        return None
+
+    rating = _first(item, ITEM_FIELD_KEYS["rating"])
+    try:
+        rating = min(float(rating), 5.0)
+    except (TypeError, ValueError):
+        rating = 5.0
+
+    review_number = _first(item, ITEM_FIELD_KEYS["review_number"])
+    return {
+        "user_id": str(_first(item, ITEM_FIELD_KEYS["user_id"]) or "익명"),
+        "rating": rating,
+        "option": _first(item, ITEM_FIELD_KEYS["option"]),
+        "content": str(content),
+        "date": _normalize_date(_first(item, ITEM_FIELD_KEYS["date"])),
+        "review_number": str(review_number) if review_number is not None else None,
+    }
+
+
+async def _fetch_page(client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                      captured: CapturedReviewRequest, page: int) -> List[Dict[str, Any]]:
+    url, body = captured.build(page)
+    controller = get_crawl_controller()
+    async with semaphore:
+        await get_rate_limiter().aacquire("lotteon")
+        started = time.perf_counter()
+        try:
+            response = await client.request(captured.method, url, json=body)
+        except httpx.TimeoutException:
+            await controller.areport_timeout("lotteon")
+            raise
+    await controller.areport_response("lotteon", response.status_code, time.perf_counter() - started, str(response.url))
+    response.raise_for_status()
+    items, _ = extract_review_list(response.json())
+    return items
+
+
+def _map_items(raw_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    mapped = []
+    for item in raw_items:
+        review = map_review_item(item)
+        if review:
+            mapped.append(review)
+    return mapped
+
+
+async def aiter_review_pages(captured: CapturedReviewRequest, first_payload: Any, cookies: Dict[str, str],
+                             start_page: int = 1, engine: Optional[AsyncScrapeEngine] = None
+                             ) -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+    """
+    캡처한 첫 페이지 응답부터 (페이지 번호, 매핑된 리뷰) 를 페이지 단위로 yield
+
+    - 2페이지 이후는 동시성 상한만큼 묶은 웨이브로 병렬 호출 (웨이브 사이에 yield → 메모리 상한 유지)
+    - 빈 페이지가 나오거나 전체 건수에 도달하면 종료
+    - 호출 측이 순회를 멈추면 남은 웨이브는 호출하지 않는다
+    - start_page > 1 이면 (체크포인트 재개) 첫 페이지는 건너뛰고 start_page 부터 호출
+    - engine(기본: 프로세스 엔진) 루프에서 실행해야 함 (호스트별 세마포어가 그 루프에 묶여 있음)
+    """
+    first_items, total_count = extract_review_list(first_payload)
+    if not first_items:
+        return
+
+    if start_page <= 1:
+        yield 1, _map_items(first_items)
+
+    page_size = captured.page_size or len(first_items)
+    last_page = LOTTEON_API_MAX_PAGES
+    if total_count is not None and page_size:
+        last_page = min(math.ceil(total_count / page_size), LOTTEON_API_MAX_PAGES)
+
+    # 캡처한 API 호스트(도메인) 단위 동시 요청 수 상한 (엔진 루프에서 크롤링 간 공유)
+    semaphore = (engine or get_scrape_engine()).host_slot(urlsplit(captured.url).netloc, LOTTEON_API_CONCURRENCY)
+    async with httpx.AsyncClient(headers=captured.headers, cookies=cookies,
+                                 timeout=HTTP_TIMEOUT_SECONDS, follow_redirects=True,
+                                 **fixture_replay.http_client_options("lotteon", is_async=True)) as client:
+        next_page = max(start_page, 2)
+        while next_page <= last_page:
+            wave = range(next_page, min(next_page + LOTTEON_API_CONCURRENCY, last_page + 1))
+            pages = await asyncio.gather(*[_fetch_page(client, semaphore, captured, page) for page in wave])
+            for page, items in zip(wave, pages):
+                if not items:
+                    return
+                yield page, _map_items(items)
+            next_page = wave[-1] + 1
+
+
+def fetch_first_page(captured: CapturedReviewRequest) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """
+    보관된 템플릿으로 1페이지만 호출 (쿠키 없이, 사전 확인용)
+    Returns:
+        (매핑된 리뷰 리스트, 전체 건수)
+    """
+    url, body = captured.build(1)
+    controller = get_crawl_controller()
+    get_rate_limiter().acquire("lotteon")
+    started = time.perf_counter()
+    with httpx.Client(headers=captured.headers, timeout=HTTP_TIMEOUT_SECONDS, follow_redirects=True,
+                      **fixture_replay.http_client_options("lotteon")) as client:
+        try:
+            response = client.request(captured.method, url, json=body)
+        except httpx.TimeoutException:
+            controller.report_timeout("lotteon")
+            raise
+    controller.report_response("lotteon", response.status_code, time.perf_counter() - started, str(response.url))
+    response.raise_for_status()
+    items, total = extract_review_list(response.json())
+    return _map_items(items), total
+
+
+def iter_review_pages(captured: CapturedReviewRequest, first_payload: Any, cookies: Dict[str, str],
+                      start_page: int = 1) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+    """
+    aiter_review_pages 의 동기 버전 (sync Playwright 스크래퍼용)
+    sync Playwright 가 호출 스레드에 실행 중인 루프를 걸어 두므로 이 스레드에서는 루프를 돌릴 수 없다
+    → 엔진 루프 스레드에서 구동하고 한 페이지씩 받아온다 (중단 시 남은 웨이브는 호출하지 않음)
+    """
+    yield from get_scrape_engine().stream(aiter_review_pages(captured, first_payload, cookies, start_page))
@@ -1,19 +1,207 @@
 """
 Lotteon Scraper Adapter
-롯데온 리뷰 크롤러 어댑터 (Playwright 기반)
+롯데온 리뷰 크롤러 어댑터 (Playwright 기반, 페이지 단위 스트리밍)
 """
-import time
-import random
-from typing import Dict, Any, List, Optional
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright, TimeoutError as PWTimeout
+import re
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
+import httpx
+from playwright.sync_api import TimeoutError as PWTimeout
 from datetime import datetime
 
-from review.application.port.scraper_port import ScraperPort
+from review.application.port.scraper_port import ScraperPort, ReviewBatch
 from product.domain.entity.product import Product
 from review.domain.entity.review import Review, ReviewPlatform
+from review.domain.entity.crawl_watermark import CrawlWatermark
+from review.domain.entity.crawl_cursor import CrawlCursor
+from review.domain.entity.review_summary import ReviewSummary
+from config.scraper_config import LOTTEON_REVIEW_API_PATTERN, PARSE_PIPELINE_ENABLED
+from review.infrastructure.external.browser_pool import get_browser_pool
+from review.infrastructure.external.request_filter import RequestFilter
+from review.infrastructure.external.browser_cache import (
+    AssetCache, storage_state_options, save_storage_state, invalidate_storage_state
+)
+from review.infrastructure.external.lotteon_review_api import (
+    CapturedReviewRequest, iter_review_pages, fetch_first_page, load_captured_request, save_captured_request
+)
+from review.infrastructure.external.review_extractor import (
+    LOTTEON_CONTAINER_CSS, LOTTEON_ITEM_PATTERNS, extract_lotteon_items, extract_lotteon_page
+)
+from review.infrastructure.external.selector_cache import SelectorCache, layout_signature
+from review.infrastructure.external.selector_probe import probe_selectors
+from review.infrastructure.external.phase_timer import phase, timed_phase
+from review.infrastructure.external import fixture_replay
+from review.infrastructure.external.snapshot_archive import SnapshotRecorder, get_snapshot_recorder
+from review.infrastructure.external.parse_pipeline import ParsePipeline
+from review.infrastructure.external.memory_watchdog import MemoryWatchdog
+from review.infrastructure.external.page_waiter import (
+    wait_for_selector, wait_for_network_idle, count_elements, wait_for_count_increase,
+    content_signature, wait_for_content_change
+)
+from review.infrastructure.external.rate_limiter import get_rate_limiter
+from review.infrastructure.external.crawl_controller import (
+    CrawlBlockedError, get_crawl_controller, goto_and_report
+)
+
+# 리뷰 아이템 등장/교체 감지용 셀렉터 (item_patterns 중 CSS로 표현 가능한 것)
+REVIEW_ITEM_SELECTOR = 'div[data-review-number], div.reviewList'
+
+# 리뷰 영역 컨테이너 (추출 범위 한정, 없으면 document 전체)
+REVIEW_CONTAINER_SELECTOR = LOTTEON_CONTAINER_CSS
+
+# 리뷰 아이템 패턴 이름 (기본 시도 순서, 셀렉터 캐시가 성공한 패턴을 앞으로 옮김)
+ITEM_PATTERN_NAMES = list(LOTTEON_ITEM_PATTERNS)
+
+# 리뷰 아이템 추출 스크립트 (브라우저 안에서 한 번에 실행)
+# - 아이템 패턴: data-review-number → .reviewList → class에 review+item → li.class에 review (주어진 순서로 첫 매칭 패턴 사용)
+# - 필드별 셀렉터도 순서대로 시도, 없으면 null (본문은 아이템 전체 텍스트로 대체)
+# - 텍스트는 HtmlBackend.text 와 같은 규칙 (하위 텍스트 노드를 각각 trim, 빈 조각 제외 후 연결 - 본문만 줄바꿈)
+#   → 파싱 파이프라인/스냅샷 재파싱(review_extractor)과 같은 페이지에서 같은 본문
+# - 반환: {pattern: 사용한 패턴 이름, items: [...]}
+EXTRACT_REVIEWS_JS = """
+([containerSelector, order, includeHtml]) => {
+    const LIMIT = 200;
+    const FIELDS = {
+        content: ['div.reviewContent', 'div[class*="reviewContent"]', '.review-content', 'p.content'],
+        user: ['span.userName', 'div[class*="userName"]', '.reviewer', 'span.name'],
+        rating: ['span.rating', 'div[class*="rating"]', '.rating', '.star'],
+        date: ['span.date', 'div[class*="date"]', '.date', 'time'],
+        option: ['div.option', 'span[class*="option"]', '.option'],
+    };
+    const PATTERNS = {
+        data_review_number: (root) => root.querySelectorAll('div[data-review-number]'),
+        review_list: (root) => root.querySelectorAll('div.reviewList'),
+        review_item_class: (root) => Array.from(root.querySelectorAll('div[class]')).filter(el =>
+            Array.from(el.classList).some(c => { c = c.toLowerCase(); return c.includes('review') && c.includes('item'); })),
+        review_li: (root) => Array.from(root.querySelectorAll('li[class]')).filter(el =>
+            el.className.toLowerCase().includes('review')),
+    };
+    const findItems = (root) => {
+        for (const name of order) {
+            const items = Array.from(PATTERNS[name](root));
+            if (items.length) return [name, items.slice(0, LIMIT)];
+        }
+        return [null, []];
+    };
+    const nodeText = (el, separator) => {
+        const pieces = [];
+        const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+        while (walker.nextNode()) {
+            const piece = walker.currentNode.nodeValue.trim();
+            if (piece) pieces.push(piece);
+        }
+        return pieces.join(separator);
+    };
+    const text = (item, selectors, multiline) => {
+        for (const sel of selectors) {
+            const el = item.querySelector(sel);
+            if (el) return nodeText(el, multiline ? '\n' : '');
+        }
+        return null;
+    };
+
+    const container = document.querySelector(containerSelector);
+    let [pattern, items] = container ? findItems(container) : [null, []];
+    if (!items.length) [pattern, items] = findItems(document);
+
+    // includeHtml: 스냅샷 보관용 원본 (컨테이너가 없으면 찾은 아이템만)
+    const html = !includeHtml ? null
+        : (container ? container.outerHTML : items.map(item => item.outerHTML).join(''));
+    return {pattern, html, items: items.map((item, idx) => ({
+        review_number: item.getAttribute('data-review-number') || ('unknown_' + (idx + 1)),
+        user: text(item, FIELDS.user, false),
+        rating: text(item, FIELDS.rating, false),
+        date: text(item, FIELDS.date, false),
+        option: text(item, FIELDS.option, false),
+        content: text(item, FIELDS.content, true) || nodeText(item, '\n'),
+    }))};
+}
+"""
 
-HEADLESS = True
+# 리뷰 컨테이너 원본 HTML 만 반환 (파싱 파이프라인용 - 필드 추출은 워커가 html_backend 로 수행)
+# 컨테이너가 없으면 첫 매칭 아이템 패턴의 아이템들만 (패턴은 셀렉터 캐시 순서)
+REVIEW_HTML_JS = """
+([containerSelector, itemPatterns]) => {
+    const container = document.querySelector(containerSelector);
+    if (container) return container.outerHTML;
+    for (const pattern of itemPatterns) {
+        const items = document.querySelectorAll(pattern);
+        if (items.length) return Array.from(items).map(item => item.outerHTML).join('');
+    }
+    return '';
+}
+"""
+
+# 상품명/브랜드 셀렉터 (순서대로 시도)
+TITLE_SELECTORS = ['h2.prd_name', '.prodName', 'h1.product-title', '.product_name']
+BRAND_SELECTORS = ['.brand_name', '.prd_brand', '.product-brand', 'span.brand']
+
+# 리뷰 탭 셀렉터 (순서대로 시도)
+REVIEW_TAB_SELECTORS = [
+    # 롯데온 특정 구조 (업로드된 이미지 기반)
+    'li[data-object*="tab_type=review"]',
+    'li[data-object*="reviewtab"]',
+    '[data-object*="tab_type=review"]',
+
+    # 일반적인 패턴
+    'a[href="#pdReview"]',
+    'a[href*="review"]',
+    'button[aria-label*="리뷰"]',
+
+    # 텍스트 기반
+    'li:has-text("리뷰")',
+    'a:has-text("리뷰")',
+    'button:has-text("리뷰")',
+    'li:has-text("리뷰") a',
+    'li:has-text("리뷰") button',
+
+    # 클래스 기반
+    '.review-tab',
+    '.tab-review',
+    '.tab_review',
+    '[data-tab="review"]',
+    '[data-tab="pdReview"]',
+
+    # 더 넓은 범위
+    'nav a:has-text("리뷰")',
+    'ul.tabs a:has-text("리뷰")',
+    '.product-tabs a:has-text("리뷰")',
+    '.tab-menu a:has-text("리뷰")',
+    '.scrollTabInner li:has-text("리뷰")',
+]
+
+# 페이지 번호 링크 셀렉터 (순서대로 시도)
+PAGINATION_SELECTORS = [
+    '.paginationArea a',
+    '.pagination a',
+    'div[class*="pagination"] a',
+    'a[data-v-e6ad9102]',
+]
+
+# '다음' 페이지 버튼 셀렉터
+NEXT_BUTTON_SELECTORS = [
+    'a.next:has-text(">")',
+    'a:has-text(">")',
+    'button:has-text(">")',
+    '.pagination a.next',
+    'a[class*="next"]',
+    '.paginationArea a.next',
+]
+
+# '더보기' 버튼 셀렉터 (리뷰 영역 내부로 한정)
+MORE_BUTTON_SELECTORS = [
+    'div#review button:has-text("더보기")',
+    'div.productReviewWrap button:has-text("더보기")',
+    'button.review-more:has-text("더보기")',
+]
+
+# 페이지 레이아웃 구분용 마커 (셀렉터 캐시 키)
+LAYOUT_MARKERS = {
+    "scrolltab": '.scrollTabInner',
+    "tabobj": '[data-object*="tab_type=review"]',
+    "review": 'div#review',
+    "wrap": 'div.productReviewWrap',
+    "pdreview": '#pdReview',
+}
 
 
 class LotteonScraper(ScraperPort):
@@ -22,15 +210,18 @@ class LotteonScraper(ScraperPort):
     ScraperPort를 구현하여 롯데온 플랫폼의 리뷰를 크롤링
     """
 
-    def fetch_reviews(self, product: Product) -> List[Review]:
+    def iter_review_batches(self, product: Product, watermark: Optional[CrawlWatermark] = None,
+                            resume_from: Optional[CrawlCursor] = None) -> Iterator[ReviewBatch]:
         """
-        롯데온 상품의 리뷰를 크롤링하여 반환
+        롯데온 상품의 리뷰를 페이지 단위로 크롤링하여 배치로 반환
 
         Args:
             product: 상품 엔티티 (source, source_product_id 포함)
+            watermark: 증분 크롤링 기준점 (한 페이지 전체가 기존 리뷰면 순회 중단)
+            resume_from: 체크포인트 (API 페이지 / DOM 페이지 번호 / 더보기 횟수 이후부터 수집)
 
-        Returns:
-            List[Review]: 크롤링된 리뷰 엔티티 리스트
+        Yields:
+            ReviewBatch: 페이지 하나(API 1페이지 / 페이지 번호 1개 / 더보기 1회) 분량의 리뷰 엔티티
         """
         # 롯데온 전용 로직
         if product.source.value != ReviewPlatform.LOTTEON.value:
@@ -43,17 +234,50 @@ class LotteonScraper(ScraperPort):
 
         print(f"[INFO] 롯데온 상품 크롤링 시작: {product_code}")
 
-        # 크롤링 실행
-        result = self._crawl_lotteon_reviews(product_code)
+        page = 0
+        total = 0
+        for items, cursor in self._iter_with_recycling(product_code, resume_from):
+            # 도메인 엔티티로 변환
+            reviews = self._to_review_entities(items, product_code, product.source)
+            if not reviews:
+                continue
+            page += 1
 
-        if 'error' in result:
-            print(f"[ERROR] 크롤링 오류: {result['error']}")
-            return []
+            # 증분 크롤링: 페이지 전체가 이미 저장된 리뷰면 순회 중단 (브라우저는 제너레이터 종료 시 정리)
+            if watermark is not None and watermark.is_page_known(reviews):
+                print(f"[INFO] {page}번째 페이지가 모두 기존 리뷰 (증분 크롤링 종료)")
+                break
 
-        reviews_data = result.get("reviews", [])
-        print(f"[INFO] 총 {len(reviews_data)}개의 리뷰 수집 완료")
+            total += len(reviews)
+            yield ReviewBatch(page=page, reviews=reviews, cursor=cursor)
 
-        # 도메인 엔티티로 변환
+        print(f"[INFO] 총 {total}개의 리뷰 수집 완료")
+
+    def preflight(self, product: Product) -> Optional[ReviewSummary]:
+        """
+        지난 크롤링에서 보관한 리뷰 API 템플릿으로 1페이지만 호출해 전체 리뷰 수/최신 리뷰 확인
+        템플릿이 없거나(첫 크롤링, 만료) 호출이 실패하면 None → 전체 크롤링
+        """
+        product_code = product.source_product_id.strip()
+        captured = load_captured_request(product_code)
+        if captured is None:
+            return None
+        try:
+            items, total_count = fetch_first_page(captured)
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"[WARNING] 롯데온 사전 확인 실패: {str(e)[:80]}")
+            return None
+
+        reviews = self._to_review_entities(self._normalize_api_items(items, None, None), product_code, product.source)
+        return ReviewSummary(
+            total_count=total_count,
+            newest_review_at=max((r.review_at for r in reviews), default=None),
+            first_page=reviews,
+        )
+
+    @timed_phase("entities")
+    def _to_review_entities(self, reviews_data: List[Dict], product_code: str, platform) -> List[Review]:
+        """수집된 리뷰 dict 리스트를 Review 도메인 엔티티로 변환"""
         reviews = []
         for item in reviews_data:
             try:
@@ -74,7 +298,7 @@ class LotteonScraper(ScraperPort):
                 # Review 엔티티 생성
                 review_entity = Review.create_from_crawler(
                     product_id=product_code,
-                    platform=product.source,
+                    platform=platform,
                     content=item["content"],
                     reviewer=item["user_id"],
                     rating=rating,
@@ -114,36 +338,75 @@ class LotteonScraper(ScraperPort):
         print(f"[WARNING] 날짜 파싱 실패: {date_text}, 현재 시간 사용")
         return datetime.utcnow()
 
-    def _crawl_lotteon_reviews(self, product_code: str) -> Dict[str, Any]:
+    def _iter_with_recycling(self, product_code: str, resume_from: Optional[CrawlCursor] = None
+                             ) -> Iterator[Tuple[List[Dict], CrawlCursor]]:
         """
-        롯데온 리뷰 크롤링 메인 로직
+        메모리 감시와 함께 페이지 순회
+        브라우저 RSS / JS 힙이 상한을 넘으면 컨텍스트를 닫고, 마지막으로 넘긴 페이지의 체크포인트에서
+        새 컨텍스트로 이어서 수집 (호출 측에는 한 번의 순회로 보임)
+        """
+        watchdog = MemoryWatchdog("lotteon")
+        cursor = resume_from
+        try:
+            while True:
+                for items, cursor in self._iter_lotteon_review_pages(product_code, cursor, watchdog):
+                    yield items, cursor
+                if not watchdog.recycle_requested:
+                    return
+                watchdog.recycled()
+                print(f"[MEMORY] 컨텍스트 다시 열기 (재개 지점: {cursor})")
+        finally:
+            print(f"[MEMORY] {watchdog.summary()}")
+
+    def _iter_lotteon_review_pages(self, product_code: str, resume_from: Optional[CrawlCursor] = None,
+                                   watchdog: Optional[MemoryWatchdog] = None
+                                   ) -> Iterator[Tuple[List[Dict], CrawlCursor]]:
+        """
+        롯데온 리뷰 크롤링 메인 로직 (페이지 단위 제너레이터)
 
         Args:
             product_code: 롯데온 상품 코드 (예: LO2352433507)
+            resume_from: 체크포인트 (같은 수집 경로일 때만 적용)
+            watchdog: 페이지를 넘길 때마다 메모리 측정, 상한 초과면 재시작을 요청하고 순회 종료
 
-        Returns:
-            Dict: 크롤링 결과 {'count': int, 'reviews': List[Dict], ...}
+        Yields:
+            (List[Dict], CrawlCursor): 한 페이지 분량의 리뷰 dict (review_number 기준 중복 제외) 와 재개 지점
         """
         # 롯데온 상품 URL 생성
         url = f"https://www.lotteon.com/p/product/{product_code}"
-        all_reviews: List[Dict[str, str]] = []
+        total = 0
         product_title: Optional[str] = None
         brand_name: Optional[str] = None
 
         print(f"--- 롯데온 리뷰 크롤링 시작 (Playwright) ---")
         print(f"--- 대상 URL: {url} ---")
 
-        browser = None
+        pool = get_browser_pool()
+        request_filter = RequestFilter()
+        asset_cache = AssetCache()
+        selector_cache: Optional[SelectorCache] = None
+        # 페이지가 호출하는 리뷰 목록 API 응답 (핸들러 안에서는 참조만 보관)
+        captured_responses: List[Any] = []
+
+        def on_response(response):
+            if LOTTEON_REVIEW_API_PATTERN in response.url and \
+                    response.request.resource_type in ("xhr", "fetch") and \
+                    "json" in (response.headers or {}).get("content-type", ""):
+                captured_responses.append(response)
 
         try:
-            with sync_playwright() as p:
-                # 1. 브라우저 시작
-                browser = p.chromium.launch(headless=HEADLESS)
-                context = browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                )
+            # 1. 풀에서 브라우저 컨텍스트 발급 (Chromium 재사용)
+            with pool.new_context(
+                viewport={'width': 1920, 'height': 1080},
+                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                **fixture_replay.context_options("lotteon", product_code),
+                **storage_state_options("lotteon")
+            ) as context:
+                asset_cache.install(context)  # JS/CSS 번들은 디스크 캐시에서 (필터 통과분만)
+                request_filter.install(context)  # 이미지/폰트/광고 등 불필요한 리소스 차단
+                fixture_replay.install_replay(context, "lotteon", product_code)  # replay 모드: HAR 로 응답
                 page = context.new_page()
+                page.on("response", on_response)
 
                 # 2. 타임아웃 설정
                 page.set_default_navigation_timeout(60000)
@@ -152,35 +415,24 @@ class LotteonScraper(ScraperPort):
                 # 3. URL 접속
                 print(f"[INFO] 페이지 로딩 중...")
                 try:
-                    page.goto(url, wait_until="domcontentloaded")
+                    get_rate_limiter().acquire("lotteon")
+                    with phase("navigation"):
+                        goto_and_report(page, url, "lotteon", wait_until="domcontentloaded")
                 except Exception as e:
                     print(f"[ERROR] 페이지 로딩 실패: {e}")
-                    return {"error": f"페이지 접속 실패: {e}"}
-
-                time.sleep(random.uniform(3, 5))
+                    raise
 
                 # 4. 상품명/브랜드 추출 (다양한 셀렉터 시도)
-                title_selectors = ['h2.prd_name', '.prodName', 'h1.product-title', '.product_name']
-                for selector in title_selectors:
-                    try:
-                        elem = page.locator(selector).first
-                        if elem.is_visible(timeout=3000):
-                            product_title = elem.text_content().strip()
-                            print(f"[INFO] 상품명: {product_title[:50]}...")
-                            break
-                    except:
-                        continue
+                wait_for_selector(page, ', '.join(TITLE_SELECTORS))
+                title_match = probe_selectors(page, TITLE_SELECTORS)
+                if title_match:
+                    product_title = title_match.text
+                    print(f"[INFO] 상품명: {product_title[:50]}...")
 
-                brand_selectors = ['.brand_name', '.prd_brand', '.product-brand', 'span.brand']
-                for selector in brand_selectors:
-                    try:
-                        elem = page.locator(selector).first
-                        if elem.is_visible(timeout=3000):
-                            brand_name = elem.text_content().strip()
-                            print(f"[INFO] 브랜드: {brand_name}")
-                            break
-                    except:
-                        continue
+                brand_match = probe_selectors(page, BRAND_SELECTORS)
+                if brand_match:
+                    brand_name = brand_match.text
+                    print(f"[INFO] 브랜드: {brand_name}")
 
                 # 5. 리뷰 영역으로 스크롤 및 탭 클릭
                 print("\n" + "="*60)
@@ -193,487 +445,524 @@ class LotteonScraper(ScraperPort):
                     scroll_position = (i+1) * 600
                     page.evaluate(f"window.scrollTo(0, {scroll_position})")
                     print(f"  - 스크롤 위치: {scroll_position}px")
-                    time.sleep(1.5)  # 1초 -> 1.5초로 증가
+                    wait_for_network_idle(page, timeout_ms=1500)  # 지연 로딩 요청이 끝나면 즉시 진행
 
                 # 추가 대기 (동적 콘텐츠 로딩)
                 print("[DEBUG] 동적 콘텐츠 로딩 대기 중...")
-                time.sleep(3)
-
-                # 리뷰 탭 찾아서 클릭
-                review_tab_clicked = False
-                tab_selectors = [
-                    # 롯데온 특정 구조 (업로드된 이미지 기반)
-                    'li[data-object*="tab_type=review"]',
-                    'li[data-object*="reviewtab"]',
-                    '[data-object*="tab_type=review"]',
-
-                    # 일반적인 패턴
-                    'a[href="#pdReview"]',
-                    'a[href*="review"]',
-                    'button[aria-label*="리뷰"]',
-
-                    # 텍스트 기반
-                    'li:has-text("리뷰")',
-                    'a:has-text("리뷰")',
-                    'button:has-text("리뷰")',
-                    'li:has-text("리뷰") a',
-                    'li:has-text("리뷰") button',
-
-                    # 클래스 기반
-                    '.review-tab',
-                    '.tab-review',
-                    '.tab_review',
-                    '[data-tab="review"]',
-                    '[data-tab="pdReview"]',
-
-                    # 더 넓은 범위
-                    'nav a:has-text("리뷰")',
-                    'ul.tabs a:has-text("리뷰")',
-                    '.product-tabs a:has-text("리뷰")',
-                    '.tab-menu a:has-text("리뷰")',
-                    '.scrollTabInner li:has-text("리뷰")',
-                ]
-
-                print(f"\n[DEBUG] {len(tab_selectors)}개의 리뷰 탭 셀렉터 시도 중...")
-
-                for idx, selector in enumerate(tab_selectors, 1):
-                    print(f"\n--- 시도 #{idx}: {selector} ---")
-                    try:
-                        tabs = page.locator(selector).all()
-                        print(f"  ✓ 발견된 요소 수: {len(tabs)}개")
+                wait_for_network_idle(page)
 
-                        if not tabs:
-                            print(f"  ✗ 요소를 찾지 못함")
-                            continue
+                # 레이아웃별로 지난 크롤링에서 성공한 셀렉터를 먼저 시도
+                selector_cache = SelectorCache("lotteon", layout_signature(page, LAYOUT_MARKERS))
 
-                        for tab_idx, tab in enumerate(tabs):
-                            try:
-                                # 요소 정보 수집
-                                is_visible = tab.is_visible(timeout=1000)
-                                text_content = ""
-                                if is_visible:
-                                    try:
-                                        text_content = tab.text_content(timeout=1000)[:50]
-                                    except:
-                                        text_content = "텍스트 없음"
-                                else:
-                                    text_content = "N/A (보이지 않음)"
-
-                                print(f"  [{tab_idx}] 가시성: {is_visible}, 텍스트: '{text_content}'")
-
-                                # '정책' 포함 여부 확인
-                                if '정책' in text_content:
-                                    print(f"      → 건너뜀 ('정책' 포함)")
-                                    continue
-
-                                # '리뷰' 포함 확인 (또는 data-object에 review 포함)
-                                has_review_text = '리뷰' in text_content
-                                has_review_attr = False
-
-                                # data-object 속성 확인
-                                try:
-                                    data_obj = tab.get_attribute('data-object')
-                                    if data_obj and 'review' in data_obj.lower():
-                                        has_review_attr = True
-                                        print(f"      → data-object 속성에 'review' 포함: {data_obj[:30]}")
-                                except:
-                                    pass
-
-                                if not has_review_text and not has_review_attr and text_content != "텍스트 없음":
-                                    print(f"      → 건너뜀 ('리뷰' 미포함)")
-                                    continue
-
-                                if is_visible or text_content == "텍스트 없음" or has_review_attr:
-                                    print(f"      → 클릭 시도 중...")
-                                    try:
-                                        # 스크롤 후 클릭
-                                        tab.scroll_into_view_if_needed(timeout=2000)
-                                        time.sleep(0.5)
-                                        tab.click(timeout=5000, force=False)
-                                        print(f"      ✓ 클릭 성공!")
-                                        review_tab_clicked = True
-                                        time.sleep(4)  # 클릭 후 대기 시간 증가
-                                        break
-                                    except Exception as click_error:
-                                        print(f"      ✗ 일반 클릭 실패, JavaScript 클릭 시도...")
-                                        try:
-                                            # JavaScript 클릭 시도
-                                            page.evaluate(f"""
-                                                document.querySelectorAll('{selector}')[{tab_idx}]?.click()
-                                            """)
-                                            print(f"      ✓ JavaScript 클릭 성공!")
-                                            review_tab_clicked = True
-                                            time.sleep(4)
-                                            break
-                                        except:
-                                            print(f"      ✗ JavaScript 클릭도 실패: {str(click_error)[:30]}...")
-                                else:
-                                    print(f"      → 건너뜀 (보이지 않음)")
-
-                            except Exception as e:
-                                print(f"      ✗ 요소 처리 실패: {str(e)[:50]}...")
-                                continue
-
-                        if review_tab_clicked:
-                            print(f"\n★★★ 리뷰 탭 클릭 성공! (셀렉터: {selector}) ★★★")
-                            break
-                        else:
-                            print(f"  ✗ 클릭 가능한 요소 없음")
-
-                    except Exception as e:
-                        print(f"  ✗ 에러 발생: {str(e)[:50]}...")
-                        continue
+                # 리뷰 탭 찾아서 클릭 (후보 전체를 한 번의 evaluate 로 확인)
+                tab_selectors = selector_cache.ordered("tab", REVIEW_TAB_SELECTORS)
+                print(f"\n[DEBUG] {len(tab_selectors)}개의 리뷰 탭 셀렉터 확인 중...")
+                review_tab_selector = self._click_review_tab(page, tab_selectors)
+                if review_tab_selector:
+                    selector_cache.record("tab", review_tab_selector)
+                    wait_for_selector(page, REVIEW_ITEM_SELECTOR, state="attached")
 
                 print("\n" + "="*60)
-                if review_tab_clicked:
+                if review_tab_selector:
                     print("[SUCCESS] 리뷰 탭 클릭 완료")
                 else:
                     print("[WARNING] 리뷰 탭을 찾지 못함 - 스크롤로 대체")
+                    selector_cache.invalidate("tab")
                     # 리뷰 영역까지 스크롤
                     print("[DEBUG] 페이지 하단으로 스크롤 중...")
                     page.evaluate("window.scrollTo(0, document.body.scrollHeight * 0.6)")
-                    time.sleep(2)
                 print("="*60 + "\n")
 
                 # 6. 리뷰 컨테이너가 로드될 때까지 대기
-                time.sleep(3)
+                if not wait_for_selector(page, REVIEW_ITEM_SELECTOR, state="attached"):
+                    print("[WARNING] 리뷰 아이템이 제한 시간 내 나타나지 않음")
+                else:
+                    save_storage_state(context, "lotteon")  # 리뷰까지 정상 로드된 세션 (주기마다 갱신)
 
                 # 7. 페이지네이션 처리 및 리뷰 수집
                 print("[INFO] 리뷰 수집 시작...")
 
-                # 현재 페이지(1페이지) 리뷰 먼저 수집
-                all_reviews = []
-                self._collect_reviews_from_current_page(page, all_reviews, product_title, brand_name)
-
-                # 페이지네이션 확인
-                print("\n[INFO] 페이지네이션 확인 중...")
-                time.sleep(2)  # 리뷰 로딩 대기
-
-                # 페이지네이션 방식 확인 (페이지 번호 우선)
-                pagination_exists = False
-                pagination_selectors = [
-                    '.paginationArea a',
-                    '.pagination a',
-                    'div[class*="pagination"] a',
-                    'a[data-v-e6ad9102]',
-                ]
-
-                print("[DEBUG] 페이지 번호 방식 확인 중...")
-                for selector in pagination_selectors:
+                # 리뷰 목록 API를 캡처했다면 API로 직접 페이지 수집, 아니면 DOM 클릭 폴백
+                api_resume = resume_from if resume_from and resume_from.applies_to("api") else None
+                # (API 페이지는 httpx 로 받으므로 브라우저 메모리가 늘지 않음 → 메모리 감시는 DOM 경로에서만)
+                for items, cursor in self._iter_via_review_api(context, captured_responses, product_title,
+                                                               brand_name, api_resume, product_code):
+                    total += len(items)
+                    yield items, cursor
+                if not total and api_resume is not None:
+                    # API 체크포인트에서 재개했는데 새 페이지가 없으면 마지막 페이지까지 이미 저장된 것 → 완료
+                    # (DOM 으로 처음부터 다시 돌지 않음, API 를 캡처하지 못했으면 재시도에 맡김)
+                    if not captured_responses:
+                        raise RuntimeError("재개할 리뷰 API 요청을 캡처하지 못함")
+                    print(f"[INFO] 리뷰 API 체크포인트({api_resume.page}페이지) 이후 새 페이지 없음 - 수집 완료")
+                elif not total:
+                    dom_resume = resume_from if resume_from and resume_from.applies_to("dom") else None
+                    archive = get_snapshot_recorder("lotteon", product_code)  # 원본 보관 (켜져 있을 때만)
+                    # 파싱은 워커에 넘기고 브라우저는 바로 다음 페이지로 (중단/오류 시 남은 파싱 취소)
+                    pipeline = ParsePipeline(extract_lotteon_page) if PARSE_PIPELINE_ENABLED else None
                     try:
-                        # 숫자 "2"가 있는지 확인 (2페이지가 있다면 페이지네이션 존재)
-                        page_two = page.locator(f'{selector}:has-text("2")').first
-                        if page_two.is_visible(timeout=2000):
-                            pagination_exists = True
-                            print(f"  ✓ 페이지네이션 발견: {selector}")
-                            break
-                    except:
-                        continue
+                        for items, cursor in self._iter_via_dom_pagination(page, product_title, brand_name,
+                                                                           dom_resume, selector_cache, archive,
+                                                                           pipeline):
+                            total += len(items)
+                            yield items, cursor
+                            if watchdog is not None and watchdog.check(page):
+                                return
+                    finally:
+                        if pipeline is not None:
+                            pipeline.close()
+                            print(f"[PIPELINE] {pipeline.summary()}")
 
-                if pagination_exists:
-                    # 페이지 번호 방식
-                    print("[INFO] 페이지 번호 방식으로 리뷰 수집")
-
-                    max_pages = 50  # 최대 50페이지까지 시도
-                    failed_attempts = 0
-                    max_failed_attempts = 2  # 연속 2번 실패하면 중단
-
-                    page_num = 2
-                    while page_num <= max_pages and failed_attempts < max_failed_attempts:
-                        print(f"\n[INFO] 페이지 {page_num} 이동 시도...")
-                        page_clicked = False
-
-                        # 1. 먼저 페이지 번호가 직접 보이는지 확인
-                        for selector in pagination_selectors:
-                            try:
-                                page_links = page.locator(f'{selector}:has-text("{page_num}")').all()
-
-                                for link in page_links:
-                                    try:
-                                        if link.is_visible(timeout=1000):
-                                            link.scroll_into_view_if_needed()
-                                            link.click(timeout=3000)
-                                            print(f"  ✓ 페이지 {page_num} 클릭 성공")
-                                            page_clicked = True
-                                            time.sleep(random.uniform(2, 3))
-
-                                            # 이 페이지의 리뷰 수집
-                                            self._collect_reviews_from_current_page(page, all_reviews, product_title, brand_name)
-                                            failed_attempts = 0  # 성공 시 실패 카운트 리셋
-                                            break
-                                    except:
-                                        continue
-
-                                if page_clicked:
-                                    break
-                            except:
-                                continue
-
-                        # 2. 페이지 번호가 안 보이면 ">" (다음) 버튼 클릭
-                        if not page_clicked:
-                            print(f"  - 페이지 {page_num} 버튼이 보이지 않음, '다음' 버튼 시도...")
-
-                            next_button_selectors = [
-                                'a.next:has-text(">")',
-                                'a:has-text(">")',
-                                'button:has-text(">")',
-                                '.pagination a.next',
-                                'a[class*="next"]',
-                                '.paginationArea a.next',
-                            ]
-
-                            next_clicked = False
-                            for selector in next_button_selectors:
-                                try:
-                                    next_btn = page.locator(selector).first
-                                    if next_btn.is_visible(timeout=1000):
-                                        next_btn.scroll_into_view_if_needed()
-                                        next_btn.click(timeout=3000)
-                                        print(f"  ✓ '다음' 버튼 클릭 성공")
-                                        next_clicked = True
-                                        time.sleep(random.uniform(2, 3))
-
-                                        # '다음' 클릭 후 다시 해당 페이지 번호 찾아서 클릭
-                                        for sel in pagination_selectors:
-                                            try:
-                                                page_links = page.locator(f'{sel}:has-text("{page_num}")').all()
-                                                for link in page_links:
-                                                    if link.is_visible(timeout=1000):
-                                                        link.click(timeout=3000)
-                                                        print(f"  ✓ 페이지 {page_num} 클릭 성공")
-                                                        page_clicked = True
-                                                        time.sleep(random.uniform(2, 3))
-
-                                                        # 이 페이지의 리뷰 수집
-                                                        self._collect_reviews_from_current_page(page, all_reviews, product_title, brand_name)
-                                                        failed_attempts = 0
-                                                        break
-                                                if page_clicked:
-                                                    break
-                                            except:
-                                                continue
-                                        break
-                                except:
-                                    continue
-
-                            if not next_clicked:
-                                print(f"  ✗ '다음' 버튼도 찾을 수 없음")
-                                failed_attempts += 1
-
-                        if not page_clicked:
-                            print(f"  ✗ 페이지 {page_num}에 접근 실패 (실패 {failed_attempts}/{max_failed_attempts})")
-                            failed_attempts += 1
-
-                        page_num += 1
-
-                    if failed_attempts >= max_failed_attempts:
-                        print(f"\n[INFO] 연속 {max_failed_attempts}번 실패 - 마지막 페이지로 판단")
+                print("\n[INFO] 리뷰 로딩 완료")
+                fixture_replay.save_html_snapshot(page, "lotteon", product_code)
 
-                else:
-                    # '더보기' 버튼 방식 (페이지네이션이 없을 때만)
-                    print("[DEBUG] '더보기' 버튼 확인 중...")
+                # 컨텍스트는 with 블록 종료 시 닫힘
+                print(f"\n[SUCCESS] 총 {total}개의 리뷰 수집 완료")
 
-                    more_btn_selectors = [
-                        'div#review button:has-text("더보기")',  # 리뷰 영역 내부로 한정
-                        'div.productReviewWrap button:has-text("더보기")',
-                        'button.review-more:has-text("더보기")',
-                    ]
+        except Exception as e:
+            # 이미 넘긴 페이지는 호출 측에서 저장됨 → 오류는 그대로 올려 재시도에 맡긴다
+            print(f"[FATAL ERROR] 크롤링 중 치명적 오류: {e}")
+            import traceback
+            traceback.print_exc()
+            if isinstance(e, CrawlBlockedError):
+                invalidate_storage_state("lotteon")
+            raise
+        finally:
+            print(f"[POOL] {pool.get_stats()}")
+            print(f"[FILTER] {request_filter.summary()}")
+            print(f"[CACHE] {asset_cache.summary()}")
+            print(f"[RATE] {get_rate_limiter().get_stats()}")
+            print(f"[AIMD] {get_crawl_controller().get_stats()}")
+            if selector_cache is not None:
+                print(f"[SELECTOR] {selector_cache.summary()}")
+
+    def _click_review_tab(self, page, tab_selectors: List[str]) -> Optional[str]:
+        """
+        리뷰 탭 클릭 ('정책' 탭 제외, 텍스트 또는 속성값에 리뷰 표시가 있는 요소만)
+        보이는 탭을 먼저 찾고, 없으면 data-object 등 속성으로만 표시된 숨은 탭을 JavaScript 로 클릭
 
-                    more_btn_found = False
-                    for selector in more_btn_selectors:
-                        try:
-                            btn = page.locator(selector).first
-                            if btn.is_visible(timeout=2000):
-                                more_btn_found = True
-                                print(f"  ✓ '더보기' 버튼 발견: {selector}")
-                                break
-                        except:
+        Returns:
+            클릭에 성공한 셀렉터 (실패 시 None)
+        """
+        get_rate_limiter().acquire("lotteon")  # 탭 클릭이 리뷰 목록 요청을 발생시킴
+        match = probe_selectors(page, tab_selectors, require_any=["리뷰", "review"], exclude_any=["정책"])
+        if match:
+            print(f"  ✓ 리뷰 탭 발견: #{match.index + 1} {match.selector} ('{match.text[:30]}')")
+            tab = match.locator(page)
+            try:
+                tab.scroll_into_view_if_needed(timeout=2000)
+                tab.click(timeout=5000)
+                print(f"  ✓ 클릭 성공!")
+                return match.selector
+            except Exception as click_error:
+                print(f"  ✗ 일반 클릭 실패, JavaScript 클릭 시도... ({str(click_error)[:30]})")
+
+        hidden = probe_selectors(page, tab_selectors, visible=False, require_any=["review"], exclude_any=["정책"])
+        if hidden:
+            try:
+                hidden.locator(page).evaluate("el => el.click()")
+                print(f"  ✓ JavaScript 클릭 성공! ({hidden.selector})")
+                return hidden.selector
+            except Exception as e:
+                print(f"  ✗ JavaScript 클릭도 실패: {str(e)[:30]}...")
+        return None
+
+    def _iter_via_review_api(self, context, captured_responses: List[Any], product_title: Optional[str],
+                             brand_name: Optional[str], resume_from: Optional[CrawlCursor] = None,
+                             product_code: Optional[str] = None) -> Iterator[Tuple[List[Dict], CrawlCursor]]:
+        """
+        캡처한 리뷰 목록 API 요청을 템플릿으로 페이지를 직접 호출해 yield
+        첫 페이지를 넘기기 전에 실패하면 다음 후보로, 후보가 없으면 아무것도 yield 하지 않음 (→ DOM 폴백)
+        동작한 템플릿은 사전 확인(preflight)용으로 보관
+        """
+        start_page = resume_from.page + 1 if resume_from else 1
+        if resume_from:
+            print(f"[INFO] 체크포인트에서 재개: 리뷰 API {start_page}페이지부터")
+        for response in captured_responses:
+            yielded = 0
+            try:
+                captured = CapturedReviewRequest.from_playwright_request(response.request)
+                if captured is None:
+                    continue
+
+                cookies = {c["name"]: c["value"] for c in context.cookies()}
+                seen_numbers = set()
+                for page_no, items in iter_review_pages(captured, response.json(), cookies, start_page):
+                    if not yielded:
+                        print(f"[INFO] 리뷰 API 캡처 성공: {captured.method} {captured.url[:80]}...")
+                        if product_code:
+                            save_captured_request(product_code, captured)
+                    page_reviews = []
+                    for item in self._normalize_api_items(items, product_title, brand_name):
+                        if item["review_number"] and item["review_number"] in seen_numbers:
                             continue
+                        seen_numbers.add(item["review_number"])
+                        page_reviews.append(item)
+                    yielded += len(page_reviews)
+                    yield page_reviews, CrawlCursor(strategy="api", page=page_no,
+                                                    last_review_number=self._last_review_number(page_reviews))
 
-                    if more_btn_found:
-                        print("[INFO] '더보기' 버튼 클릭 시작...")
-                        load_more_count = 0
-                        max_attempts = 10
-
-                        while load_more_count < max_attempts:
-                            clicked = False
-                            for selector in more_btn_selectors:
-                                try:
-                                    btn = page.locator(selector).first
-                                    if btn.is_visible(timeout=2000) and btn.is_enabled():
-                                        btn.scroll_into_view_if_needed()
-                                        btn.click(timeout=3000)
-                                        load_more_count += 1
-                                        print(f"  ✓ '더보기' 클릭 #{load_more_count}")
-                                        time.sleep(random.uniform(2, 3))
-                                        clicked = True
-                                        break
-                                except:
-                                    continue
-
-                            if not clicked:
-                                print("  ✗ 더 이상 '더보기' 버튼 없음")
-                                break
+                if not yielded:
+                    continue
+                print(f"  ✓ API로 {yielded}개 리뷰 수집")
+                return
+            except CrawlBlockedError:
+                raise  # 차단된 상태로 DOM 폴백을 돌지 않는다
+            except Exception as e:
+                if yielded:
+                    # 일부 페이지를 이미 넘겼으면 DOM으로 처음부터 다시 돌지 않고 실패로 올린다
+                    raise
+                print(f"  ✗ 리뷰 API 호출 실패: {str(e)[:80]}")
+                continue
+
+        print("[INFO] 리뷰 API를 캡처하지 못함 - DOM 페이지네이션으로 수집")
+
+    @timed_phase("extraction")
+    def _normalize_api_items(self, items: List[Dict], product_title: Optional[str],
+                             brand_name: Optional[str]) -> List[Dict]:
+        """API 리뷰 dict에 DOM 수집과 같은 본문 정리/길이 제한을 적용 (짧은 리뷰 제외)"""
+        normalized = []
+        for item in items:
+            content = self._clean_review_content(item["content"])
+            if len(content) < 10:
+                continue
+            normalized.append(dict(item, product_title=product_title, brand_name=brand_name, content=content[:1000]))
+        return normalized
+
+    def _iter_via_dom_pagination(self, page, product_title: Optional[str], brand_name: Optional[str],
+                                 resume_from: Optional[CrawlCursor] = None,
+                                 selector_cache: Optional[SelectorCache] = None,
+                                 archive: Optional[SnapshotRecorder] = None,
+                                 pipeline: Optional[ParsePipeline] = None
+                                 ) -> Iterator[Tuple[List[Dict], CrawlCursor]]:
+        """
+        DOM 클릭 기반 페이지네이션/더보기로 리뷰를 페이지 단위로 yield (API 캡처 실패 시 폴백)
+        resume_from: 저장된 페이지 번호까지는 이동만 하고, 더보기는 저장된 횟수만큼 다시 누른 뒤 이어서 수집
+        selector_cache: 페이지네이션/더보기/아이템 패턴 셀렉터 캐시 (없으면 고정 순서로 시도)
+        archive: 수집한 페이지의 리뷰 컨테이너 HTML 보관 (재파싱용)
+        pipeline: 있으면 수집한 HTML 파싱을 워커에 넘기고 다음 페이지로 진행 (결과는 끝난 순서가 아니라 페이지 순서로 yield)
+        """
+        selector_cache = selector_cache or SelectorCache("lotteon", enabled=False)
+        # 수집한 review_number (중복 방지용, 리뷰 본문은 들고 있지 않음)
+        seen_numbers = set()
+        resume_page = resume_from.page if resume_from else 0
+        resume_clicks = resume_from.more_clicks if resume_from else 0
+
+        # 현재 페이지(1페이지) 리뷰 먼저 수집 (재개 시에는 이미 저장됨)
+        if resume_from is None:
+            yield from self._collect_pages(page, pipeline, seen_numbers, product_title, brand_name, selector_cache,
+                                           archive, strategy="dom", page=1)
+        elif not resume_clicks:
+            # 이미 저장된 1페이지 리뷰 번호만 기록 (더보기 방식 중복 방지)
+            self._collect_reviews_from_current_page(page, seen_numbers, product_title, brand_name, selector_cache)
+
+        # 페이지네이션 확인
+        print("\n[INFO] 페이지네이션 확인 중...")
+
+        # 페이지네이션 방식 확인 (페이지 번호 우선)
+        pagination_exists = False
+        pagination_selectors = selector_cache.ordered("pagination", PAGINATION_SELECTORS)
+
+        print("[DEBUG] 페이지 번호 방식 확인 중...")
+        # 숫자 "2"가 있는지 확인 (2페이지가 있다면 페이지네이션 존재)
+        page_two = probe_selectors(page, [f'{selector}:has-text("2")' for selector in pagination_selectors])
+        if page_two:
+            pagination_exists = True
+            selector = pagination_selectors[page_two.index]
+            print(f"  ✓ 페이지네이션 발견: {selector}")
+            selector_cache.record("pagination", selector)
+        else:
+            selector_cache.invalidate("pagination")
+
+        if pagination_exists:
+            # 페이지 번호 방식
+            print("[INFO] 페이지 번호 방식으로 리뷰 수집")
+
+            max_pages = 50  # 최대 50페이지까지 시도
+            failed_attempts = 0
+            max_failed_attempts = 2  # 연속 2번 실패하면 중단
+
+            page_num = 2
+            while page_num <= max_pages and failed_attempts < max_failed_attempts:
+                print(f"\n[INFO] 페이지 {page_num} 이동 시도...")
+                page_clicked, next_found = self._go_to_page(page, page_num, pagination_selectors, selector_cache)
+
+                if page_clicked:
+                    failed_attempts = 0  # 성공 시 실패 카운트 리셋
+                    if page_num <= resume_page:
+                        # 체크포인트 이전 페이지 → 이동만 하고 수집 생략
+                        print(f"  - 페이지 {page_num}는 이미 저장됨 (체크포인트 {resume_page}페이지)")
                     else:
-                        print("[INFO] 페이지네이션 없음 - 현재 페이지 리뷰만 수집")
+                        # 이 페이지의 리뷰 수집
+                        yield from self._collect_pages(page, pipeline, seen_numbers, product_title, brand_name,
+                                                       selector_cache, archive, strategy="dom", page=page_num)
+                else:
+                    if not next_found:
+                        print(f"  ✗ '다음' 버튼도 찾을 수 없음")
+                        failed_attempts += 1
+                    print(f"  ✗ 페이지 {page_num}에 접근 실패 (실패 {failed_attempts}/{max_failed_attempts})")
+                    failed_attempts += 1
 
-                print("\n[INFO] 리뷰 로딩 완료")
+                page_num += 1
 
-                # 브라우저 종료 및 결과 반환
-                print(f"\n[SUCCESS] 총 {len(all_reviews)}개의 리뷰 수집 완료")
-                browser.close()
+            if failed_attempts >= max_failed_attempts:
+                print(f"\n[INFO] 연속 {max_failed_attempts}번 실패 - 마지막 페이지로 판단")
+
+        else:
+            # '더보기' 버튼 방식 (페이지네이션이 없을 때만)
+            print("[DEBUG] '더보기' 버튼 확인 중...")
+
+            more_btn_selectors = selector_cache.ordered("more", MORE_BUTTON_SELECTORS)
+
+            more_btn = probe_selectors(page, more_btn_selectors)
+            if more_btn:
+                print(f"  ✓ '더보기' 버튼 발견: {more_btn.selector}")
+                selector_cache.record("more", more_btn.selector)
+
+                print("[INFO] '더보기' 버튼 클릭 시작...")
+                load_more_count = 0
+                max_attempts = 10
+
+                while load_more_count < max_attempts:
+                    clicked = False
+                    more_btn = probe_selectors(page, more_btn_selectors, enabled=True)
+                    if more_btn:
+                        try:
+                            btn = more_btn.locator(page)
+                            btn.scroll_into_view_if_needed()
+                            before_count = count_elements(page, REVIEW_ITEM_SELECTOR)
+                            get_rate_limiter().acquire("lotteon")
+                            btn.click(timeout=3000)
+                            load_more_count += 1
+                            print(f"  ✓ '더보기' 클릭 #{load_more_count}")
+                            wait_for_count_increase(page, REVIEW_ITEM_SELECTOR, before_count)
+                            clicked = True
+                        except Exception:
+                            pass
+
+                    if not clicked:
+                        print("  ✗ 더 이상 '더보기' 버튼 없음")
+                        break
+
+                    if load_more_count < resume_clicks:
+                        continue  # 체크포인트까지는 클릭만 재실행
+                    if load_more_count == resume_clicks:
+                        # 재실행 완료 → 이미 저장된 리뷰 번호만 기록 (yield 하지 않음)
+                        self._collect_reviews_from_current_page(page, seen_numbers, product_title, brand_name,
+                                                                selector_cache)
+                        if resume_from.last_review_number and resume_from.last_review_number not in seen_numbers:
+                            print("  [WARNING] 체크포인트의 마지막 리뷰를 찾지 못함 (목록 변경) - 이후 리뷰만 수집")
+                        continue
 
+                    # 더보기로 새로 붙은 리뷰 수집 (review_number 기준 중복 제외)
+                    yield from self._collect_pages(page, pipeline, seen_numbers, product_title, brand_name,
+                                                   selector_cache, archive, strategy="dom", page=1,
+                                                   more_clicks=load_more_count)
+            else:
+                selector_cache.invalidate("more")
+                print("[INFO] 페이지네이션 없음 - 현재 페이지 리뷰만 수집")
+
+        # 파싱 대기 중인 마지막 페이지들
+        if pipeline is not None:
+            yield from self._finish_pages(pipeline.drain(), seen_numbers, product_title, brand_name, selector_cache)
+
+    def _collect_pages(self, page, pipeline: Optional[ParsePipeline], seen_numbers: Set[str],
+                       product_title: Optional[str], brand_name: Optional[str], selector_cache: SelectorCache,
+                       archive: Optional[SnapshotRecorder], **cursor_fields) -> List[Tuple[List[Dict], CrawlCursor]]:
+        """
+        현재 페이지 수집 → 파싱이 끝난 (items, cursor) 목록
+        파이프라인이 없으면 브라우저에서 바로 추출한 현재 페이지 1개, 있으면 HTML 만 넘기고 앞서 끝난 페이지들
+        (두 경로 모두 셀렉터 캐시의 아이템 패턴 순서로 찾고, 찾은 패턴을 캐시에 기록)
+        """
+        if pipeline is None:
+            items = self._collect_reviews_from_current_page(page, seen_numbers, product_title, brand_name,
+                                                            selector_cache, archive)
+            return [(items, CrawlCursor(**cursor_fields, last_review_number=self._last_review_number(items)))]
+
+        order = selector_cache.ordered("item", ITEM_PATTERN_NAMES)
+        html = self._capture_review_html(page, order, archive)
+        return self._finish_pages(pipeline.submit((html, order), cursor_fields), seen_numbers, product_title,
+                                  brand_name, selector_cache)
+
+    def _finish_pages(self, parsed: List[Tuple[Optional[Dict[str, Any]], Dict[str, Any]]], seen_numbers: Set[str],
+                      product_title: Optional[str], brand_name: Optional[str],
+                      selector_cache: SelectorCache) -> List[Tuple[List[Dict], CrawlCursor]]:
+        """워커가 추출한 {pattern, items} → 리뷰 dict + 체크포인트 (중복 제외/패턴 기록은 페이지 순서대로 여기서)"""
+        pages = []
+        for result, cursor_fields in parsed:
+            self._record_item_pattern(selector_cache, result)
+            items = self._build_page_reviews((result or {}).get("items") or [], seen_numbers,
+                                             product_title, brand_name)
+            pages.append((items, CrawlCursor(**cursor_fields, last_review_number=self._last_review_number(items))))
+        return pages
+
+    def _record_item_pattern(self, selector_cache: SelectorCache, result: Optional[Dict[str, Any]]) -> None:
+        """아이템을 찾은 패턴을 캐시 앞으로 (못 찾았으면 캐시 무효화)"""
+        if result and result.get("pattern"):
+            selector_cache.record("item", result["pattern"])
+        else:
+            selector_cache.invalidate("item")
+
+    @timed_phase("extraction")
+    def _capture_review_html(self, page, order: List[str], archive: Optional[SnapshotRecorder] = None) -> str:
+        """현재 페이지의 리뷰 컨테이너 HTML (order: 컨테이너가 없을 때 시도할 아이템 패턴 이름 순서, 실패 시 빈 문자열)"""
+        try:
+            html = page.evaluate(REVIEW_HTML_JS, [REVIEW_CONTAINER_SELECTOR,
+                                                  [LOTTEON_ITEM_PATTERNS[name] for name in order]]) or ""
         except Exception as e:
-            print(f"[FATAL ERROR] 크롤링 중 치명적 오류: {e}")
-            import traceback
-            traceback.print_exc()
-            if browser:
-                try:
-                    browser.close()
-                except:
-                    pass
-            return {"error": str(e)}
-
-        return {
-            "count": len(all_reviews),
-            "reviews": all_reviews,
-            "product_title": product_title,
-            "brand_name": brand_name
-        }
+            print(f"  ✗ 페이지 수집 중 오류: {e}")
+            return ""
+        if archive:
+            archive.add(html, "lotteon_html", url=page.url)
+        return html
+
+    def _last_review_number(self, items: List[Dict]) -> Optional[str]:
+        return items[-1].get("review_number") if items else None
+
+    def _go_to_page(self, page, page_num: int, pagination_selectors: List[str],
+                    selector_cache: Optional[SelectorCache] = None):
+        """
+        페이지 번호 링크 클릭 (보이지 않으면 '다음' 버튼 후 재시도)
+
+        Returns:
+            (page_clicked, next_found)
+        """
+        if self._click_page_number(page, page_num, pagination_selectors):
+            return True, True
+
+        # 페이지 번호가 안 보이면 ">" (다음) 버튼 클릭
+        print(f"  - 페이지 {page_num} 버튼이 보이지 않음, '다음' 버튼 시도...")
+
+        selector_cache = selector_cache or SelectorCache("lotteon", enabled=False)
+        next_btn = probe_selectors(page, selector_cache.ordered("next", NEXT_BUTTON_SELECTORS))
+        if next_btn:
+            try:
+                button = next_btn.locator(page)
+                button.scroll_into_view_if_needed()
+                get_rate_limiter().acquire("lotteon")
+                button.click(timeout=3000)
+                print(f"  ✓ '다음' 버튼 클릭 성공")
+                selector_cache.record("next", next_btn.selector)
+                wait_for_network_idle(page)
+
+                # '다음' 클릭 후 다시 해당 페이지 번호 찾아서 클릭
+                return self._click_page_number(page, page_num, pagination_selectors), True
+            except Exception:
+                pass
+
+        selector_cache.invalidate("next")
+        return False, False
+
+    def _click_page_number(self, page, page_num: int, pagination_selectors: List[str]) -> bool:
+        """보이는 페이지 번호 링크를 클릭하고 목록이 교체될 때까지 대기"""
+        page_link = probe_selectors(page, [f'{selector}:has-text("{page_num}")' for selector in pagination_selectors])
+        if not page_link:
+            return False
 
-    def _collect_reviews_from_current_page(self, page, all_reviews: List[Dict], product_title: Optional[str], brand_name: Optional[str]):
-        """현재 페이지의 리뷰를 수집하는 헬퍼 메서드"""
         try:
-            # HTML 파싱
-            html_content = page.content()
-            soup = BeautifulSoup(html_content, 'html.parser')
-
-            # 리뷰 아이템 찾기
-            review_items = []
-            item_patterns = [
-                ('div', {'data-review-number': True}),
-                ('div', {'class': 'reviewList'}),
-                ('div', {'class': lambda x: x and any('review' in str(c).lower() and 'item' in str(c).lower() for c in x) if x else False}),
-                ('li', {'class': lambda x: x and 'review' in ' '.join(x).lower() if x else False}),
-            ]
-
-            for tag, attrs in item_patterns:
-                items = soup.find_all(tag, attrs, limit=200)
-                if items:
-                    review_items = items
-                    print(f"  ✓ {len(items)}개의 리뷰 아이템 발견")
-                    break
-
-            if not review_items:
-                print("  ✗ 이 페이지에서 리뷰를 찾지 못했습니다.")
-                return
+            link = page_link.locator(page)
+            link.scroll_into_view_if_needed()
+            signature = content_signature(page, REVIEW_ITEM_SELECTOR)
+            get_rate_limiter().acquire("lotteon")
+            link.click(timeout=3000)
+            print(f"  ✓ 페이지 {page_num} 클릭 성공")
+            wait_for_content_change(page, REVIEW_ITEM_SELECTOR, signature)
+            return True
+        except Exception:
+            return False
+
+    @timed_phase("extraction")
+    def _collect_reviews_from_current_page(self, page, seen_numbers: Set[str], product_title: Optional[str],
+                                           brand_name: Optional[str], selector_cache: Optional[SelectorCache] = None,
+                                           archive: Optional[SnapshotRecorder] = None) -> List[Dict]:
+        """
+        현재 페이지의 리뷰를 수집하는 헬퍼 메서드 (seen_numbers 에 없는, 새로 추가된 리뷰 반환)
+        리뷰 컨테이너 안에서 브라우저가 직접 필드를 뽑아 compact JSON 으로 반환 (page.content() 직렬화 없음)
+        archive 가 있으면 같은 evaluate 에서 컨테이너 HTML 도 받아 보관
+        """
+        selector_cache = selector_cache or SelectorCache("lotteon", enabled=False)
+        try:
+            result = page.evaluate(EXTRACT_REVIEWS_JS, [REVIEW_CONTAINER_SELECTOR,
+                                                        selector_cache.ordered("item", ITEM_PATTERN_NAMES),
+                                                        archive is not None])
+        except Exception as e:
+            print(f"  ✗ 페이지 수집 중 오류: {e}")
+            return []
 
-            # 중복 방지를 위한 review_number 세트
-            existing_review_numbers = {r.get('review_number') for r in all_reviews}
+        if archive and result:
+            archive.add(result.get("html"), "lotteon_html", url=page.url)
 
-            # 각 리뷰 파싱
-            page_review_count = 0
-            for idx, item in enumerate(review_items, 1):
-                try:
-                    review_number = item.get('data-review-number', f'unknown_{idx}')
+        raw_items = (result or {}).get("items") or []
+        self._record_item_pattern(selector_cache, result)
+        return self._build_page_reviews(raw_items, seen_numbers, product_title, brand_name)
 
-                    # 중복 체크
-                    if review_number in existing_review_numbers:
-                        continue
+    def parse_review_html(self, html: str, seen_numbers: Set[str], product_title: Optional[str],
+                          brand_name: Optional[str]) -> List[Dict]:
+        """
+        저장된 페이지/컨테이너 HTML 에서 리뷰 수집 (EXTRACT_REVIEWS_JS 와 같은 패턴을 html_backend 파서로 적용)
+        """
+        return self._build_page_reviews(extract_lotteon_items(html), seen_numbers, product_title, brand_name)
+
+    def parse_review_entities(self, html: str, product_code: str) -> List[Review]:
+        """보관된 컨테이너 HTML → Review 엔티티 (스냅샷 재파싱용)"""
+        items = self.parse_review_html(html, set(), None, None)
+        return self._to_review_entities(items, product_code, ReviewPlatform.LOTTEON)
+
+    def _build_page_reviews(self, raw_items: List[Dict], seen_numbers: Set[str], product_title: Optional[str],
+                            brand_name: Optional[str]) -> List[Dict]:
+        """추출된 원본 필드 → 리뷰 dict (중복 제외, 본문 정리, 평점 변환)"""
+        page_reviews: List[Dict] = []
+        if not raw_items:
+            print("  ✗ 이 페이지에서 리뷰를 찾지 못했습니다.")
+            return page_reviews
+        print(f"  ✓ {len(raw_items)}개의 리뷰 아이템 발견")
 
-                    # 리뷰 내용
-                    content_selectors = [
-                        'div.reviewContent',
-                        'div[class*="reviewContent"]',
-                        '.review-content',
-                        'p.content',
-                    ]
-                    content = None
-                    for sel in content_selectors:
-                        elem = item.select_one(sel)
-                        if elem:
-                            content = elem.get_text('\n', strip=True)
-                            break
-
-                    if not content:
-                        content = item.get_text('\n', strip=True)
-
-                    if not content or len(content) < 10:
-                        continue
+        try:
+            for raw in raw_items:
+                review_number = raw.get("review_number")
 
-                    # 불필요한 텍스트 제거
-                    content = self._clean_review_content(content)
-
-                    # 작성자
-                    user_selectors = ['span.userName', 'div[class*="userName"]', '.reviewer', 'span.name']
-                    user_id = "익명"
-                    for sel in user_selectors:
-                        elem = item.select_one(sel)
-                        if elem:
-                            user_id = elem.get_text(strip=True)
-                            break
-
-                    # 평점
-                    rating_selectors = ['span.rating', 'div[class*="rating"]', '.rating', '.star']
-                    rating = 5.0
-                    for sel in rating_selectors:
-                        elem = item.select_one(sel)
-                        if elem:
-                            text = elem.get_text(strip=True)
-                            import re
-                            match = re.search(r'(\d+(?:\.\d+)?)', text)
-                            if match:
-                                rating = float(match.group(1))
-                                if rating > 5:
-                                    rating = 5.0
-                            else:
-                                star_count = text.count('★')
-                                if star_count > 0:
-                                    rating = float(star_count)
-                            break
-
-                    # 날짜
-                    date_selectors = ['span.date', 'div[class*="date"]', '.date', 'time']
-                    date_text = ""
-                    for sel in date_selectors:
-                        elem = item.select_one(sel)
-                        if elem:
-                            date_text = elem.get_text(strip=True)
-                            break
-
-                    # 옵션
-                    option_selectors = ['div.option', 'span[class*="option"]', '.option']
-                    option = None
-                    for sel in option_selectors:
-                        elem = item.select_one(sel)
-                        if elem:
-                            option = elem.get_text(strip=True)
-                            break
-
-                    all_reviews.append({
-                        "product_title": product_title,
-                        "brand_name": brand_name,
-                        "user_id": user_id,
-                        "rating": rating,
-                        "option": option,
-                        "content": content[:1000],
-                        "date": date_text,
-                        "review_number": review_number
-                    })
-                    page_review_count += 1
+                # 중복 체크
+                if review_number in seen_numbers:
+                    continue
 
-                except Exception as e:
+                content = raw.get("content") or ""
+                if len(content) < 10:
                     continue
 
-            print(f"  ✓ 이 페이지에서 {page_review_count}개 리뷰 수집 (중복 제외)")
+                # 불필요한 텍스트 제거
+                content = self._clean_review_content(content)
+
+                page_reviews.append({
+                    "product_title": product_title,
+                    "brand_name": brand_name,
+                    "user_id": raw.get("user") or "익명",
+                    "rating": self._parse_rating_text(raw.get("rating")),
+                    "option": raw.get("option"),
+                    "content": content[:1000],
+                    "date": raw.get("date") or "",
+                    "review_number": review_number
+                })
+
+            print(f"  ✓ 이 페이지에서 {len(page_reviews)}개 리뷰 수집 (중복 제외)")
 
         except Exception as e:
             print(f"  ✗ 페이지 수집 중 오류: {e}")
 
+        seen_numbers.update(r["review_number"] for r in page_reviews)
+        return page_reviews
+
+    def _parse_rating_text(self, text: Optional[str]) -> float:
+        """평점 텍스트 → 숫자 (숫자가 없으면 ★ 개수, 둘 다 없으면 5.0)"""
+        if not text:
+            return 5.0
+        match = re.search(r'(\d+(?:\.\d+)?)', text)
+        if match:
+            return min(float(match.group(1)), 5.0)
+        star_count = text.count('★')
+        return float(star_count) if star_count > 0 else 5.0
+
     def _clean_review_content(self, content: str) -> str:
         """리뷰 내용에서 불필요한 텍스트 제거"""
-        import re
-
         # 제거할 패턴들
         patterns_to_remove = [
             r'유\s*저\s*썸네일\s*이미지',
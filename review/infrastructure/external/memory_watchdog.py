@@ -0,0 +1,138 @@
+"""
+Memory Watchdog
+크롤링 중 브라우저 메모리를 주기적으로 측정해, 상한을 넘으면 체크포인트에서 페이지/컨텍스트를 새로 열도록 요청
+- RSS: 워커 프로세스의 하위 프로세스(드라이버 + Chromium 브라우저/렌더러) 합계 (psutil 이 없으면 측정 안 함)
+- JS 힙 / DOM 노드 수: CDP Performance.getMetrics (JSHeapUsedSize, Nodes)
+- 상한 초과 시 스크래퍼는 마지막으로 넘긴 페이지 다음부터 새 컨텍스트로 이어서 수집 (크롤링 1회당 재시작 횟수 제한)
+- 최대 사용량은 activate() 로 연결한 MemoryReport 에 누적 (Task 가 진행 상황/결과로 내보냄)
+"""
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Optional
+
+from config.scraper_config import (
+    MEMORY_WATCHDOG_ENABLED, MEMORY_WATCHDOG_MAX_RSS_MB, MEMORY_WATCHDOG_MAX_HEAP_MB,
+    MEMORY_WATCHDOG_INTERVAL_SECONDS, MEMORY_WATCHDOG_MAX_RECYCLES
+)
+from review.infrastructure.external.browser_pool import get_browser_pool
+
+MB = 1024 * 1024
+
+
+@dataclass
+class MemoryReport:
+    """크롤링 1회의 메모리 최대 사용량 (MB)"""
+    peak_rss_mb: float = 0.0
+    peak_heap_mb: float = 0.0
+    peak_dom_nodes: int = 0
+    samples: int = 0
+    recycles: int = 0
+
+    def observe(self, rss_mb: Optional[float], heap_mb: Optional[float], dom_nodes: Optional[int]) -> None:
+        self.samples += 1
+        self.peak_rss_mb = max(self.peak_rss_mb, rss_mb or 0.0)
+        self.peak_heap_mb = max(self.peak_heap_mb, heap_mb or 0.0)
+        self.peak_dom_nodes = max(self.peak_dom_nodes, dom_nodes or 0)
+
+    def as_dict(self) -> Dict[str, Any]:
+        report = asdict(self)
+        report["peak_rss_mb"] = round(self.peak_rss_mb, 1)
+        report["peak_heap_mb"] = round(self.peak_heap_mb, 1)
+        return report
+
+    def summary(self) -> str:
+        return (f"최대 RSS {self.peak_rss_mb:.0f}MB, JS 힙 {self.peak_heap_mb:.0f}MB, "
+                f"DOM {self.peak_dom_nodes}개, 측정 {self.samples}회, 재시작 {self.recycles}회")
+
+
+_current: ContextVar[Optional[MemoryReport]] = ContextVar("crawl_memory_report", default=None)
+
+
+def activate(report: MemoryReport):
+    """현재 컨텍스트에 보고서 연결 (반환한 토큰으로 deactivate)"""
+    return _current.set(report)
+
+
+def deactivate(token) -> None:
+    _current.reset(token)
+
+
+class MemoryWatchdog:
+    """
+    크롤링 1회(상품 1개) 동안 쓰는 감시기
+    - check(page): 측정 간격이 지났으면 측정하고, 상한 초과 + 재시작 여유가 있으면 재시작 요청(recycle_requested) 후 True
+    - 스크래퍼는 True 를 받으면 현재 컨텍스트를 닫고 recycled() 후 체크포인트에서 다시 연다
+    """
+
+    def __init__(self, platform: str, enabled: bool = MEMORY_WATCHDOG_ENABLED,
+                 max_rss_mb: int = MEMORY_WATCHDOG_MAX_RSS_MB, max_heap_mb: int = MEMORY_WATCHDOG_MAX_HEAP_MB,
+                 interval_seconds: float = MEMORY_WATCHDOG_INTERVAL_SECONDS,
+                 max_recycles: int = MEMORY_WATCHDOG_MAX_RECYCLES):
+        self.platform = platform
+        self.enabled = enabled
+        self.max_rss_mb = max_rss_mb
+        self.max_heap_mb = max_heap_mb
+        self.interval_seconds = interval_seconds
+        self.max_recycles = max_recycles
+        self.report = MemoryReport()
+        self.recycle_requested = False
+
+        self._page = None
+        self._cdp = None
+        self._last_sample = 0.0
+
+    def check(self, page) -> bool:
+        if not self.enabled or time.monotonic() - self._last_sample < self.interval_seconds:
+            return False
+        self._last_sample = time.monotonic()
+
+        rss_mb = get_browser_pool().browser_rss_mb()
+        heap_mb, dom_nodes = self._page_metrics(page)
+        self.report.observe(rss_mb, heap_mb, dom_nodes)
+        shared = _current.get()
+        if shared is not None:
+            shared.observe(rss_mb, heap_mb, dom_nodes)
+
+        reason = self._over_limit(rss_mb, heap_mb)
+        if reason is None:
+            return False
+        if self.report.recycles >= self.max_recycles:
+            print(f"  [MEMORY] {reason} - 재시작 상한({self.max_recycles}회) 도달, 그대로 진행")
+            return False
+        print(f"  [MEMORY] {reason} → 체크포인트에서 컨텍스트 다시 열기")
+        self.recycle_requested = True
+        return True
+
+    def recycled(self) -> None:
+        """컨텍스트를 닫고 다시 열기 직전에 호출 (다음 페이지는 새 CDP 세션으로 측정)"""
+        self.report.recycles += 1
+        self.recycle_requested = False
+        shared = _current.get()
+        if shared is not None:
+            shared.recycles += 1
+        self._page = None
+        self._cdp = None
+        self._last_sample = 0.0
+
+    def summary(self) -> str:
+        return f"{self.platform}: {self.report.summary()}"
+
+    def _over_limit(self, rss_mb: Optional[float], heap_mb: Optional[float]) -> Optional[str]:
+        if self.max_rss_mb and rss_mb is not None and rss_mb >= self.max_rss_mb:
+            return f"브라우저 RSS {rss_mb:.0f}MB >= {self.max_rss_mb}MB"
+        if self.max_heap_mb and heap_mb is not None and heap_mb >= self.max_heap_mb:
+            return f"JS 힙 {heap_mb:.0f}MB >= {self.max_heap_mb}MB"
+        return None
+
+    def _page_metrics(self, page):
+        """(JS 힙 MB, DOM 노드 수) - CDP 를 못 쓰면 (None, None)"""
+        try:
+            if page is not self._page:
+                self._cdp = page.context.new_cdp_session(page)
+                self._cdp.send("Performance.enable")
+                self._page = page
+            metrics = {m["name"]: m["value"] for m in self._cdp.send("Performance.getMetrics")["metrics"]}
+            return metrics.get("JSHeapUsedSize", 0) / MB, int(metrics.get("Nodes", 0))
+        except Exception:
+            return None, None
@@ -0,0 +1,107 @@
+"""
+Page Waiter
+고정 time.sleep 대신 실제 신호(셀렉터 등장, 리뷰 수 증가, 응답 완료)를 기다리는 대기 유틸
+- 모든 대기는 상한 타임아웃을 가지며, 타임아웃 시 예외 대신 False/이전 값을 반환
+- target 은 Playwright Page 또는 Frame (evaluate / wait_for_function 지원 객체)
+"""
+from typing import Any, Callable, Optional
+
+from playwright.sync_api import TimeoutError as PWTimeout
+
+from config.scraper_config import WAIT_TIMEOUT_MS
+from review.infrastructure.external.phase_timer import timed_phase
+
+
+@timed_phase("waits")
+def wait_for_selector(target, selector: str, timeout_ms: int = WAIT_TIMEOUT_MS, state: str = "visible") -> bool:
+    """셀렉터가 나타날 때까지 대기"""
+    try:
+        target.wait_for_selector(selector, state=state, timeout=timeout_ms)
+        return True
+    except PWTimeout:
+        return False
+
+
+@timed_phase("waits")
+def wait_for_network_idle(page, timeout_ms: int = WAIT_TIMEOUT_MS) -> bool:
+    """네트워크가 잠잠해질 때까지 대기 (이미 idle이면 즉시 반환)"""
+    try:
+        page.wait_for_load_state("networkidle", timeout=timeout_ms)
+        return True
+    except PWTimeout:
+        return False
+
+
+def count_elements(target, selector: str) -> int:
+    """셀렉터에 매칭되는 요소 수 (한 번의 evaluate)"""
+    try:
+        return int(target.evaluate("(sel) => document.querySelectorAll(sel).length", selector))
+    except Exception:
+        return 0
+
+
+@timed_phase("waits")
+def wait_for_count_increase(target, selector: str, previous_count: int, timeout_ms: int = WAIT_TIMEOUT_MS) -> int:
+    """
+    DOM 내 요소 수가 previous_count 보다 커질 때까지 대기
+    Returns: 대기 후 요소 수 (증가하지 않았으면 previous_count 이하)
+    """
+    try:
+        target.wait_for_function(
+            "([sel, n]) => document.querySelectorAll(sel).length > n",
+            arg=[selector, previous_count],
+            timeout=timeout_ms,
+        )
+    except PWTimeout:
+        pass
+    return count_elements(target, selector)
+
+
+def content_signature(target, selector: str) -> str:
+    """첫 번째 매칭 요소 텍스트 + 요소 수로 만든 서명 (페이지 전환 감지용)"""
+    try:
+        return target.evaluate(
+            """(sel) => {
+                const items = document.querySelectorAll(sel);
+                const first = items.length ? (items[0].textContent || '').slice(0, 200) : '';
+                return items.length + '|' + first;
+            }""",
+            selector,
+        )
+    except Exception:
+        return ""
+
+
+@timed_phase("waits")
+def wait_for_content_change(target, selector: str, previous_signature: str, timeout_ms: int = WAIT_TIMEOUT_MS) -> bool:
+    """content_signature 가 바뀔 때까지 대기 (페이지네이션 후 목록 교체 확인)"""
+    try:
+        target.wait_for_function(
+            """([sel, prev]) => {
+                const items = document.querySelectorAll(sel);
+                const first = items.length ? (items[0].textContent || '').slice(0, 200) : '';
+                return items.length > 0 && (items.length + '|' + first) !== prev;
+            }""",
+            arg=[selector, previous_signature],
+            timeout=timeout_ms,
+        )
+        return True
+    except PWTimeout:
+        return False
+
+
+@timed_phase("waits")
+def wait_for_response(page, url_predicate: Callable[[str], bool], action: Callable[[], Any],
+                      timeout_ms: int = WAIT_TIMEOUT_MS) -> Optional[Any]:
+    """
+    action 실행 중 발생한 응답 중 url_predicate 를 만족하는 응답이 끝날 때까지 대기
+    Returns: Response 또는 None (타임아웃)
+    """
+    try:
+        with page.expect_response(lambda r: url_predicate(r.url), timeout=timeout_ms) as info:
+            action()
+        response = info.value
+        response.finished()
+        return response
+    except PWTimeout:
+        return None
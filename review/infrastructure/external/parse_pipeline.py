@@ -0,0 +1,106 @@
+"""
+Parse Pipeline
+브라우저 수집과 HTML 파싱을 겹쳐 실행 (페이지 N 을 워커가 파싱하는 동안 브라우저는 N+1 로 이동)
+- 수집 루프는 원본 HTML 만 넘기고 바로 다음 페이지로 진행, 결과는 제출 순서대로 돌려받음 (체크포인트 순서 보장)
+- 대기 중인 페이지가 depth 를 넘으면 가장 오래된 파싱이 끝날 때까지 수집 루프가 대기 (back-pressure → 메모리 상한)
+- 실행기: thread (기본, lxml/selectolax 파싱은 GIL 을 대부분 놓음) | process
+  Celery prefork 워커(daemon 프로세스)에서는 자식 프로세스를 만들 수 없으므로 thread 로 대체
+- 상품당 소요 시간이 수집 + 파싱 합에서 max(수집, 파싱) 에 가까워짐
+"""
+import os
+import time
+import atexit
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+from config.scraper_config import PARSE_PIPELINE_EXECUTOR, PARSE_PIPELINE_WORKERS, PARSE_PIPELINE_DEPTH
+from review.infrastructure.external.phase_timer import phase
+
+
+def _timed_call(func: Callable[[Any], Any], payload: Any) -> Tuple[Any, float]:
+    """워커에서 실행 (프로세스 실행기로 넘길 수 있도록 모듈 함수)"""
+    started = time.perf_counter()
+    result = func(payload)
+    return result, time.perf_counter() - started
+
+
+class ParsePipeline:
+    """
+    상품 1개 수집 동안 쓰는 파싱 대기열 (실행기는 프로세스 단위로 공유)
+    - submit: 작업을 넘기고, 이미 끝난 앞쪽 결과를 순서대로 반환 (가득 차면 가장 오래된 작업을 기다림)
+    - drain: 남은 작업을 모두 기다려 순서대로 반환
+    - close: 남은 작업 취소 (증분 크롤링 중단 / 오류 시)
+    func 가 실패한 작업의 결과는 None
+    """
+
+    def __init__(self, func: Callable[[Any], Any], depth: int = PARSE_PIPELINE_DEPTH,
+                 executor: Optional[Executor] = None):
+        self.func = func
+        self.depth = max(depth, 1)
+        self.executor = executor or get_parse_executor()
+        self._pending: Deque[Tuple[Future, Any]] = deque()
+        self.submitted = 0
+        self.failed = 0
+        self.parse_seconds = 0.0    # 워커에서 파싱한 시간 합
+        self.wait_seconds = 0.0     # 수집 루프가 파싱을 기다린 시간 합
+
+    def submit(self, payload: Any, tag: Any = None) -> List[Tuple[Any, Any]]:
+        """(payload → func) 작업 제출, 완료된 (result, tag) 를 제출 순서대로 반환"""
+        self._pending.append((self.executor.submit(_timed_call, self.func, payload), tag))
+        self.submitted += 1
+        ready = []
+        while self._pending and (len(self._pending) > self.depth or self._pending[0][0].done()):
+            ready.append(self._pop())
+        return ready
+
+    def drain(self) -> List[Tuple[Any, Any]]:
+        return [self._pop() for _ in range(len(self._pending))]
+
+    def close(self) -> None:
+        for future, _ in self._pending:
+            future.cancel()
+        self._pending.clear()
+
+    def summary(self) -> str:
+        return (f"페이지 {self.submitted}개, 파싱 {self.parse_seconds:.2f}s, "
+                f"대기 {self.wait_seconds:.2f}s, 실패 {self.failed}개")
+
+    def _pop(self) -> Tuple[Any, Any]:
+        future, tag = self._pending.popleft()
+        started = time.perf_counter()
+        try:
+            with phase("parse_wait"):
+                result, elapsed = future.result()
+            self.parse_seconds += elapsed
+        except Exception as e:
+            self.failed += 1
+            print(f"  [WARNING] 파싱 실패: {e}")
+            result = None
+        finally:
+            self.wait_seconds += time.perf_counter() - started
+        return result, tag
+
+
+# 프로세스 단위 싱글턴 (Celery prefork 시 부모 프로세스의 실행기를 물려받지 않도록 pid 확인)
+_executor: Optional[Executor] = None
+_executor_pid: Optional[int] = None
+_executor_lock = threading.Lock()
+
+
+def get_parse_executor() -> Executor:
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            workers = max(PARSE_PIPELINE_WORKERS, 1)
+            if PARSE_PIPELINE_EXECUTOR == "process" and not multiprocessing.current_process().daemon:
+                _executor = ProcessPoolExecutor(max_workers=workers)
+            else:
+                if PARSE_PIPELINE_EXECUTOR == "process":
+                    print("[WARNING] daemon 프로세스에서는 파싱 프로세스 풀을 만들 수 없음 - 스레드 풀 사용")
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="parse")
+            _executor_pid = os.getpid()
+            atexit.register(_executor.shutdown, wait=False)
+        return _executor
@@ -0,0 +1,64 @@
+"""
+Phase Timer
+크롤링 단계별(navigation / waits / extraction / entities ...) 소요 시간 누적
+- 벤치마크가 activate() 로 타이머를 켠 컨텍스트에서만 기록 (평소에는 contextvar 조회 1회 비용)
+- 같은 이름의 단계가 중첩되면 바깥 단계만 계산 (예: parse_11st_review_body → parse_11st_review_html)
+- async 엔진 루프 스레드에는 contextvar 가 전달되지 않으므로 동기 스크래퍼 경로만 측정
+"""
+import time
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+_current: ContextVar[Optional["PhaseTimer"]] = ContextVar("crawl_phase_timer", default=None)
+
+
+class PhaseTimer:
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self._active = set()
+
+    def add(self, name: str, elapsed: float) -> None:
+        self.seconds[name] = self.seconds.get(name, 0.0) + elapsed
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def summary(self) -> str:
+        return ", ".join(f"{name}={sec:.2f}s/{self.calls[name]}회" for name, sec in self.seconds.items())
+
+
+def activate(timer: PhaseTimer):
+    """현재 컨텍스트에 타이머 연결 (반환한 토큰으로 deactivate)"""
+    return _current.set(timer)
+
+
+def deactivate(token) -> None:
+    _current.reset(token)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    timer = _current.get()
+    if timer is None or name in timer._active:
+        yield
+        return
+
+    timer._active.add(name)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer._active.discard(name)
+        timer.add(name, time.perf_counter() - started)
+
+
+def timed_phase(name: str):
+    """함수 전체를 한 단계로 기록하는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
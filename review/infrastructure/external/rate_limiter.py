@@ -0,0 +1,143 @@
+"""
+Rate Limiter
+Redis 토큰 버킷으로 모든 Celery 워커의 플랫폼별 요청 속도를 합산 제한
+- 페이지 로드, 리뷰 더보기/페이지 클릭, API 호출 직전에 토큰 1개를 획득
+- 버킷 상태(토큰 수, 갱신 시각)는 Lua 스크립트로 원자적으로 갱신하고, 시각은 Redis TIME 기준 (워커 간 시계 차이 무시)
+- 토큰이 없으면 스크립트가 알려준 시간만큼 기다렸다가 다시 시도
+- AIMD 제어가 켜져 있으면 초당 요청 수는 crawl:aimd:{bucket} 해시의 rate 를 우선 사용 (같은 스크립트에서 읽음)
+- Redis 장애는 크롤링을 막지 않음 (경고 후 진행)
+- 대기 상한(max_wait_seconds)은 경고 기준일 뿐, 토큰 없이 진행하지 않음
+- key: crawl:ratelimit:{bucket}
+"""
+import os
+import time
+import asyncio
+from typing import Dict, Optional, Tuple
+
+from config.scraper_config import AIMD_ENABLED, RATE_LIMIT_ENABLED, RATE_LIMIT_MAX_WAIT_SECONDS, RATE_LIMITS
+from review.infrastructure.external.phase_timer import timed_phase
+
+# KEYS[2] = AIMD 상태 해시 (ARGV[3] == '1' 이면 그 rate 사용)
+# 반환값: 0 = 토큰 획득, 양수 = 다음 토큰까지 남은 ms
+TOKEN_BUCKET_LUA = """
+local key = KEYS[1]
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+if ARGV[3] == '1' then
+    local adaptive = tonumber(redis.call('HGET', KEYS[2], 'rate'))
+    if adaptive and adaptive > 0 then rate = adaptive end
+end
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+local state = redis.call('HMGET', key, 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate / 1000)
+
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) * 1000 / rate)
+end
+redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', key, math.ceil(burst * 1000 / rate) + 1000)
+return wait
+"""
+
+
+class RateLimiter:
+    """플랫폼(버킷)별 분산 토큰 버킷"""
+
+    def __init__(self, redis_client=None, limits: Dict[str, Tuple[float, int]] = None,
+                 enabled: bool = RATE_LIMIT_ENABLED, max_wait_seconds: float = RATE_LIMIT_MAX_WAIT_SECONDS,
+                 adaptive: bool = AIMD_ENABLED):
+        self.limits = dict(limits or RATE_LIMITS)
+        self.enabled = enabled
+        self.adaptive = adaptive
+        self.max_wait_seconds = max_wait_seconds
+        self._redis = redis_client
+        self._script = None
+        self.stats: Dict[str, float] = {"acquired": 0, "waited_seconds": 0.0, "timeouts": 0, "errors": 0}
+
+    def _bucket_script(self):
+        if self._script is None:
+            if self._redis is None:
+                from config.redis_config import get_redis
+                self._redis = get_redis()
+            self._script = self._redis.register_script(TOKEN_BUCKET_LUA)
+        return self._script
+
+    def limit_for(self, bucket: str) -> Tuple[float, int]:
+        return self.limits.get(bucket, (0.0, 1))
+
+    def try_acquire(self, bucket: str) -> float:
+        """토큰 1개 획득 시도 → 0 이면 획득, 아니면 다시 시도하기까지 기다릴 초"""
+        rate, burst = self.limit_for(bucket)
+        if not self.enabled or rate <= 0:
+            return 0.0
+        try:
+            wait_ms = self._bucket_script()(
+                keys=[f"crawl:ratelimit:{bucket}", f"crawl:aimd:{bucket}"],
+                args=[rate, max(burst, 1), "1" if self.adaptive else "0"],
+            )
+        except Exception as e:
+            # Redis 장애 시 제한 없이 진행 (크롤링 중단보다 우선)
+            self.stats["errors"] += 1
+            print(f"[WARNING] 요청 속도 제한 확인 실패 ({bucket}): {e}")
+            return 0.0
+        return int(wait_ms) / 1000
+
+    @timed_phase("delay")
+    def acquire(self, bucket: str) -> float:
+        """토큰을 얻을 때까지 대기 (반환: 대기한 초)"""
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(bucket)
+            if wait <= 0:
+                break
+            if waited <= self.max_wait_seconds < waited + wait:
+                # 토큰 없이 진행하면 경합/AIMD 하한일 때 전체 요청 속도가 무제한이 되므로 경고만 하고 계속 대기
+                self.stats["timeouts"] += 1
+                print(f"[WARNING] 요청 속도 제한 대기 {self.max_wait_seconds:.0f}s 초과 ({bucket}) - 토큰을 얻을 때까지 계속 대기")
+            time.sleep(wait)
+            waited += wait
+        self._record(waited)
+        return waited
+
+    async def aacquire(self, bucket: str) -> float:
+        """acquire 의 asyncio 버전 (Redis 호출은 스레드에서, 대기는 루프를 막지 않음)"""
+        waited = 0.0
+        while True:
+            wait = await asyncio.to_thread(self.try_acquire, bucket)
+            if wait <= 0:
+                break
+            if waited <= self.max_wait_seconds < waited + wait:
+                # 토큰 없이 진행하면 경합/AIMD 하한일 때 전체 요청 속도가 무제한이 되므로 경고만 하고 계속 대기
+                self.stats["timeouts"] += 1
+                print(f"[WARNING] 요청 속도 제한 대기 {self.max_wait_seconds:.0f}s 초과 ({bucket}) - 토큰을 얻을 때까지 계속 대기")
+            await asyncio.sleep(wait)
+            waited += wait
+        self._record(waited)
+        return waited
+
+    def _record(self, waited: float) -> None:
+        self.stats["acquired"] += 1
+        self.stats["waited_seconds"] += waited
+
+    def get_stats(self) -> Dict[str, float]:
+        return dict(self.stats)
+
+
+# 프로세스 단위 인스턴스 (스레드/엔진 루프에서 공유, 상태는 Redis 에만 있음)
+_limiter: Optional[RateLimiter] = None
+_limiter_pid: Optional[int] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    global _limiter, _limiter_pid
+    if _limiter is None or _limiter_pid != os.getpid():
+        _limiter = RateLimiter()
+        _limiter_pid = os.getpid()
+    return _limiter
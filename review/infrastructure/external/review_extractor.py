@@ -0,0 +1,134 @@
+"""
+Review Extractor
+리뷰 목록 HTML 에서 플랫폼별 필드를 뽑는 추출기 (HtmlBackend 인터페이스만 사용)
+- 추출 범위는 리뷰 컨테이너 하위 트리로 한정 (없으면 문서 전체, 예: XHR 조각)
+- 반환 dict 는 스크래퍼가 후처리(정리/엔티티 변환)하기 전의 원본 필드
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from review.infrastructure.external.html_backend import HtmlBackend, get_html_backend
+
+# 11번가
+ELEVENST_CONTAINER_CSS = '#review-list-page-area'
+ELEVENST_ITEM_CSS = 'li.review_list_element'
+
+# 롯데온 (EXTRACT_REVIEWS_JS 와 같은 패턴/필드 셀렉터, 패턴 이름은 셀렉터 캐시의 "item" 값)
+LOTTEON_CONTAINER_CSS = 'div#review, div.productReviewWrap, #pdReview'
+LOTTEON_ITEM_PATTERNS = {
+    'data_review_number': 'div[data-review-number]',
+    'review_list': 'div.reviewList',
+    'review_item_class': 'div[class*="review"][class*="item"], div[class*="Review"][class*="Item"], '
+                         'div[class*="review"][class*="Item"]',
+    'review_li': 'li[class*="review"], li[class*="Review"]',
+}
+LOTTEON_FIELD_CSS = {
+    "content": ['div.reviewContent', 'div[class*="reviewContent"]', '.review-content', 'p.content'],
+    "user": ['span.userName', 'div[class*="userName"]', '.reviewer', 'span.name'],
+    "rating": ['span.rating', 'div[class*="rating"]', '.rating', '.star'],
+    "date": ['span.date', 'div[class*="date"]', '.date', 'time'],
+    "option": ['div.option', 'span[class*="option"]', '.option'],
+}
+LOTTEON_ITEM_LIMIT = 200
+
+
+def _scope(backend: HtmlBackend, html: str, container_css: str):
+    root = backend.parse(html)
+    return backend.select_one(root, container_css) or root
+
+
+def extract_11st_items(html: str, backend: Optional[HtmlBackend] = None) -> List[Dict[str, str]]:
+    """11번가 리뷰 아이템 → {user_id, rating, option, content, date}"""
+    backend = backend or get_html_backend()
+    root = _scope(backend, html, ELEVENST_CONTAINER_CSS)
+    results: List[Dict[str, str]] = []
+
+    for review in backend.select(root, ELEVENST_ITEM_CSS):
+        try:
+            # 펼친 리뷰(text-expanded) 우선, 없으면 숨김 본문(전체 텍스트) 사용
+            content_tag = backend.select_one(review, 'p.cont_review_hide.text-expanded') or \
+                backend.select_one(review, 'p.cont_review_hide')
+            content = backend.text(content_tag, '\n') if content_tag is not None else "리뷰 내용 없음"
+
+            if content.strip() == "리뷰 내용 없음":
+                continue
+
+            user_id_tag = backend.select_one(review, 'dl.c_product_reviewer dt.name')
+            # data-nick 속성이나, 텍스트를 사용
+            if user_id_tag is not None:
+                user_id = (backend.attr(user_id_tag, 'data-nick') or backend.text(user_id_tag)).strip()
+            else:
+                user_id = "ID_ERROR"
+
+            # 평점 'X점'에서 숫자만 추출 (평점이 없으면 개별 리뷰 실패로 처리)
+            rating_text = backend.text(backend.select_one(review, 'p.grade em')).replace('점', '')
+
+            option_tag = backend.select_one(review, 'dl.option_set dd')
+            option = backend.text(option_tag) if option_tag is not None else "옵션 정보 없음"
+            date_tag = backend.select_one(review, 'p.side span.date')
+            date_text = backend.text(date_tag) if date_tag is not None else "날짜 정보 없음"
+
+            results.append({
+                "user_id": user_id,
+                "rating": rating_text,
+                "option": option,
+                "content": content,
+                "date": date_text,
+            })
+        except Exception as e:
+            print(f"  [WARNING] 개별 리뷰 추출 실패: {e}")
+            continue
+
+    return results
+
+
+def extract_lotteon_items(html: str, backend: Optional[HtmlBackend] = None) -> List[Dict[str, Optional[str]]]:
+    """롯데온 리뷰 아이템 → {review_number, user, rating, date, option, content} (EXTRACT_REVIEWS_JS 와 같은 형식)"""
+    return extract_lotteon_result(html, backend=backend)[1]
+
+
+def extract_lotteon_page(payload: Tuple[str, Sequence[str]]) -> Dict[str, Any]:
+    """
+    파싱 파이프라인 작업 단위 ((html, 패턴 이름 순서) → {pattern, items}, EXTRACT_REVIEWS_JS 반환값과 같은 형식)
+    프로세스 실행기로도 넘길 수 있도록 모듈 함수
+    """
+    html, order = payload
+    pattern, items = extract_lotteon_result(html, order)
+    return {"pattern": pattern, "items": items}
+
+
+def extract_lotteon_result(html: str, order: Optional[Sequence[str]] = None, backend: Optional[HtmlBackend] = None
+                           ) -> Tuple[Optional[str], List[Dict[str, Optional[str]]]]:
+    """
+    order: 아이템 패턴 이름 시도 순서 (셀렉터 캐시 순서, 없으면 기본 순서)
+    Returns:
+        (처음 매칭된 패턴 이름, 아이템 리스트)
+    """
+    backend = backend or get_html_backend()
+    root = _scope(backend, html, LOTTEON_CONTAINER_CSS)
+
+    pattern: Optional[str] = None
+    items: List = []
+    for name in order or LOTTEON_ITEM_PATTERNS:
+        items = backend.select(root, LOTTEON_ITEM_PATTERNS[name])
+        if items:
+            pattern = name
+            break
+
+    def field(item, name: str, separator: str = "") -> Optional[str]:
+        for css in LOTTEON_FIELD_CSS[name]:
+            elem = backend.select_one(item, css)
+            if elem is not None:
+                return backend.text(elem, separator)
+        return None
+
+    results = []
+    for idx, item in enumerate(items[:LOTTEON_ITEM_LIMIT], 1):
+        results.append({
+            "review_number": backend.attr(item, 'data-review-number') or f'unknown_{idx}',
+            "user": field(item, "user"),
+            "rating": field(item, "rating"),
+            "date": field(item, "date"),
+            "option": field(item, "option"),
+            "content": field(item, "content", '\n') or backend.text(item, '\n'),
+        })
+    return pattern, results
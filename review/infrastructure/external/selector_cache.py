@@ -0,0 +1,104 @@
+"""
+Selector Cache
+폴백 셀렉터 목록 중 실제로 성공한 셀렉터를 플랫폼/페이지 레이아웃/그룹 단위로 Redis 에 기억
+- 다음 크롤링에서는 기억한 셀렉터를 먼저 시도 (나머지는 원래 순서 유지)
+- 기억한 셀렉터가 실패하면 항목을 삭제해 다음 크롤링은 원래 순서로 다시 탐색
+- Redis 장애는 크롤링을 막지 않음 (경고만 출력하고 캐시 없이 진행)
+- key: crawl:selector:{platform}:{layout}:{group}
+"""
+from typing import Dict, List, Optional
+
+from config.scraper_config import SELECTOR_CACHE_ENABLED, SELECTOR_CACHE_TTL_SECONDS
+
+# 페이지 레이아웃 서명: 주어진 마커 셀렉터 중 존재하는 것들의 이름 (한 번의 evaluate)
+LAYOUT_SIGNATURE_JS = """
+(markers) => Object.entries(markers)
+    .filter(([, sel]) => document.querySelector(sel))
+    .map(([name]) => name)
+    .join('+') || 'default'
+"""
+
+
+def layout_signature(page, markers: Dict[str, str]) -> str:
+    """sync Page 의 레이아웃 서명 (실패 시 'default')"""
+    try:
+        return page.evaluate(LAYOUT_SIGNATURE_JS, markers) or "default"
+    except Exception:
+        return "default"
+
+
+class SelectorCache:
+    """한 번의 크롤링(플랫폼 + 레이아웃) 동안 사용하는 셀렉터 캐시"""
+
+    def __init__(self, platform: str, layout: str = "default", redis_client=None,
+                 ttl_seconds: int = SELECTOR_CACHE_TTL_SECONDS, enabled: bool = SELECTOR_CACHE_ENABLED):
+        self.platform = platform
+        self.layout = layout
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._redis = redis_client
+        self._winners: Dict[str, Optional[str]] = {}   # group → 기억한 셀렉터 (조회 결과 메모)
+        self._refreshed = set()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            from config.redis_config import get_redis
+            self._redis = get_redis()
+        return self._redis
+
+    def _key(self, group: str) -> str:
+        return f"crawl:selector:{self.platform}:{self.layout}:{group}"
+
+    def winner(self, group: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        if group not in self._winners:
+            try:
+                self._winners[group] = self.redis.get(self._key(group))
+            except Exception as e:
+                print(f"[WARNING] 셀렉터 캐시 조회 실패: {e}")
+                self.enabled = False
+                return None
+        return self._winners[group]
+
+    def ordered(self, group: str, candidates: List[str]) -> List[str]:
+        """기억한 셀렉터를 맨 앞으로 옮긴 후보 목록 (후보에 없는 값은 무시)"""
+        winner = self.winner(group)
+        if winner not in candidates:
+            return list(candidates)
+        return [winner] + [c for c in candidates if c != winner]
+
+    def record(self, group: str, selector: str) -> None:
+        """성공한 셀렉터 기록 (기억한 값과 같으면 크롤링당 한 번만 TTL 연장)"""
+        if not self.enabled:
+            return
+        try:
+            if self.winner(group) == selector:
+                self.hits += 1
+                if group not in self._refreshed:
+                    self._refreshed.add(group)
+                    self.redis.expire(self._key(group), self.ttl_seconds)
+                return
+            self.misses += 1
+            self._winners[group] = selector
+            self._refreshed.add(group)
+            self.redis.set(self._key(group), selector, ex=self.ttl_seconds)
+        except Exception as e:
+            print(f"[WARNING] 셀렉터 캐시 저장 실패: {e}")
+
+    def invalidate(self, group: str) -> None:
+        """후보 전체가 실패했을 때 호출 (기억한 셀렉터가 있으면 삭제)"""
+        if not self.enabled or self.winner(group) is None:
+            return
+        self.misses += 1
+        self._winners[group] = None
+        try:
+            self.redis.delete(self._key(group))
+        except Exception as e:
+            print(f"[WARNING] 셀렉터 캐시 삭제 실패: {e}")
+
+    def summary(self) -> str:
+        return f"layout={self.layout}, 캐시 적중={self.hits}, 재탐색={self.misses}"
@@ -0,0 +1,134 @@
+"""
+Selector Probe
+폴백 셀렉터 목록 전체를 한 번의 evaluate 로 보내 첫 번째로 조건을 만족하는 요소를 찾는 유틸
+- 후보마다 locator(...).is_visible() 를 호출하던 N번의 IPC 왕복을 1번으로 줄임
+- Playwright 전용 ':has-text("...")' 는 CSS 부분 + 텍스트(대소문자 무시 부분 일치) 조건으로 변환해 브라우저에서 평가
+- 찾은 요소에는 data-probe-hit 속성을 표시 → 클릭 등 후속 동작은 ProbeMatch.locator 로 같은 요소에 수행
+- target 은 Playwright Page 또는 Frame (sync / async 모두 지원)
+"""
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+PROBE_MARK_ATTR = "data-probe-hit"
+PROBE_MARK_SELECTOR = f"[{PROBE_MARK_ATTR}]"
+
+_HAS_TEXT = re.compile(r'^(.*?):has-text\((["\'])(.*?)\2\)(.*)$')
+
+PROBE_JS = """
+([candidates, opts]) => {
+    const visible = (el) => {
+        const rect = el.getBoundingClientRect();
+        if (!rect.width && !rect.height) return false;
+        const style = getComputedStyle(el);
+        return style.visibility !== 'hidden' && style.display !== 'none';
+    };
+    const query = (c) => {
+        let els = Array.from(document.querySelectorAll(c.css));
+        if (c.text !== null) els = els.filter(el => (el.textContent || '').toLowerCase().includes(c.text));
+        if (c.rest) els = [...new Set(els.flatMap(el => Array.from(el.querySelectorAll(c.rest))))];
+        return els;
+    };
+    const accept = (el) => {
+        if (opts.visible && !visible(el)) return false;
+        if (opts.enabled && (el.disabled || el.getAttribute('aria-disabled') === 'true')) return false;
+        const text = (el.textContent || '').trim();
+        if (opts.exclude && opts.exclude.some(t => text.includes(t))) return false;
+        if (opts.require) {
+            const attrs = Array.from(el.attributes).map(a => a.value).join(' ');
+            const haystack = (text + ' ' + attrs).toLowerCase();
+            if (!opts.require.some(t => haystack.includes(t))) return false;
+        }
+        return true;
+    };
+
+    document.querySelectorAll('[' + opts.mark + ']').forEach(el => el.removeAttribute(opts.mark));
+    for (let i = 0; i < candidates.length; i++) {
+        let els;
+        try { els = query(candidates[i]); } catch (e) { continue; }  // 브라우저가 해석하지 못하는 셀렉터
+        const hit = els.find(accept);
+        if (hit) {
+            hit.setAttribute(opts.mark, '1');
+            return {index: i, text: (hit.textContent || '').trim().slice(0, 500)};
+        }
+    }
+    return null;
+}
+"""
+
+
+@dataclass
+class ProbeMatch:
+    """probe 결과: 몇 번째 후보가 맞았는지와 그 요소의 텍스트"""
+    index: int
+    selector: str
+    text: str
+
+    def locator(self, target):
+        """찾은 요소를 가리키는 Locator (다음 probe 호출 전까지 유효)"""
+        return target.locator(PROBE_MARK_SELECTOR).first
+
+
+def _compile(selector: str) -> Dict[str, Any]:
+    """'li:has-text("리뷰") a' → {css: 'li', text: '리뷰', rest: 'a'}"""
+    match = _HAS_TEXT.match(selector)
+    if not match:
+        return {"css": selector, "text": None, "rest": ""}
+    css, _, text, rest = match.groups()
+    return {"css": css.strip() or "*", "text": text.lower(), "rest": rest.strip()}
+
+
+def _probe_args(selectors: Sequence[str], visible: bool, enabled: bool,
+                require_any: Optional[Sequence[str]], exclude_any: Optional[Sequence[str]]) -> List[Any]:
+    return [
+        [_compile(s) for s in selectors],
+        {
+            "visible": visible,
+            "enabled": enabled,
+            "require": [t.lower() for t in require_any] if require_any else None,
+            "exclude": list(exclude_any) if exclude_any else None,
+            "mark": PROBE_MARK_ATTR,
+        },
+    ]
+
+
+def _to_match(result: Optional[Dict[str, Any]], selectors: Sequence[str]) -> Optional[ProbeMatch]:
+    if not result:
+        return None
+    return ProbeMatch(index=result["index"], selector=selectors[result["index"]], text=result.get("text") or "")
+
+
+def probe_selectors(target, selectors: Sequence[str], visible: bool = True, enabled: bool = False,
+                    require_any: Optional[Sequence[str]] = None,
+                    exclude_any: Optional[Sequence[str]] = None) -> Optional[ProbeMatch]:
+    """
+    selectors 를 순서대로 평가해 조건을 만족하는 첫 요소 반환 (한 번의 evaluate, 대기 없음)
+
+    Args:
+        visible: 화면에 보이는 요소만
+        enabled: disabled / aria-disabled 가 아닌 요소만
+        require_any: 텍스트 또는 속성값에 하나라도 포함되어야 하는 문자열 (대소문자 무시)
+        exclude_any: 텍스트에 포함되면 제외할 문자열
+    """
+    if not selectors:
+        return None
+    try:
+        result = target.evaluate(PROBE_JS, _probe_args(selectors, visible, enabled, require_any, exclude_any))
+    except Exception as e:
+        print(f"  [WARNING] 셀렉터 probe 실패: {str(e)[:80]}")
+        return None
+    return _to_match(result, selectors)
+
+
+async def aprobe_selectors(target, selectors: Sequence[str], visible: bool = True, enabled: bool = False,
+                           require_any: Optional[Sequence[str]] = None,
+                           exclude_any: Optional[Sequence[str]] = None) -> Optional[ProbeMatch]:
+    """probe_selectors 의 async Playwright 버전"""
+    if not selectors:
+        return None
+    try:
+        result = await target.evaluate(PROBE_JS, _probe_args(selectors, visible, enabled, require_any, exclude_any))
+    except Exception as e:
+        print(f"  [WARNING] 셀렉터 probe 실패: {str(e)[:80]}")
+        return None
+    return _to_match(result, selectors)
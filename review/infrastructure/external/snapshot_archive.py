@@ -0,0 +1,150 @@
+"""
+Snapshot Archive
+크롤링 중 받은 리뷰 영역 원본(HTML / 응답 본문)을 페이지 단위로 디스크에 보관 → 파서 수정 후 재크롤링 없이 재파싱
+- 내용 주소 저장: 본문 sha256 이 파일명 (같은 페이지를 여러 번 받아도 한 번만 저장)
+  {archive_dir}/objects/{sha[:2]}/{sha}.{zst|gz}
+- 상품별 색인(JSONL): {archive_dir}/index/{platform}/{product_code}.jsonl
+  한 줄 = {sha256, codec, kind, seq, captured_at, meta}
+- 압축: zstandard 가 설치되어 있으면 zstd, 아니면 gzip (색인에 codec 기록)
+- 저장 실패는 크롤링을 막지 않음 (경고 후 진행)
+- kind: 11st_html (리뷰 목록 HTML) / 11st_body (리뷰 응답 본문, meta.content_type) / lotteon_html (리뷰 컨테이너 HTML)
+"""
+import os
+import gzip
+import json
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+from config.scraper_config import (
+    SNAPSHOT_ARCHIVE_ENABLED, SNAPSHOT_ARCHIVE_DIR, SNAPSHOT_ARCHIVE_CODEC, SNAPSHOT_ARCHIVE_LEVEL
+)
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+CODEC_EXTENSIONS = {"zstd": "zst", "gzip": "gz"}
+
+
+def available_codec(preferred: str = SNAPSHOT_ARCHIVE_CODEC) -> str:
+    if preferred == "zstd" and zstandard is None:
+        return "gzip"
+    return preferred if preferred in CODEC_EXTENSIONS else "gzip"
+
+
+def _compress(data: bytes, codec: str, level: int) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    return gzip.compress(data, compresslevel=min(max(level, 1), 9))
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd 스냅샷을 읽으려면 zstandard 패키지가 필요합니다.")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class SnapshotArchive:
+    """디스크 스냅샷 저장소 (프로세스 간 공유 - 객체는 원자적 rename, 색인은 append)"""
+
+    def __init__(self, root: str = SNAPSHOT_ARCHIVE_DIR, codec: Optional[str] = None,
+                 level: int = SNAPSHOT_ARCHIVE_LEVEL):
+        self.root = root
+        self.codec = available_codec(codec or SNAPSHOT_ARCHIVE_CODEC)
+        self.level = level
+
+    def object_path(self, sha256: str, codec: str) -> str:
+        return os.path.join(self.root, "objects", sha256[:2], f"{sha256}.{CODEC_EXTENSIONS[codec]}")
+
+    def index_path(self, platform: str, product_code: Any) -> str:
+        return os.path.join(self.root, "index", platform, f"{product_code}.jsonl")
+
+    def put(self, platform: str, product_code: Any, body: str, kind: str, seq: int = 0,
+            meta: Optional[Dict[str, Any]] = None) -> str:
+        """본문 저장 후 색인에 한 줄 추가 (반환: sha256)"""
+        data = body.encode("utf-8")
+        sha256 = hashlib.sha256(data).hexdigest()
+
+        path = self.object_path(sha256, self.codec)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(_compress(data, self.codec, self.level))
+            os.replace(tmp_path, path)
+
+        entry = {
+            "sha256": sha256,
+            "codec": self.codec,
+            "kind": kind,
+            "seq": seq,
+            "captured_at": datetime.utcnow().isoformat(timespec="seconds"),
+            "meta": meta or {},
+        }
+        index_path = self.index_path(platform, product_code)
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        with open(index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        return sha256
+
+    def read(self, sha256: str, codec: str) -> str:
+        with open(self.object_path(sha256, codec), "rb") as f:
+            return _decompress(f.read(), codec).decode("utf-8")
+
+    def iter_entries(self, platform: Optional[str] = None,
+                     product_code: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """색인 순회 (platform / product_code 로 필터, 같은 상품의 같은 본문은 한 번만)"""
+        index_root = os.path.join(self.root, "index")
+        if not os.path.isdir(index_root):
+            return
+        platforms = [platform] if platform else sorted(os.listdir(index_root))
+        for platform_name in platforms:
+            platform_dir = os.path.join(index_root, platform_name)
+            if not os.path.isdir(platform_dir):
+                continue
+            for filename in sorted(os.listdir(platform_dir)):
+                code = filename[:-len(".jsonl")]
+                if not filename.endswith(".jsonl") or (product_code and code != str(product_code)):
+                    continue
+                seen = set()
+                with open(os.path.join(platform_dir, filename), encoding="utf-8") as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        entry = json.loads(line)
+                        if entry["sha256"] in seen:
+                            continue
+                        seen.add(entry["sha256"])
+                        yield dict(entry, platform=platform_name, product_code=code)
+
+
+class SnapshotRecorder:
+    """크롤링 1회분 기록기 (상품 단위, 페이지 순번 자동 증가)"""
+
+    def __init__(self, archive: SnapshotArchive, platform: str, product_code: Any):
+        self.archive = archive
+        self.platform = platform
+        self.product_code = product_code
+        self.seq = 0
+        self.saved = 0
+
+    def add(self, body: Optional[str], kind: str, **meta: Any) -> None:
+        if not body:
+            return
+        self.seq += 1
+        try:
+            self.archive.put(self.platform, self.product_code, body, kind, self.seq, meta)
+            self.saved += 1
+        except Exception as e:
+            print(f"  [WARNING] 스냅샷 보관 실패: {e}")
+
+
+def get_snapshot_recorder(platform: str, product_code: Any) -> Optional[SnapshotRecorder]:
+    """보관이 꺼져 있으면 None (호출 측은 recorder 가 있을 때만 원본을 넘김)"""
+    if not SNAPSHOT_ARCHIVE_ENABLED:
+        return None
+    return SnapshotRecorder(SnapshotArchive(), platform, product_code)
@@ -0,0 +1,45 @@
+# review/infrastructure/repository/crawl_checkpoint_repository_impl.py
+import json
+from typing import Optional
+
+from config.redis_config import get_redis
+from config.scraper_config import CRAWL_CHECKPOINT_TTL_SECONDS
+from review.application.port.crawl_checkpoint_repository_port import CrawlCheckpointRepositoryPort
+from review.domain.entity.crawl_cursor import CrawlCursor
+
+
+class CrawlCheckpointRepositoryImpl(CrawlCheckpointRepositoryPort):
+    """
+    Redis 기반 크롤링 체크포인트
+    - key: crawl:checkpoint:{source}:{source_product_id}
+    - 배치 저장(커밋) 직후 갱신, 크롤링 성공 시 삭제, TTL 이 지나면 자동 만료
+    """
+
+    def __init__(self, redis_client=None, ttl_seconds: int = CRAWL_CHECKPOINT_TTL_SECONDS):
+        self.redis = redis_client or get_redis()
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _key(source: str, source_product_id: str) -> str:
+        return f"crawl:checkpoint:{source}:{source_product_id}"
+
+    def load(self, source: str, source_product_id: str) -> Optional[CrawlCursor]:
+        try:
+            data = self.redis.get(self._key(source, source_product_id))
+            return CrawlCursor.from_dict(json.loads(data)) if data else None
+        except Exception as e:
+            print(f"[WARNING] 크롤링 체크포인트 조회 실패: {e}")
+            return None
+
+    def save(self, source: str, source_product_id: str, cursor: CrawlCursor) -> None:
+        try:
+            self.redis.set(self._key(source, source_product_id), json.dumps(cursor.to_dict()), ex=self.ttl_seconds)
+        except Exception as e:
+            # 체크포인트 실패는 크롤링을 막지 않음 (재시도 시 처음부터 수집)
+            print(f"[WARNING] 크롤링 체크포인트 저장 실패: {e}")
+
+    def clear(self, source: str, source_product_id: str) -> None:
+        try:
+            self.redis.delete(self._key(source, source_product_id))
+        except Exception as e:
+            print(f"[WARNING] 크롤링 체크포인트 삭제 실패: {e}")
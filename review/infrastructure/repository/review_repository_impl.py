@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select, func
 from review.application.port.review_repository_port import ReviewRepositoryPort
 from review.domain.entity.review import Review, ReviewPlatform
+from review.domain.entity.crawl_watermark import CrawlWatermark
 from review.infrastructure.orm.review_orm import ReviewORM
 
 
@@ -40,13 +41,16 @@ class ReviewRepositoryImpl(ReviewRepositoryPort):
         print(f"  DB 기존: {before_count}개")
 
         # ===== 2. 기존 리뷰 조회 (중복 체크) =====
+        # 중복 키에 review_at 이 포함되므로 배치의 가장 오래된 review_at 이후만 조회
+        oldest_review_at = min(r.review_at for r in reviews)
         existing = self.db.query(
             ReviewORM.reviewer,
             ReviewORM.content,
             ReviewORM.review_at
         ).filter(
             ReviewORM.source == source,
-            ReviewORM.source_product_id == source_product_id
+            ReviewORM.source_product_id == source_product_id,
+            ReviewORM.review_at >= oldest_review_at
         ).all()
 
         existing_set = {
@@ -138,6 +142,25 @@ class ReviewRepositoryImpl(ReviewRepositoryPort):
 
         return domain_reviews
 
+    def get_crawl_watermark(self, source: str, source_product_id: str, recent_limit: int = 200) -> CrawlWatermark:
+        """증분 크롤링 기준점 조회 (최신 review_at + 최근 recent_limit 건 fingerprint)"""
+        recent = self.db.query(
+            ReviewORM.reviewer,
+            ReviewORM.content,
+            ReviewORM.review_at
+        ).filter(
+            ReviewORM.source == source,
+            ReviewORM.source_product_id == source_product_id
+        ).order_by(ReviewORM.review_at.desc()).limit(recent_limit).all()
+
+        if not recent:
+            return CrawlWatermark()
+
+        return CrawlWatermark(
+            newest_review_at=recent[0].review_at,
+            fingerprints={(row.reviewer, row.content, row.review_at) for row in recent},
+        )
+
     # 🔥 Port에 있는 추상 메서드와 100% 동일한 시그니처로 구현
     def delete_by_product(self, source: str, product_id: str) -> int:
         from sqlalchemy import text
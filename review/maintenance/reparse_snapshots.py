@@ -0,0 +1,119 @@
+"""
+Reparse Snapshots
+보관된 원본 스냅샷(snapshot_archive)에서 Review 엔티티를 다시 추출해 저장 → 파서/셀렉터 수정을 재크롤링 없이 반영
+
+사용법:
+    python -m review.maintenance.reparse_snapshots [--platform elevenst|lotteon] [--product CODE]
+                                                   [--archive-dir DIR] [--workers N] [--dry-run] [--replace]
+
+- 스냅샷 단위로 프로세스 풀에서 압축 해제 + 파싱 + 엔티티 변환 (CPU 작업)
+- 결과는 상품별로 모아 ReviewRepositoryImpl.save_all 로 저장 (reviewer/content/review_at 기준 중복 제외)
+- --replace: 저장 전에 상품의 기존 리뷰 삭제 (잘못 파싱된 리뷰 교체 - 스냅샷이 전체 리뷰를 담고 있을 때만 사용)
+"""
+import os
+import sys
+import time
+import argparse
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Tuple
+
+from config.scraper_config import SNAPSHOT_ARCHIVE_DIR
+from review.domain.entity.review import Review, ReviewPlatform
+from review.infrastructure.external.snapshot_archive import SnapshotArchive
+
+
+def parse_snapshot(entry: Dict[str, Any], archive_dir: str) -> Tuple[str, str, List[Review]]:
+    """스냅샷 1개 → (platform, product_code, 리뷰 엔티티) (워커 프로세스에서 실행)"""
+    # 스크래퍼 모듈은 워커에서만 import (메인 프로세스는 DB 저장만)
+    from review.infrastructure.external.elevenSt_scraper import (
+        parse_11st_review_html, parse_11st_review_body, to_11st_review_entities
+    )
+    from review.infrastructure.external.lotteon_scraper import LotteonScraper
+
+    body = SnapshotArchive(archive_dir).read(entry["sha256"], entry["codec"])
+    platform, product_code, kind = entry["platform"], entry["product_code"], entry["kind"]
+
+    if kind == "11st_html":
+        items = parse_11st_review_html(body)
+    elif kind == "11st_body":
+        items = parse_11st_review_body(body, (entry.get("meta") or {}).get("content_type", ""))
+    elif kind == "lotteon_html":
+        return platform, product_code, LotteonScraper().parse_review_entities(body, product_code)
+    else:
+        raise ValueError(f"지원하지 않는 스냅샷 종류: {kind}")
+    return platform, product_code, to_11st_review_entities(items, product_code, ReviewPlatform.ELEVENST)
+
+
+def reparse(archive_dir: str, platform: str = None, product_code: str = None,
+            workers: int = None) -> Dict[Tuple[str, str], List[Review]]:
+    """색인의 스냅샷을 병렬로 재파싱해 상품별 리뷰 목록 반환"""
+    entries = list(SnapshotArchive(archive_dir).iter_entries(platform, product_code))
+    print(f"[REPARSE] 스냅샷 {len(entries)}개 ({archive_dir})")
+
+    results: Dict[Tuple[str, str], List[Review]] = defaultdict(list)
+    failed = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(parse_snapshot, entry, archive_dir) for entry in entries]
+        for future in as_completed(futures):
+            try:
+                source, code, reviews = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"[WARNING] 스냅샷 재파싱 실패: {e}")
+                continue
+            results[(source, code)].extend(reviews)
+
+    if failed:
+        print(f"[REPARSE] 실패 {failed}개")
+    return results
+
+
+def save(results: Dict[Tuple[str, str], List[Review]], replace: bool = False) -> int:
+    """상품별로 저장 (상품마다 커밋)"""
+    from config.database.session import get_db_session
+    from review.infrastructure.repository.review_repository_impl import ReviewRepositoryImpl
+
+    session = get_db_session()
+    repository = ReviewRepositoryImpl(session=session)
+    try:
+        for (source, code), reviews in sorted(results.items()):
+            if not reviews:
+                continue
+            if replace:
+                deleted = repository.delete_by_product(source, code)
+                print(f"[REPARSE] {source}/{code}: 기존 리뷰 {deleted}개 삭제")
+            repository.save_all(reviews, source=source, source_product_id=code)
+            session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+    return 0
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="보관된 리뷰 스냅샷 재파싱/저장")
+    parser.add_argument("--platform", choices=[p.value for p in ReviewPlatform])
+    parser.add_argument("--product", help="상품 코드 (없으면 전체)")
+    parser.add_argument("--archive-dir", default=SNAPSHOT_ARCHIVE_DIR or None, required=not SNAPSHOT_ARCHIVE_DIR,
+                        help="스냅샷 보관소 (기본: SCRAPER_SNAPSHOT_ARCHIVE_DIR)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--dry-run", action="store_true", help="파싱 결과만 출력하고 저장하지 않음")
+    parser.add_argument("--replace", action="store_true", help="저장 전에 상품의 기존 리뷰 삭제")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    results = reparse(args.archive_dir, args.platform, args.product, args.workers)
+    for (source, code), reviews in sorted(results.items()):
+        print(f"[REPARSE] {source}/{code}: 리뷰 {len(reviews)}개")
+    print(f"[REPARSE] 파싱 완료: {time.perf_counter() - started:.1f}s")
+
+    if args.dry_run or not results:
+        return 0
+    return save(results, replace=args.replace)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
+from config.scraper_config import DANAWA_SEARCH_MAX_PAGES
 from samsam_danawa.application.danawa_service import (
     danawa_search_products,
     danawa_get_reviews
@@ -8,8 +9,8 @@ router = APIRouter()
 
 # 🔎 다나와 상품 검색
 @router.get("/search")
-async def search(q: str):
-    items = await danawa_search_products(q)
+async def search(q: str, pages: int = Query(1, ge=1, le=DANAWA_SEARCH_MAX_PAGES)):
+    items = await danawa_search_products(q, pages)
     return {"items": items}
 
 # ⭐ 다나와 상품 리뷰
@@ -1,13 +1,37 @@
 import asyncio
+from config.scraper_config import DANAWA_DRIVER_POOL_SIZE
 from samsam_danawa.infrastructure.danawa_scraper import (
-    search_danawa_products,
-    get_danawa_reviews
+    asearch_danawa_products,
+    close_async_http_client,
+    get_danawa_reviews,
+    get_driver_pool
 )
+from samsam_danawa.infrastructure.search_cache import get_search_cache
 
-async def danawa_search_products(query: str):
-    results = await asyncio.to_thread(search_danawa_products, query)
-    return [p.to_dict() for p in results]
+# 리뷰 요청 동시 실행 상한 = 드라이버 수 (대기 요청이 to_thread 워커 스레드를 붙잡고 있지 않도록)
+_review_slots = asyncio.Semaphore(DANAWA_DRIVER_POOL_SIZE)
+
+
+async def start_danawa_drivers():
+    """앱 시작 시 chromedriver 확인 + 드라이버 미리 기동"""
+    await asyncio.to_thread(get_driver_pool().start)
+
+
+async def stop_danawa_drivers():
+    await asyncio.to_thread(get_driver_pool().shutdown)
+    await close_async_http_client()
+
+
+async def _fetch_search(query: str, pages: int):
+    products = await asearch_danawa_products(query, pages)
+    return None if products is None else [p.to_dict() for p in products]
+
+
+async def danawa_search_products(query: str, pages: int = 1):
+    # 같은 검색어는 캐시에서 (오래된 캐시는 먼저 반환하고 백그라운드에서 갱신)
+    return await get_search_cache().get_or_fetch(query, pages, _fetch_search)
 
 async def danawa_get_reviews(product_id: str):
-    reviews = await asyncio.to_thread(get_danawa_reviews, product_id)
+    async with _review_slots:
+        reviews = await asyncio.to_thread(get_danawa_reviews, product_id)
     return [r.dict() for r in reviews]
@@ -1,15 +1,95 @@
 from bs4 import BeautifulSoup
 import requests
+import os
+import asyncio
+from typing import List, Optional
+import httpx
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+import json
 import time
 
+from config.scraper_config import (
+    REQUEST_FILTER_ENABLED, BLOCKED_RESOURCE_TYPES, BLOCKED_DOMAINS,
+    HTTP_TIMEOUT_SECONDS, HTTP_MAX_CONNECTIONS, HTTP_USER_AGENT,
+    DANAWA_SEARCH_URL, DANAWA_SEARCH_PAGE_PARAM
+)
 from samsam_danawa.domain.product import DanawaProduct
 from samsam_danawa.domain.review import DanawaReview
+from samsam_danawa.infrastructure.driver_pool import WebDriverPool, resolve_driver_path
+
+# Selenium 에는 page.route 가 없으므로 CDP Network.setBlockedURLs 로 같은 차단 정책 적용
+RESOURCE_TYPE_URL_PATTERNS = {
+    "image": ["*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.svg*", "*.ico*"],
+    "font": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*"],
+    "media": ["*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*"],
+}
+# 차단 요청 절감 바이트 추정치 (CDP 리소스 타입 기준)
+ESTIMATED_BYTES_BY_TYPE = {"Image": 40_000, "Media": 500_000, "Font": 60_000, "Script": 80_000}
+
+
+def _blocked_url_patterns():
+    patterns = []
+    for resource_type in BLOCKED_RESOURCE_TYPES:
+        patterns.extend(RESOURCE_TYPE_URL_PATTERNS.get(resource_type, []))
+    patterns.extend(f"*{domain}*" for domain in BLOCKED_DOMAINS)
+    return patterns
+
+
+def _apply_request_filter(driver):
+    if not REQUEST_FILTER_ENABLED:
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _blocked_url_patterns()})
+
+
+def _report_blocked_requests(driver):
+    """performance 로그에서 차단된 요청 수와 절감 바이트(추정)를 집계"""
+    if not REQUEST_FILTER_ENABLED:
+        return
+    try:
+        blocked, saved = 0, 0
+        for entry in driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            if message.get("method") == "Network.loadingFailed" and message["params"].get("blockedReason"):
+                blocked += 1
+                saved += ESTIMATED_BYTES_BY_TYPE.get(message["params"].get("type"), 10_000)
+        print(f"[FILTER] 다나와 차단 {blocked}건 / 절감 추정 {saved / 1024:.0f}KB")
+    except Exception as e:
+        print(f"[FILTER] 차단 통계 수집 실패: {e}")
+
+
+def _create_driver():
+    """풀에 넣을 Chrome 드라이버 (요청 필터는 세션 단위로 한 번만 적용)"""
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--window-size=1920,1080")
+    if REQUEST_FILTER_ENABLED:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        if "image" in BLOCKED_RESOURCE_TYPES:
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+    driver = webdriver.Chrome(service=Service(resolve_driver_path()), options=options)
+    _apply_request_filter(driver)
+    return driver
+
+
+# 프로세스 단위 싱글턴 (uvicorn 워커 프로세스마다 별도 풀)
+_driver_pool: Optional[WebDriverPool] = None
+_driver_pool_pid: Optional[int] = None
+
+
+def get_driver_pool() -> WebDriverPool:
+    global _driver_pool, _driver_pool_pid
+    if _driver_pool is None or _driver_pool_pid != os.getpid():
+        _driver_pool = WebDriverPool(_create_driver)
+        _driver_pool_pid = os.getpid()
+    return _driver_pool
 
 # 🔎 다나와 상품 검색 (수정된 버전)
 def get_image_url(img_el):
@@ -33,11 +113,87 @@ def get_image_url(img_el):
 def search_danawa_products(query: str):
     url = f"https://search.danawa.com/dsearch.php?query={query}"
     headers = {"User-Agent": "Mozilla/5.0"}
-    res = requests.get(url, headers=headers)
+    res = requests.get(url, headers=headers, timeout=HTTP_TIMEOUT_SECONDS)
     if res.status_code != 200:
         return []
+    return parse_danawa_search(res.text)
+
+
+# 검색용 keep-alive 클라이언트 (API 프로세스의 이벤트 루프에서 사용)
+_async_client: Optional[httpx.AsyncClient] = None
+_async_client_pid: Optional[int] = None
+
 
-    soup = BeautifulSoup(res.text, "html.parser")
+def get_async_http_client() -> httpx.AsyncClient:
+    global _async_client, _async_client_pid
+    if _async_client is None or _async_client_pid != os.getpid():
+        _async_client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+            ),
+            headers={
+                "User-Agent": HTTP_USER_AGENT,
+                "Referer": "https://www.danawa.com/",
+                "Accept-Language": "ko-KR,ko;q=0.9",
+            },
+            follow_redirects=True,
+        )
+        _async_client_pid = os.getpid()
+    return _async_client
+
+
+async def close_async_http_client():
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+
+
+async def _fetch_search_page(client: httpx.AsyncClient, query: str, page: int) -> Optional[str]:
+    """검색 결과 한 페이지 HTML (실패 시 None)"""
+    params = {"query": query}
+    if page > 1:
+        params[DANAWA_SEARCH_PAGE_PARAM] = page
+    try:
+        res = await client.get(DANAWA_SEARCH_URL, params=params)
+    except httpx.HTTPError as e:
+        print(f"[WARNING] 다나와 검색 {page}페이지 요청 실패: {str(e)[:80]}")
+        return None
+    if res.status_code != 200:
+        print(f"[WARNING] 다나와 검색 {page}페이지 응답 {res.status_code}")
+        return None
+    return res.text
+
+
+async def asearch_danawa_products(query: str, pages: int = 1) -> Optional[List[DanawaProduct]]:
+    """
+    검색 결과 1~pages 페이지를 동시에 받아 순서대로 합침 (상품 ID 기준 중복 제외)
+    첫 페이지를 받지 못하면 None (호출 측은 캐시하지 않음)
+    """
+    client = get_async_http_client()
+    htmls = await asyncio.gather(*(_fetch_search_page(client, query, page) for page in range(1, pages + 1)))
+    if htmls[0] is None:
+        return None
+
+    products: List[DanawaProduct] = []
+    seen = set()
+    for html in htmls:
+        if html is None:
+            continue
+        # 파싱은 CPU 작업 → 이벤트 루프를 막지 않도록 스레드에서
+        for product in await asyncio.to_thread(parse_danawa_search, html):
+            if product.product_id in seen:
+                continue
+            seen.add(product.product_id)
+            products.append(product)
+    return products
+
+
+def parse_danawa_search(html: str) -> List[DanawaProduct]:
+    """검색 결과 HTML → DanawaProduct 목록"""
+    soup = BeautifulSoup(html, "html.parser")
     products = []
 
     items = soup.select("div.prod_main_info")
@@ -74,24 +230,19 @@ def search_danawa_products(query: str):
 def get_danawa_reviews(product_id: str):
     url = f"https://prod.danawa.com/info/?pcode={product_id}"
 
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless=new")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--window-size=1920,1080")
-
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    driver.get(url)
+    # 풀에서 드라이버를 빌려 사용 (모두 사용 중이면 반납될 때까지 대기)
+    with get_driver_pool().driver() as driver:
+        driver.get(url)
 
-    try:
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "#danawa-prodBlog-productOpinion-list"))
-        )
-    except Exception:
-        time.sleep(2)
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "#danawa-prodBlog-productOpinion-list"))
+            )
+        except Exception:
+            time.sleep(2)
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    driver.quit()
+        soup = BeautifulSoup(driver.page_source, "html.parser")
+        _report_blocked_requests(driver)
 
     reviews = []
     review_items = soup.select("li.cmt_item")
@@ -0,0 +1,159 @@
+"""
+WebDriver Pool
+API 프로세스 단위로 Selenium Chrome 드라이버를 미리 띄워 재사용 (요청마다 드라이버 설치/브라우저 기동 없음)
+- chromedriver 경로는 프로세스당 한 번만 확인 (DANAWA_CHROMEDRIVER_PATH 또는 webdriver_manager)
+- 동시에 빌려줄 수 있는 드라이버 수를 세마포어로 제한 → 동시 요청이 많아도 브라우저 수는 size 이하
+- 반납 시 쿠키 삭제 + about:blank 로 초기화, N회 사용했거나 오류가 난 드라이버는 종료 후 새로 생성
+"""
+import time
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from config.scraper_config import (
+    DANAWA_CHROMEDRIVER_PATH, DANAWA_DRIVER_POOL_SIZE, DANAWA_DRIVER_PREWARM, DANAWA_DRIVER_MAX_USES,
+    DANAWA_DRIVER_ACQUIRE_TIMEOUT_SECONDS
+)
+
+_driver_path: Optional[str] = None
+_driver_path_lock = threading.Lock()
+
+
+def resolve_driver_path() -> str:
+    """chromedriver 경로 (첫 호출에서만 설치/확인, 이후 캐시)"""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            if DANAWA_CHROMEDRIVER_PATH:
+                _driver_path = DANAWA_CHROMEDRIVER_PATH
+            else:
+                from webdriver_manager.chrome import ChromeDriverManager
+                _driver_path = ChromeDriverManager().install()
+            print(f"[POOL] chromedriver: {_driver_path}")
+        return _driver_path
+
+
+class WebDriverPool:
+    """
+    Selenium 드라이버 풀 (스레드 안전 - asyncio.to_thread 워커들이 공유)
+    factory: 새 드라이버 생성 함수 (옵션/요청 필터 적용까지)
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        size: int = DANAWA_DRIVER_POOL_SIZE,
+        max_uses: int = DANAWA_DRIVER_MAX_USES,
+        acquire_timeout: float = DANAWA_DRIVER_ACQUIRE_TIMEOUT_SECONDS,
+    ):
+        self.factory = factory
+        self.size = max(size, 1)
+        self.max_uses = max_uses
+        self.acquire_timeout = acquire_timeout
+
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self._idle: List[Tuple[Any, int]] = []  # (driver, 사용 횟수)
+        self._in_use = 0
+        self._closed = False
+
+        self.stats: Dict[str, Any] = {
+            "created": 0,       # 새로 띄운 드라이버
+            "reused": 0,        # 대기 중인 드라이버 재사용
+            "recycled": 0,      # 사용 횟수 상한으로 종료
+            "discarded": 0,     # 오류로 종료
+            "peak_in_use": 0,
+            "wait_seconds_total": 0.0,
+        }
+
+    def start(self, prewarm: int = DANAWA_DRIVER_PREWARM) -> "WebDriverPool":
+        """드라이버 경로 확인 + prewarm 개 미리 기동 (앱 시작 시 호출)"""
+        resolve_driver_path()
+        for _ in range(min(max(prewarm, 0), self.size) - len(self._idle)):
+            driver = self._create()
+            with self._lock:
+                self._idle.append((driver, 0))
+        print(f"[POOL] WebDriver 풀 준비 (대기 {len(self._idle)}개 / 상한 {self.size}개)")
+        return self
+
+    @contextmanager
+    def driver(self) -> Iterator[Any]:
+        """드라이버를 빌려주고 반납 (모두 사용 중이면 acquire_timeout 까지 대기)"""
+        started = time.perf_counter()
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError(f"브라우저가 모두 사용 중입니다 ({self.size}개, {self.acquire_timeout:.0f}s 대기)")
+        self.stats["wait_seconds_total"] += time.perf_counter() - started
+        try:
+            driver, uses = self._checkout()
+            healthy = False
+            try:
+                yield driver
+                healthy = True
+            finally:
+                self._checkin(driver, uses + 1, healthy)
+        finally:
+            self._slots.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats["idle"] = len(self._idle)
+        stats["in_use"] = self._in_use
+        return stats
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for driver, _ in idle:
+            self._quit(driver)
+
+    def _create(self) -> Any:
+        driver = self.factory()
+        self.stats["created"] += 1
+        return driver
+
+    def _checkout(self) -> Tuple[Any, int]:
+        with self._lock:
+            self._in_use += 1
+            self.stats["peak_in_use"] = max(self.stats["peak_in_use"], self._in_use)
+            if self._idle:
+                self.stats["reused"] += 1
+                return self._idle.pop()
+        try:
+            return self._create(), 0
+        except Exception:
+            with self._lock:
+                self._in_use -= 1
+            raise
+
+    def _checkin(self, driver: Any, uses: int, healthy: bool) -> None:
+        with self._lock:
+            self._in_use -= 1
+        if not healthy:
+            self.stats["discarded"] += 1
+            self._quit(driver)
+            return
+        if self.max_uses and uses >= self.max_uses:
+            self.stats["recycled"] += 1
+            self._quit(driver)
+            return
+        try:
+            # 다음 요청이 이전 상품의 쿠키/페이지를 물려받지 않도록
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except Exception:
+            self.stats["discarded"] += 1
+            self._quit(driver)
+            return
+        with self._lock:
+            if not self._closed:
+                self._idle.append((driver, uses))
+                return
+        self._quit(driver)
+
+    @staticmethod
+    def _quit(driver: Any) -> None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
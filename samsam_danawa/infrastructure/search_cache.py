@@ -0,0 +1,128 @@
+"""
+Danawa Search Cache
+다나와 검색 결과(상품 dict 목록)를 정규화한 검색어 + 페이지 수 기준으로 Redis 에 보관 (stale-while-revalidate)
+- fresh (DANAWA_SEARCH_CACHE_TTL_SECONDS 이내): 캐시 그대로 반환
+- stale (이후 DANAWA_SEARCH_CACHE_STALE_SECONDS 동안): 캐시를 바로 반환하고 백그라운드에서 갱신
+  갱신은 Redis SET NX 잠금으로 전체 API 프로세스 중 하나만 수행
+- 없거나 stale 기간도 지났으면 직접 조회 후 저장 (조회 실패 결과는 저장하지 않음)
+- Redis 오류는 경고 후 캐시 없이 직접 조회
+"""
+import os
+import json
+import time
+import asyncio
+import hashlib
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from config.scraper_config import (
+    DANAWA_SEARCH_CACHE_ENABLED, DANAWA_SEARCH_CACHE_TTL_SECONDS, DANAWA_SEARCH_CACHE_STALE_SECONDS
+)
+
+KEY_PREFIX = "danawa:search"
+REFRESH_LOCK_SECONDS = 30
+
+SearchFetcher = Callable[[str, int], Awaitable[Optional[List[Dict[str, Any]]]]]
+
+
+def normalize_query(query: str) -> str:
+    """공백 정리 + 소문자 ("  아이폰   15 Pro" → "아이폰 15 pro")"""
+    return " ".join(query.split()).lower()
+
+
+def cache_key(query: str, pages: int) -> str:
+    digest = hashlib.sha1(normalize_query(query).encode("utf-8")).hexdigest()
+    return f"{KEY_PREFIX}:{pages}:{digest}"
+
+
+class DanawaSearchCache:
+    def __init__(self, ttl_seconds: int = DANAWA_SEARCH_CACHE_TTL_SECONDS,
+                 stale_seconds: int = DANAWA_SEARCH_CACHE_STALE_SECONDS,
+                 enabled: bool = DANAWA_SEARCH_CACHE_ENABLED):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.enabled = enabled
+        self._refreshing: Set[asyncio.Task] = set()  # 백그라운드 갱신 태스크 참조 유지
+        self.stats: Dict[str, int] = {"hits": 0, "stale": 0, "misses": 0, "refreshes": 0, "errors": 0}
+
+    async def get_or_fetch(self, query: str, pages: int, fetch: SearchFetcher) -> List[Dict[str, Any]]:
+        """캐시 조회 → 없으면 fetch(정규화한 검색어, pages) 결과 저장 후 반환"""
+        query = normalize_query(query)
+        if not self.enabled:
+            return (await fetch(query, pages)) or []
+
+        key = cache_key(query, pages)
+        entry = await self._load(key)
+        if entry is not None:
+            if time.time() - entry["fetched_at"] < self.ttl_seconds:
+                self.stats["hits"] += 1
+            else:
+                self.stats["stale"] += 1
+                self._schedule_refresh(key, query, pages, fetch)
+            return entry["items"]
+
+        self.stats["misses"] += 1
+        return (await self._refresh(key, query, pages, fetch)) or []
+
+    def get_stats(self) -> Dict[str, int]:
+        stats = dict(self.stats)
+        stats["refreshing"] = len(self._refreshing)
+        return stats
+
+    async def _refresh(self, key: str, query: str, pages: int, fetch: SearchFetcher) -> Optional[List[Dict[str, Any]]]:
+        items = await fetch(query, pages)
+        if items is not None:
+            await self._store(key, items)
+        return items
+
+    def _schedule_refresh(self, key: str, query: str, pages: int, fetch: SearchFetcher) -> None:
+        task = asyncio.create_task(self._background_refresh(key, query, pages, fetch))
+        self._refreshing.add(task)
+        task.add_done_callback(self._refreshing.discard)
+
+    async def _background_refresh(self, key: str, query: str, pages: int, fetch: SearchFetcher) -> None:
+        from config.redis_config import get_async_redis
+        lock_key = f"{key}:refresh"
+        try:
+            redis_client = get_async_redis()
+            if not await redis_client.set(lock_key, os.getpid(), nx=True, ex=REFRESH_LOCK_SECONDS):
+                return  # 다른 요청/프로세스가 갱신 중
+            self.stats["refreshes"] += 1
+            try:
+                await self._refresh(key, query, pages, fetch)
+            finally:
+                await redis_client.delete(lock_key)
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"[WARNING] 다나와 검색 캐시 갱신 실패: {e}")
+
+    async def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            from config.redis_config import get_async_redis
+            raw = await get_async_redis().get(key)
+            return json.loads(raw) if raw else None
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"[WARNING] 다나와 검색 캐시 조회 실패: {e}")
+            return None
+
+    async def _store(self, key: str, items: List[Dict[str, Any]]) -> None:
+        try:
+            from config.redis_config import get_async_redis
+            entry = json.dumps({"fetched_at": time.time(), "items": items}, ensure_ascii=False)
+            await get_async_redis().set(key, entry, ex=self.ttl_seconds + self.stale_seconds)
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"[WARNING] 다나와 검색 캐시 저장 실패: {e}")
+
+
+# 프로세스 단위 싱글턴
+_cache: Optional[DanawaSearchCache] = None
+_cache_pid: Optional[int] = None
+
+
+def get_search_cache() -> DanawaSearchCache:
+    global _cache, _cache_pid
+    if _cache is None or _cache_pid != os.getpid():
+        _cache = DanawaSearchCache()
+        _cache_pid = os.getpid()
+    return _cache